@@ -2,14 +2,11 @@
 """
 FastMCP Cloud-compatible entrypoint for Panda MCP server
 This file uses absolute imports and is suitable for FastMCP Cloud deployment
-"""
-
-import sys
-from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+`fastmcp run` / `fastmcp inspect` put this file's directory on sys.path before
+importing it, and `pip install -e .` makes the `src` package importable
+everywhere else, so no path manipulation is needed here.
+"""
 
 # Import the FastMCP instance (mcp) not the Starlette app
 from src.app import mcp
@@ -5,24 +5,40 @@ Provides tools and resources for cryptocurrency exchange data
 """
 
 from fastmcp import FastMCP
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, FileResponse, Response
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
+from pydantic import validate_call
 # from fastmcp.server.auth.providers.auth0 import Auth0Provider
 
-from typing import Literal, Optional, List
-import json
-import httpx
+from contextlib import asynccontextmanager
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import re
+from types import MappingProxyType
+from typing import Callable, Literal, Optional, List, Tuple
+from .core.base_exchange import group_by_symbol
 from .core.exchange_factory import ExchangeFactory
-from .utils.export import DataExporter
+from .core.http_client import close_http_client, DEFAULT_TIMEOUT, RETRY_ATTEMPTS, RETRY_MAX_WAIT
+from .utils.export import DataExporter, EXPORTS_DIR
+from .utils.cache import cached, file_cached, get_cache, get_or_fetch
+from .utils.errors import tool_errors
+from .utils.serialization import dumps, dumps_bytes
+from .utils.payloads import offload_large_field, get_payload_path, OFFLOAD_ENABLED, PAYLOAD_ROUTE, PAYLOAD_TTL
 from .utils.indicators import TechnicalIndicators
-from .metrics.api_client import PandaMetricsClient
+from .utils.series import to_columns
+from .metrics.api_client import get_metrics_client, close_metrics_clients
 from .metrics.divine_dip import DivineDipMetric
 from .metrics.orderbook import OrderbookMetric
 from .metrics.jlabs_analytics import JLabsAnalytics
 from .metrics.jlabs_models import JLabsModels
 from .metrics.orderflow import OrderflowMetric
 
+logger = logging.getLogger(__name__)
+
 
 # Initialize Auth0Provider
 # Environment variables provide default values, so we don't need to pass parameters:
@@ -44,33 +60,92 @@ mcp = FastMCP(
         "orderbook metrics (bid/ask ratios, CVD), and orderflow metrics (trade volume, deltas). "
         "Supports Binance, Bybit, and Hyperliquid exchanges (spot and futures). "
         "Use the tools to query trading pairs, market data, or access advanced panda liquidity, depth, and flow metrics."
-    )
+    ),
+    tool_serializer=dumps
 )
 
 # Configure CORS for browser-based clients
-middleware = [
+CORS_ALLOW_ORIGINS = ("*",)  # Allow all origins; use specific origins for security
+# MCP streamable HTTP uses POST for messages, GET for the event stream and
+# DELETE to end a session
+CORS_ALLOW_METHODS = ("GET", "POST", "DELETE", "OPTIONS")
+CORS_ALLOW_HEADERS = (
+    "mcp-protocol-version",
+    "mcp-session-id",
+    "Authorization",
+    "Content-Type",
+)
+CORS_EXPOSE_HEADERS = ("mcp-session-id",)
+CORS_MAX_AGE = 86400  # Let browsers cache preflight results for 24h
+
+# Built once at import and installed on the Starlette app via mcp.http_app() below
+middleware = (
     Middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Allow all origins; use specific origins for security
-        allow_methods=["GET"],
-        allow_headers=[
-            "mcp-protocol-version",
-            "mcp-session-id",
-            "Authorization",
-            "Content-Type",
-        ],
-        expose_headers=["mcp-session-id"],
-    )
-]
+        allow_origins=CORS_ALLOW_ORIGINS,
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
+        expose_headers=CORS_EXPOSE_HEADERS,
+        max_age=CORS_MAX_AGE,
+    ),
+)
+
+
+# Response cache lifetimes (seconds) for slowly changing data
+TRADING_PAIRS_TTL = 60
+FUNDING_INFO_TTL = 1800
+OPEN_INTEREST_HISTORY_TTL = 300
+
+# Export tool data caches: funding settles every 8h, listings change rarely
+EXPORT_FUNDING_TTL = 3600
+EXPORT_PAIRS_TTL = 3600
+EXPORT_CURRENT_OI_TTL = 30
+_funding_cache = get_cache("export_funding_rate", ttl=EXPORT_FUNDING_TTL)
+_pairs_cache = get_cache("export_trading_pairs", ttl=EXPORT_PAIRS_TTL)
+_open_interest_cache = get_cache("export_open_interest", ttl=EXPORT_CURRENT_OI_TTL)
+
+# Upper bound (seconds) for one market's pair fetch: every attempt of the
+# retry policy at the client timeout, plus the longest backoff between attempts
+MARKET_FETCH_TIMEOUT = RETRY_ATTEMPTS * DEFAULT_TIMEOUT + (RETRY_ATTEMPTS - 1) * RETRY_MAX_WAIT
 
+# Maximum concurrent symbol fetches in batch exports, kept well below exchange rate limits
+BATCH_FETCH_CONCURRENCY = 8
+
+# Metric responses are cached on disk for one bar of their timeframe
+# (e.g., '4H' -> 4h), or METRIC_CACHE_TTL when the timeframe is unknown
+METRIC_CACHE_TTL = 300
+TIMEFRAME_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+_TIMEFRAME = re.compile(r"^(\d+)([mhHdDwW])$")
+
+
+def _metric_cache_ttl(arguments: dict) -> float:
+    """Disk cache TTL for a metric tool call, from its 'timeframe' argument"""
+    match = _TIMEFRAME.match(str(arguments.get("timeframe", "")))
+    if match is None:
+        ttl = METRIC_CACHE_TTL
+    else:
+        ttl = int(match.group(1)) * TIMEFRAME_UNIT_SECONDS[match.group(2).lower()]
+    # Offloaded payload URLs must not outlive the payload they point to
+    return min(ttl, PAYLOAD_TTL) if OFFLOAD_ENABLED else ttl
 
 
 # ============================================================================
 # EXCHANGE DATA TOOLS
 # ============================================================================
 
+# Shared part of the responses for capabilities an exchange lacks
+_NOT_SUPPORTED = MappingProxyType({"error": "Feature not supported", "error_type": "NotImplementedError"})
+
+
+def _not_supported(message: str, **context) -> dict:
+    """Build an unsupported-feature error response"""
+    return {**_NOT_SUPPORTED, "message": message, **context}
+
+
 @mcp.tool
-def get_trading_pairs(
+@cached(ttl=TRADING_PAIRS_TTL)
+@tool_errors("exchange", "market")
+async def get_trading_pairs(
     exchange: str,
     market: str,
     status: Literal["active", "inactive", "all"] = "active"
@@ -98,54 +173,44 @@ def get_trading_pairs(
             ]
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Fetch all pairs for the market
-            result = exchange_instance.fetch_all_pairs(market)
-
-            # Filter based on status
-            if status == "active":
-                pairs = result["active"]
-            elif status == "inactive":
-                pairs = result["inactive"]
-            else:  # all
-                pairs = result["active"] + result["inactive"]
-
-            return {
-                "exchange": exchange,
-                "market": market,
-                "status_filter": status,
-                "count": len(pairs),
-                "pairs": pairs
-            }
-    except ValueError as e:
-        # User input error (invalid exchange or market)
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "market": market
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "market": market
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "market": market
-        }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Fetch all pairs for the market
+    result = await exchange_instance.fetch_all_pairs(market)
+
+    # Filter based on status
+    if status == "active":
+        pairs = result["active"]
+    elif status == "inactive":
+        pairs = result["inactive"]
+    else:  # all
+        pairs = result["active"] + result["inactive"]
+
+    return {
+        "exchange": exchange,
+        "market": market,
+        "status_filter": status,
+        "count": len(pairs),
+        "pairs": pairs
+    }
+
+
+# The exchange registry is fixed at import, so its description is built once
+EXCHANGE_INFO = {
+    "count": len(ExchangeFactory.list_exchanges()),
+    "exchanges": [
+        {
+            "name": info["name"],
+            "markets": info["supported_markets"],
+            "capabilities": info["capabilities"],
+            "description": info["description"].strip()
+        }
+        for info in map(ExchangeFactory.get_exchange_info, ExchangeFactory.list_exchanges())
+    ]
+}
+
+
+# Body of the exchange://list resource, serialized once
+EXCHANGES_JSON = dumps_bytes(EXCHANGE_INFO, pretty=True).decode()
 
 
 @mcp.tool
@@ -163,38 +228,47 @@ def list_supported_exchanges() -> dict:
                 {
                     "name": "binance",
                     "markets": ["spot", "futures"],
+                    "capabilities": ["funding_history", "funding_info", "klines", ...],
                     "description": "Binance exchange implementation..."
                 }
             ]
         }
     """
-    try:
-        exchanges = ExchangeFactory.list_exchanges()
-        exchange_info = []
-
-        for exchange_name in exchanges:
-            info = ExchangeFactory.get_exchange_info(exchange_name)
-            exchange_info.append({
-                "name": info["name"],
-                "markets": info["supported_markets"],
-                "description": info["description"].strip()
-            })
+    return EXCHANGE_INFO
 
-        return {
-            "count": len(exchanges),
-            "exchanges": exchange_info
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Failed to list exchanges",
-            "error_type": type(e).__name__,
-            "message": str(e)
-        }
+
+def _split_sorted(first: List[str], second: List[str]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split two sorted, duplicate-free lists in a single merge pass
+
+    Args:
+        first: Sorted values from the first market
+        second: Sorted values from the second market
+
+    Returns:
+        Tuple of (only_in_first, only_in_second, in_both), each sorted
+    """
+    only_in_first, only_in_second, in_both = [], [], []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        if first[i] < second[j]:
+            only_in_first.append(first[i])
+            i += 1
+        elif first[i] > second[j]:
+            only_in_second.append(second[j])
+            j += 1
+        else:
+            in_both.append(first[i])
+            i += 1
+            j += 1
+    only_in_first.extend(first[i:])
+    only_in_second.extend(second[j:])
+    return only_in_first, only_in_second, in_both
 
 
 @mcp.tool
-def compare_exchange_pairs(
+@tool_errors("exchange", "markets")
+async def compare_exchange_pairs(
     exchange: str,
     markets: list[str]
 ) -> dict:
@@ -218,79 +292,60 @@ def compare_exchange_pairs(
             "both_markets": ["BTCUSDT", "ETHUSDT"]
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Fetch pairs from each market
-            market_pairs = {}
-            for market in markets:
-                result = exchange_instance.fetch_all_pairs(market)
-                # Get active pairs only
-                market_pairs[market] = {
-                    pair["pair"] for pair in result["active"]
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Fetch pairs from all markets concurrently; a failed or timed-out
+    # market cancels the remaining fetches
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(asyncio.wait_for(
+                exchange_instance.fetch_all_pairs(market),
+                timeout=MARKET_FETCH_TIMEOUT
+            ))
+            for market in markets
+        ]
+    # Get active pairs only
+    market_pairs = {
+        market: {pair["pair"] for pair in task.result()["active"]}
+        for market, task in zip(markets, tasks)
+    }
+
+    # Compare pairs across markets
+    if len(markets) == 2:
+        market1, market2 = markets
+        only_in_first, only_in_second, in_both = _split_sorted(
+            sorted(market_pairs[market1]),
+            sorted(market_pairs[market2])
+        )
 
-            # Compare pairs across markets
-            if len(markets) == 2:
-                market1, market2 = markets
-                only_in_first = market_pairs[market1] - market_pairs[market2]
-                only_in_second = market_pairs[market2] - market_pairs[market1]
-                in_both = market_pairs[market1] & market_pairs[market2]
-
-                return {
-                    "exchange": exchange,
-                    "markets_compared": markets,
-                    f"{market1}_only": sorted(list(only_in_first)),
-                    f"{market2}_only": sorted(list(only_in_second)),
-                    "both_markets": sorted(list(in_both)),
-                    "counts": {
-                        f"{market1}_only": len(only_in_first),
-                        f"{market2}_only": len(only_in_second),
-                        "both_markets": len(in_both)
-                    }
-                }
-            else:
-                # For multiple markets, just return counts
-                return {
-                    "exchange": exchange,
-                    "markets_compared": markets,
-                    "pair_counts": {
-                        market: len(pairs) for market, pairs in market_pairs.items()
-                    }
-                }
-    except ValueError as e:
-        # User input error (invalid exchange or market)
         return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
             "exchange": exchange,
-            "markets": markets
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "markets": markets
+            "markets_compared": markets,
+            f"{market1}_only": only_in_first,
+            f"{market2}_only": only_in_second,
+            "both_markets": in_both,
+            "counts": {
+                f"{market1}_only": len(only_in_first),
+                f"{market2}_only": len(only_in_second),
+                "both_markets": len(in_both)
+            }
         }
-    except Exception as e:
-        # Unexpected error
+    else:
+        # For multiple markets, just return counts
         return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
             "exchange": exchange,
-            "markets": markets
+            "markets_compared": markets,
+            "pair_counts": {
+                market: len(pairs) for market, pairs in market_pairs.items()
+            }
         }
 
 
 @mcp.tool
-def get_market_data(
+@tool_errors("exchange", "symbol")
+async def get_market_data(
     exchange: str,
-    symbol: Optional[str] = None
+    symbol: Optional[str] = None,
+    verbose: bool = False
 ) -> dict:
     """
     Fetch live market data including price, volume, funding rate, and open interest.
@@ -298,6 +353,7 @@ def get_market_data(
     Args:
         exchange: Exchange name (currently only 'hyperliquid' supported)
         symbol: Optional symbol filter (e.g., 'BTC', 'ETH'). If None, returns all markets.
+        verbose: Echo the request parameters in the response (default: False)
 
     Returns:
         Dictionary containing market data
@@ -305,78 +361,56 @@ def get_market_data(
     Example:
         get_market_data("hyperliquid", "BTC")
         Returns: {
-            "exchange": "hyperliquid",
-            "symbol_filter": "BTC",
             "count": 1,
             "markets": [
                 {
                     "symbol": "BTC",
-                    "mark_price": "101540.0",
-                    "oracle_price": "101566.0",
-                    "prev_day_price": "102983.0",
+                    "mark_price": 101540.0,
+                    "oracle_price": 101566.0,
+                    "prev_day_price": 102983.0,
                     "price_change_24h": -1.40,
-                    "volume_24h_base": "33373.34864",
-                    "volume_24h_usd": "3436572687.72",
-                    "funding_rate": "0.0000125",
-                    "open_interest": "28169.72524",
-                    "premium": "-0.0002953744",
+                    "volume_24h_base": 33373.34864,
+                    "volume_24h_usd": 3436572687.72,
+                    "funding_rate": 0.0000125,
+                    "open_interest": 28169.72524,
+                    "premium": -0.0002953744,
                     "max_leverage": 40
                 }
             ]
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Check if exchange supports market data
-            if not hasattr(exchange_instance, 'fetch_market_data'):
-                return {
-                    "error": "Feature not supported",
-                    "error_type": "NotImplementedError",
-                    "message": f"Exchange '{exchange}' does not support live market data fetching",
-                    "exchange": exchange
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Check if exchange supports market data
+    if "market_data" not in exchange_instance.CAPABILITIES:
+        return _not_supported(
+            f"Exchange '{exchange}' does not support live market data fetching",
+            exchange=exchange
+        )
 
-            # Fetch market data
-            markets = exchange_instance.fetch_market_data(symbol)
+    # Fetch market data
+    markets = await exchange_instance.fetch_market_data(symbol)
+
+    result = {"exchange": exchange, "symbol_filter": symbol} if verbose else {}
+    result["count"] = len(markets)
+    result["markets"] = markets
+    return result
 
-            return {
-                "exchange": exchange,
-                "symbol_filter": symbol,
-                "count": len(markets),
-                "markets": markets
-            }
-    except ValueError as e:
-        # User input error (invalid exchange, etc.)
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+
+async def _fetch_klines(exchange_instance, exchange: str, paginate: bool, **params) -> List[dict]:
+    """Fetch klines for the kline tools, splitting the time range into pages when paginate is set"""
+    if not paginate:
+        return await exchange_instance.fetch_klines(**params)
+    if "klines_paged" not in exchange_instance.CAPABILITIES:
+        raise NotImplementedError(f"Exchange '{exchange}' does not support paginated klines")
+    if params.get("start_time") is None or params.get("end_time") is None:
+        raise ValueError("paginate requires both start_time and end_time")
+    params.pop("limit", None)
+    return await exchange_instance.fetch_klines_paged(**params)
 
 
 @mcp.tool
-def get_klines(
+@tool_errors("exchange", "symbol", "interval", "market")
+async def get_klines(
     exchange: str,
     symbol: str,
     interval: str,
@@ -384,7 +418,9 @@ def get_klines(
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
     limit: int = 500,
-    timezone: str = "0"
+    timezone: str = "0",
+    paginate: bool = False,
+    verbose: bool = False
 ) -> dict:
     """
     Fetch kline/candlestick data for a trading pair.
@@ -398,110 +434,76 @@ def get_klines(
         end_time: End time in milliseconds (optional)
         limit: Number of klines to fetch (default: 500, max: 1000 for spot, 1500 for futures)
         timezone: Timezone offset for spot market (default: '0' for UTC)
+        paginate: Fetch every kline from start_time to end_time in concurrent
+            requests instead of stopping at limit; requires both times
+            (default: False)
+        verbose: Echo the request parameters in the response (default: False)
 
     Returns:
-        Dictionary containing kline data with metadata
+        Dictionary containing kline data with metadata. When the server has a
+        public URL configured, large results carry 'klines_url' (a JSON
+        download link) in place of 'klines'.
 
     Example:
         get_klines("binance", "BTCUSDT", "1h", limit=100)
         Returns: {
-            "exchange": "binance",
-            "symbol": "BTCUSDT",
-            "interval": "1h",
-            "market": "spot",
             "count": 100,
             "klines": [
                 {
                     "open_time": 1609459200000,
-                    "open": "29000.00",
-                    "high": "29500.00",
-                    "low": "28800.00",
-                    "close": "29200.00",
-                    "volume": "1234.56",
+                    "open": 29000.00,
+                    "high": 29500.00,
+                    "low": 28800.00,
+                    "close": 29200.00,
+                    "volume": 1234.56,
                     "close_time": 1609462799999,
-                    "quote_volume": "36000000.00",
+                    "quote_volume": 36000000.00,
                     "trades": 15000,
-                    "taker_buy_base": "600.00",
-                    "taker_buy_quote": "17500000.00"
+                    "taker_buy_base": 600.00,
+                    "taker_buy_quote": 17500000.00
                 },
                 ...
             ]
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Fetch klines
-            klines = exchange_instance.fetch_klines(
-                symbol=symbol,
-                interval=interval,
-                market=market,
-                start_time=start_time,
-                end_time=end_time,
-                limit=limit,
-                timezone=timezone
-            )
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Fetch klines
+    klines = await _fetch_klines(
+        exchange_instance,
+        exchange,
+        paginate,
+        symbol=symbol,
+        interval=interval,
+        market=market,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit,
+        timezone=timezone
+    )
 
-            return {
-                "exchange": exchange,
-                "symbol": symbol,
-                "interval": interval,
-                "market": market,
-                "count": len(klines),
-                "start_time": start_time,
-                "end_time": end_time,
-                "klines": klines
-            }
-    except ValueError as e:
-        # User input error (invalid exchange, symbol, interval, etc.)
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "interval": interval,
-            "market": market
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "interval": interval,
-            "market": market
-        }
-    except NotImplementedError as e:
-        # Exchange doesn't support klines
-        return {
-            "error": "Feature not supported",
-            "error_type": "NotImplementedError",
-            "message": str(e),
-            "exchange": exchange
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "interval": interval,
-            "market": market
-        }
+    result = {
+        "exchange": exchange,
+        "symbol": symbol,
+        "interval": interval,
+        "market": market,
+        "start_time": start_time,
+        "end_time": end_time
+    } if verbose else {}
+    result["count"] = len(klines)
+    result["klines"] = klines
+    return offload_large_field(result, "klines")
 
 
 @mcp.tool
-def get_funding_rate_history(
+@tool_errors("exchange", "symbol")
+async def get_funding_rate_history(
     exchange: str,
     symbol: Optional[str] = None,
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
-    limit: int = 100
+    limit: int = 100,
+    by_symbol: bool = False,
+    verbose: bool = False
 ) -> dict:
     """
     Fetch historical funding rate data for futures contracts.
@@ -511,7 +513,12 @@ def get_funding_rate_history(
         symbol: Trading pair symbol (e.g., 'BTCUSDT'). If None, returns data for all symbols
         start_time: Start time in milliseconds (optional, inclusive)
         end_time: End time in milliseconds (optional, inclusive)
-        limit: Number of records to fetch (default: 100, max: 1000)
+        limit: Number of records to fetch (default: 100, max: 1000); without
+            a symbol the limit covers all symbols together
+        by_symbol: Group the records per symbol under 'funding_rates_by_symbol'
+            instead of 'funding_rates'. Use it with symbol omitted to cover many
+            symbols in one request (default: False)
+        verbose: Echo the request parameters in the response (default: False)
 
     Returns:
         Dictionary containing funding rate history
@@ -519,80 +526,59 @@ def get_funding_rate_history(
     Example:
         get_funding_rate_history("binance", "BTCUSDT", limit=50)
         Returns: {
-            "exchange": "binance",
-            "symbol_filter": "BTCUSDT",
             "count": 50,
             "funding_rates": [
                 {
                     "symbol": "BTCUSDT",
-                    "funding_rate": "0.00010000",
+                    "funding_rate": 0.00010000,
                     "funding_time": 1609459200000,
-                    "mark_price": "29000.00"
+                    "mark_price": 29000.00
                 },
                 ...
             ]
         }
+
+        get_funding_rate_history("binance", start_time=1609459200000, limit=1000, by_symbol=True)
+        Returns: {
+            "count": 1000,
+            "funding_rates_by_symbol": {"BTCUSDT": [...], "ETHUSDT": [...], ...}
+        }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Check if exchange supports funding rate history
-            if not hasattr(exchange_instance, 'fetch_funding_rate_history'):
-                return {
-                    "error": "Feature not supported",
-                    "error_type": "NotImplementedError",
-                    "message": f"Exchange '{exchange}' does not support funding rate history",
-                    "exchange": exchange
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Check if exchange supports funding rate history
+    if "funding_history" not in exchange_instance.CAPABILITIES:
+        return _not_supported(
+            f"Exchange '{exchange}' does not support funding rate history",
+            exchange=exchange
+        )
 
-            # Fetch funding rate history
-            funding_rates = exchange_instance.fetch_funding_rate_history(
-                symbol=symbol,
-                start_time=start_time,
-                end_time=end_time,
-                limit=limit
-            )
+    # Fetch funding rate history
+    funding_rates = await exchange_instance.fetch_funding_rate_history(
+        symbol=symbol,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit
+    )
 
-            return {
-                "exchange": exchange,
-                "symbol_filter": symbol,
-                "start_time": start_time,
-                "end_time": end_time,
-                "limit": limit,
-                "count": len(funding_rates),
-                "funding_rates": funding_rates
-            }
-    except ValueError as e:
-        # User input error (invalid limit, etc.)
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    result = {
+        "exchange": exchange,
+        "symbol_filter": symbol,
+        "start_time": start_time,
+        "end_time": end_time,
+        "limit": limit
+    } if verbose else {}
+    result["count"] = len(funding_rates)
+    if by_symbol:
+        result["funding_rates_by_symbol"] = group_by_symbol(funding_rates)
+    else:
+        result["funding_rates"] = funding_rates
+    return result
 
 
 @mcp.tool
-def get_funding_rate_info(exchange: str) -> dict:
+@cached(ttl=FUNDING_INFO_TTL)
+@tool_errors("exchange")
+async def get_funding_rate_info(exchange: str) -> dict:
     """
     Fetch funding rate configuration info (caps, floors, intervals).
 
@@ -610,54 +596,35 @@ def get_funding_rate_info(exchange: str) -> dict:
             "funding_info": [
                 {
                     "symbol": "BLZUSDT",
-                    "adjusted_funding_rate_cap": "0.02500000",
-                    "adjusted_funding_rate_floor": "-0.02500000",
+                    "adjusted_funding_rate_cap": 0.02500000,
+                    "adjusted_funding_rate_floor": -0.02500000,
                     "funding_interval_hours": 8
                 },
                 ...
             ]
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Check if exchange supports funding rate info
-            if not hasattr(exchange_instance, 'fetch_funding_rate_info'):
-                return {
-                    "error": "Feature not supported",
-                    "error_type": "NotImplementedError",
-                    "message": f"Exchange '{exchange}' does not support funding rate info",
-                    "exchange": exchange
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Check if exchange supports funding rate info
+    if "funding_info" not in exchange_instance.CAPABILITIES:
+        return _not_supported(
+            f"Exchange '{exchange}' does not support funding rate info",
+            exchange=exchange
+        )
 
-            # Fetch funding rate info
-            funding_info = exchange_instance.fetch_funding_rate_info()
+    # Fetch funding rate info
+    funding_info = await exchange_instance.fetch_funding_rate_info()
 
-            return {
-                "exchange": exchange,
-                "count": len(funding_info),
-                "funding_info": funding_info
-            }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange
-        }
+    return {
+        "exchange": exchange,
+        "count": len(funding_info),
+        "funding_info": funding_info
+    }
 
 
 @mcp.tool
-def get_open_interest(exchange: str, symbol: str) -> dict:
+@tool_errors("exchange", "symbol")
+async def get_open_interest(exchange: str, symbol: str) -> dict:
     """
     Fetch current open interest for a futures contract.
 
@@ -673,68 +640,40 @@ def get_open_interest(exchange: str, symbol: str) -> dict:
         Returns: {
             "exchange": "binance",
             "symbol": "BTCUSDT",
-            "open_interest": "10659.509",
+            "open_interest": 10659.509,
             "timestamp": 1589437530011
         }
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Check if exchange supports open interest
-            if not hasattr(exchange_instance, 'fetch_open_interest'):
-                return {
-                    "error": "Feature not supported",
-                    "error_type": "NotImplementedError",
-                    "message": f"Exchange '{exchange}' does not support open interest fetching",
-                    "exchange": exchange
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Check if exchange supports open interest
+    if "open_interest" not in exchange_instance.CAPABILITIES:
+        return _not_supported(
+            f"Exchange '{exchange}' does not support open interest fetching",
+            exchange=exchange
+        )
 
-            # Fetch open interest
-            oi_data = exchange_instance.fetch_open_interest(symbol)
+    # Fetch open interest
+    oi_data = await exchange_instance.fetch_open_interest(symbol)
 
-            return {
-                "exchange": exchange,
-                "symbol": oi_data["symbol"],
-                "open_interest": oi_data["open_interest"],
-                "timestamp": oi_data["timestamp"]
-            }
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    return {
+        "exchange": exchange,
+        "symbol": oi_data["symbol"],
+        "open_interest": oi_data["open_interest"],
+        "timestamp": oi_data["timestamp"]
+    }
 
 
 @mcp.tool
-def get_open_interest_history(
+@cached(ttl=OPEN_INTEREST_HISTORY_TTL)
+@tool_errors("exchange", "symbol", "period")
+async def get_open_interest_history(
     exchange: str,
     symbol: str,
     period: str,
     limit: int = 30,
     start_time: Optional[int] = None,
-    end_time: Optional[int] = None
+    end_time: Optional[int] = None,
+    verbose: bool = False
 ) -> dict:
     """
     Fetch historical open interest statistics for a futures contract.
@@ -746,22 +685,22 @@ def get_open_interest_history(
         limit: Number of records to fetch (default: 30, max: 500)
         start_time: Start time in milliseconds (optional)
         end_time: End time in milliseconds (optional)
+        verbose: Echo the request parameters in the response (default: False)
 
     Returns:
-        Dictionary containing historical open interest data
+        Dictionary containing historical open interest data. When the server
+        has a public URL configured, large results carry 'history_url' (a JSON
+        download link) in place of 'history'.
 
     Example:
         get_open_interest_history("binance", "BTCUSDT", "1h", limit=24)
         Returns: {
-            "exchange": "binance",
-            "symbol": "BTCUSDT",
-            "period": "1h",
             "count": 24,
             "history": [
                 {
                     "symbol": "BTCUSDT",
-                    "sum_open_interest": "45123.456",
-                    "sum_open_interest_value": "4512345678.90",
+                    "sum_open_interest": 45123.456,
+                    "sum_open_interest_value": 4512345678.90,
                     "timestamp": 1589437530011
                 },
                 ...
@@ -772,84 +711,63 @@ def get_open_interest_history(
         - Historical data limited to the latest 1 month
         - If startTime and endTime not sent, returns most recent data
     """
-    try:
-        # Use context manager for proper resource cleanup
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            # Check if exchange supports open interest history
-            if not hasattr(exchange_instance, 'fetch_open_interest_history'):
-                return {
-                    "error": "Feature not supported",
-                    "error_type": "NotImplementedError",
-                    "message": f"Exchange '{exchange}' does not support open interest history",
-                    "exchange": exchange
-                }
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Check if exchange supports open interest history
+    if "open_interest_history" not in exchange_instance.CAPABILITIES:
+        return _not_supported(
+            f"Exchange '{exchange}' does not support open interest history",
+            exchange=exchange
+        )
 
-            # Fetch open interest history
-            history = exchange_instance.fetch_open_interest_history(
-                symbol=symbol,
-                period=period,
-                limit=limit,
-                start_time=start_time,
-                end_time=end_time
-            )
+    # Fetch open interest history
+    history = await exchange_instance.fetch_open_interest_history(
+        symbol=symbol,
+        period=period,
+        limit=limit,
+        start_time=start_time,
+        end_time=end_time
+    )
 
-            return {
-                "exchange": exchange,
-                "symbol": symbol,
-                "period": period,
-                "limit": limit,
-                "start_time": start_time,
-                "end_time": end_time,
-                "count": len(history),
-                "history": history
-            }
-    except ValueError as e:
-        # User input error (invalid period, limit, etc.)
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "period": period
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "period": period
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol,
-            "period": period
-        }
+    result = {
+        "exchange": exchange,
+        "symbol": symbol,
+        "period": period,
+        "limit": limit,
+        "start_time": start_time,
+        "end_time": end_time
+    } if verbose else {}
+    result["count"] = len(history)
+    result["history"] = history
+    return offload_large_field(result, "history")
 
 
 # ============================================================================
 # DATA EXPORT TOOLS
 # ============================================================================
 
+def _inline_export(data) -> dict:
+    """Build an export result that carries the data instead of a file path"""
+    # return_data is an explicit request for the rows, so they are never offloaded
+    records = len(data) if isinstance(data, list) else 1
+    return {"status": "success", "records_exported": records, "data": data}
+
+
 @mcp.tool
-def export_klines(
+@tool_errors("exchange", "symbol", status=True)
+async def export_klines(
     exchange: str,
     symbol: str,
     interval: str,
     market: str = "spot",
     file_path: Optional[str] = None,
-    format: Literal["json", "csv"] = "json",
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
-    limit: int = 500
+    limit: int = 500,
+    float32: bool = False,
+    raw: bool = False,
+    paginate: bool = False,
+    return_data: bool = False
 ) -> dict:
     """
     Fetch kline/candlestick data and export to CSV or JSON file.
@@ -860,10 +778,19 @@ def export_klines(
         interval: Kline interval (e.g., '1h', '1d' for Binance; '60', 'D' for Bybit)
         market: Market type ('spot' or 'futures', default: 'spot')
         file_path: Output file path (optional, auto-generated if not provided)
-        format: Export format - 'json' or 'csv' (default: 'json')
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
         start_time: Start time in milliseconds (optional)
         end_time: End time in milliseconds (optional)
         limit: Number of klines to fetch (default: 500)
+        float32: Store prices and volumes as float32 in parquet/feather files,
+            halving their size at ~7 significant digits (default: False)
+        raw: For JSON exports from exchanges that support it (Binance), write the
+            exchange's response unparsed in its native array layout (default: False)
+        paginate: Export every kline from start_time to end_time in concurrent
+            requests instead of stopping at limit; requires both times and
+            disables raw (default: False)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
 
     Returns:
         Dictionary with export status and file details
@@ -874,69 +801,184 @@ def export_klines(
             format="csv", limit=100
         )
     """
-    try:
-        # Fetch klines data
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            klines = exchange_instance.fetch_klines(
-                symbol=symbol,
-                interval=interval,
-                market=market,
-                start_time=start_time,
-                end_time=end_time,
-                limit=limit
-            )
-
-        # Generate file path if not provided
+    exchange_instance = ExchangeFactory.get(exchange)
+
+    # Fast path: write the exchange's JSON body without parsing and re-encoding it
+    if (raw and format == "json" and not return_data and not paginate
+            and "klines_raw" in exchange_instance.CAPABILITIES):
+        body = await exchange_instance.fetch_klines_raw(
+            symbol=symbol,
+            interval=interval,
+            market=market,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit
+        )
         if file_path is None:
             filename = DataExporter.generate_filename(
                 exchange=exchange,
-                data_type=f"klines_{interval}",
+                data_type=f"klines_{interval}_raw",
                 symbol=symbol,
                 extension=format
             )
-            file_path = f"exports/{filename}"
-
-        # Export based on format
-        if format == "json":
-            result = DataExporter.export_to_json(klines, file_path)
-        else:  # csv
-            result = DataExporter.export_to_csv(klines, file_path)
-
-        # Add metadata
+            file_path = str(EXPORTS_DIR / filename)
+        result = await asyncio.to_thread(DataExporter.export_raw_json, body, file_path)
         result["exchange"] = exchange
         result["symbol"] = symbol
         result["interval"] = interval
         result["market"] = market
-
+        result["layout"] = "exchange_native"
         return result
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    # Fetch klines data
+    klines = await _fetch_klines(
+        exchange_instance,
+        exchange,
+        paginate,
+        symbol=symbol,
+        interval=interval,
+        market=market,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit
+    )
+
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type=f"klines_{interval}",
+            symbol=symbol,
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
+
+    # Export based on format (file I/O runs off the event loop), or return the data inline
+    if file_path is None:
+        result = _inline_export(klines)
+    else:
+        options = {"float32": True} if float32 and format in ("parquet", "feather") else {}
+        result = await asyncio.to_thread(DataExporter.export, klines, file_path, format, **options)
+
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbol"] = symbol
+    result["interval"] = interval
+    result["market"] = market
+
+    return result
+
+
+@mcp.tool
+@tool_errors("exchange", "symbols", status=True)
+async def export_klines_batch(
+    exchange: str,
+    symbols: List[str],
+    interval: str,
+    market: str = "spot",
+    file_path: Optional[str] = None,
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    limit: int = 500,
+    float32: bool = False,
+    return_data: bool = False
+) -> dict:
+    """
+    Fetch kline/candlestick data for several symbols concurrently and export
+    them to a single file, one row per kline with a 'symbol' column.
+
+    Args:
+        exchange: Exchange name ('binance' or 'bybit')
+        symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+        interval: Kline interval (e.g., '1h', '1d' for Binance; '60', 'D' for Bybit)
+        market: Market type ('spot' or 'futures', default: 'spot')
+        file_path: Output file path (optional, auto-generated if not provided)
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
+        start_time: Start time in milliseconds (optional)
+        end_time: End time in milliseconds (optional)
+        limit: Number of klines to fetch per symbol (default: 500)
+        float32: Store prices and volumes as float32 in parquet/feather files,
+            halving their size at ~7 significant digits (default: False)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
+
+    Returns:
+        Dictionary with export status and file details; symbols whose fetch
+        failed are listed under 'failed_symbols' and left out of the file
+
+    Example:
+        export_klines_batch(
+            "binance", ["BTCUSDT", "ETHUSDT", "SOLUSDT"], "1h",
+            market="futures", format="parquet"
+        )
+    """
+    if not symbols:
+        raise ValueError("At least one symbol is required")
+
+    exchange_instance = ExchangeFactory.get(exchange)
+    # Fetch all symbols concurrently; one failed symbol does not abort the batch
+    results = await exchange_instance.fetch_klines_many(
+        symbols,
+        interval,
+        market=market,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit,
+        concurrency=BATCH_FETCH_CONCURRENCY
+    )
+
+    rows = []
+    exported_symbols = []
+    failed_symbols = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            failed_symbols[symbol] = str(result)
+            continue
+        exported_symbols.append(symbol)
+        rows.extend({"symbol": symbol, **kline} for kline in result)
+
+    if not rows:
+        raise ValueError(f"No klines fetched for any of the requested symbols: {failed_symbols}")
+
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type=f"klines_{interval}_batch",
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
+
+    if file_path is None:
+        result = _inline_export(rows)
+    else:
+        options = {"float32": True} if float32 and format in ("parquet", "feather") else {}
+        result = await asyncio.to_thread(DataExporter.export, rows, file_path, format, **options)
+
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbols"] = exported_symbols
+    result["interval"] = interval
+    result["market"] = market
+    if failed_symbols:
+        result["failed_symbols"] = failed_symbols
+
+    return result
 
 
 @mcp.tool
-def export_funding_rate(
+@tool_errors("exchange", "symbol", status=True)
+async def export_funding_rate(
     exchange: str,
     symbol: str,
     file_path: Optional[str] = None,
-    format: Literal["json", "csv"] = "json",
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
-    limit: int = 100
+    limit: int = 100,
+    no_cache: bool = False,
+    return_data: bool = False
 ) -> dict:
     """
     Fetch funding rate history and export to CSV or JSON file.
@@ -945,10 +987,13 @@ def export_funding_rate(
         exchange: Exchange name ('binance' or 'bybit')
         symbol: Trading pair symbol (e.g., 'BTCUSDT')
         file_path: Output file path (optional, auto-generated if not provided)
-        format: Export format - 'json' or 'csv' (default: 'json')
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
         start_time: Start time in milliseconds (optional)
         end_time: End time in milliseconds (optional)
         limit: Number of records to fetch (default: 100)
+        no_cache: Bypass the response cache and fetch fresh data (default: False)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
 
     Returns:
         Dictionary with export status and file details
@@ -958,78 +1003,60 @@ def export_funding_rate(
             "binance", "BTCUSDT", format="csv", limit=50
         )
     """
-    try:
-        # Fetch funding rate data
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            if exchange == "binance":
-                funding_data = exchange_instance.fetch_funding_rate_history(
-                    symbol=symbol,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=limit
-                )
-            elif exchange == "bybit":
-                funding_data = exchange_instance.fetch_funding_rate_history(
-                    symbol=symbol,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=limit,
-                    market="futures"
-                )
-            else:
-                raise ValueError(f"Funding rate not supported for {exchange}")
-
-        # Generate file path if not provided
-        if file_path is None:
-            filename = DataExporter.generate_filename(
-                exchange=exchange,
-                data_type="funding_rate",
-                symbol=symbol,
-                extension=format
-            )
-            file_path = f"exports/{filename}"
+    # Fetch funding rate data
+    exchange_instance = ExchangeFactory.get(exchange)
+    if exchange not in ("binance", "bybit"):
+        raise ValueError(f"Funding rate not supported for {exchange}")
+
+    funding_data = await get_or_fetch(
+        _funding_cache,
+        (exchange, symbol, start_time, end_time, limit),
+        lambda: exchange_instance.fetch_funding_rate_history(
+            symbol=symbol,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit
+        ),
+        refresh=no_cache
+    )
 
-        # Export based on format
-        if format == "json":
-            result = DataExporter.export_to_json(funding_data, file_path)
-        else:  # csv
-            result = DataExporter.export_to_csv(funding_data, file_path)
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type="funding_rate",
+            symbol=symbol,
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
 
-        # Add metadata
-        result["exchange"] = exchange
-        result["symbol"] = symbol
-        result["data_type"] = "funding_rate"
+    # Export based on format (file I/O runs off the event loop), or return the data inline
+    if file_path is None:
+        result = _inline_export(funding_data)
+    else:
+        result = await asyncio.to_thread(DataExporter.export, funding_data, file_path, format)
 
-        return result
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbol"] = symbol
+    result["data_type"] = "funding_rate"
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    return result
 
 
 @mcp.tool
-def export_open_interest(
+@tool_errors("exchange", "symbol", status=True)
+async def export_open_interest(
     exchange: str,
     symbol: str,
     file_path: Optional[str] = None,
-    format: Literal["json", "csv"] = "json",
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
     interval: Optional[str] = None,
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
-    limit: int = 50
+    limit: int = 50,
+    no_cache: bool = False,
+    return_data: bool = False
 ) -> dict:
     """
     Fetch open interest data and export to CSV or JSON file.
@@ -1038,12 +1065,15 @@ def export_open_interest(
         exchange: Exchange name ('binance' or 'bybit')
         symbol: Trading pair symbol (e.g., 'BTCUSDT')
         file_path: Output file path (optional, auto-generated if not provided)
-        format: Export format - 'json' or 'csv' (default: 'json')
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
         interval: For Bybit: '5min', '15min', '30min', '1h', '4h', '1d' (required)
                  For Binance history: '5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d' (optional)
         start_time: Start time in milliseconds (optional)
         end_time: End time in milliseconds (optional)
         limit: Number of records to fetch (default: 50)
+        no_cache: Bypass the current open interest cache and fetch fresh data (default: False)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
 
     Returns:
         Dictionary with export status and file details
@@ -1053,87 +1083,77 @@ def export_open_interest(
             "bybit", "BTCUSDT", interval="1h", format="csv", limit=24
         )
     """
-    try:
-        # Fetch open interest data
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            if exchange == "binance":
-                if interval:
-                    # Historical OI
-                    oi_data = exchange_instance.fetch_open_interest_history(
-                        symbol=symbol,
-                        period=interval,
-                        start_time=start_time,
-                        end_time=end_time,
-                        limit=limit
-                    )
-                else:
-                    # Current OI (returns single dict, convert to list)
-                    oi_data = [exchange_instance.fetch_open_interest(symbol=symbol)]
-            elif exchange == "bybit":
-                if not interval:
-                    raise ValueError("interval parameter is required for Bybit open interest")
-                oi_data = exchange_instance.fetch_open_interest(
-                    symbol=symbol,
-                    interval=interval,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=limit,
-                    market="futures"
-                )
-            else:
-                raise ValueError(f"Open interest not supported for {exchange}")
-
-        # Generate file path if not provided
-        if file_path is None:
-            data_type = f"open_interest_{interval}" if interval else "open_interest"
-            filename = DataExporter.generate_filename(
-                exchange=exchange,
-                data_type=data_type,
+    # Fetch open interest data
+    exchange_instance = ExchangeFactory.get(exchange)
+    if exchange == "binance":
+        if interval:
+            # Historical OI
+            oi_data = await exchange_instance.fetch_open_interest_history(
                 symbol=symbol,
-                extension=format
+                period=interval,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit
             )
-            file_path = f"exports/{filename}"
-
-        # Export based on format
-        if format == "json":
-            result = DataExporter.export_to_json(oi_data, file_path)
-        else:  # csv
-            result = DataExporter.export_to_csv(oi_data, file_path)
-
-        # Add metadata
-        result["exchange"] = exchange
-        result["symbol"] = symbol
-        result["data_type"] = "open_interest"
-        if interval:
-            result["interval"] = interval
-
-        return result
+        else:
+            # Current OI (returns single dict, convert to list)
+            oi_data = [await get_or_fetch(
+                _open_interest_cache,
+                (exchange, symbol),
+                lambda: exchange_instance.fetch_open_interest(symbol=symbol),
+                refresh=no_cache
+            )]
+    elif exchange == "bybit":
+        if not interval:
+            raise ValueError("interval parameter is required for Bybit open interest")
+        oi_data = await exchange_instance.fetch_open_interest(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
+            market="futures"
+        )
+    else:
+        raise ValueError(f"Open interest not supported for {exchange}")
+
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        data_type = f"open_interest_{interval}" if interval else "open_interest"
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type=data_type,
+            symbol=symbol,
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
+
+    # Export based on format (file I/O runs off the event loop), or return the data inline
+    if file_path is None:
+        result = _inline_export(oi_data)
+    else:
+        result = await asyncio.to_thread(DataExporter.export, oi_data, file_path, format)
+
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbol"] = symbol
+    result["data_type"] = "open_interest"
+    if interval:
+        result["interval"] = interval
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    return result
 
 
 @mcp.tool
-def export_trading_pairs(
+@tool_errors("exchange", "market", status=True)
+async def export_trading_pairs(
     exchange: str,
     market: str,
     status: Literal["active", "inactive", "all"] = "active",
     file_path: Optional[str] = None,
-    format: Literal["json", "csv"] = "json"
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
+    no_cache: bool = False,
+    return_data: bool = False
 ) -> dict:
     """
     Fetch trading pairs and export to CSV or JSON file.
@@ -1143,7 +1163,10 @@ def export_trading_pairs(
         market: Market type (e.g., 'spot', 'futures')
         status: Filter by pair status - 'active', 'inactive', or 'all' (default: 'active')
         file_path: Output file path (optional, auto-generated if not provided)
-        format: Export format - 'json' or 'csv' (default: 'json')
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
+        no_cache: Bypass the response cache and fetch fresh data (default: False)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
 
     Returns:
         Dictionary with export status and file details
@@ -1153,57 +1176,44 @@ def export_trading_pairs(
             "binance", "spot", status="active", format="csv"
         )
     """
-    try:
-        # Fetch trading pairs
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            result = exchange_instance.fetch_all_pairs(market)
-
-            # Filter based on status
-            if status == "active":
-                pairs = result["active"]
-            elif status == "inactive":
-                pairs = result["inactive"]
-            else:  # all
-                pairs = result["active"] + result["inactive"]
-
-        # Generate file path if not provided
-        if file_path is None:
-            filename = DataExporter.generate_filename(
-                exchange=exchange,
-                data_type=f"trading_pairs_{market}_{status}",
-                extension=format
-            )
-            file_path = f"exports/{filename}"
+    # Fetch trading pairs
+    exchange_instance = ExchangeFactory.get(exchange)
+    result = await get_or_fetch(
+        _pairs_cache,
+        (exchange, market),
+        lambda: exchange_instance.fetch_all_pairs(market, use_cache=not no_cache),
+        refresh=no_cache
+    )
 
-        # Export based on format
-        if format == "json":
-            export_result = DataExporter.export_to_json(pairs, file_path)
-        else:  # csv
-            export_result = DataExporter.export_to_csv(pairs, file_path)
+    # Filter based on status
+    if status == "active":
+        pairs = result["active"]
+    elif status == "inactive":
+        pairs = result["inactive"]
+    else:  # all
+        pairs = result["active"] + result["inactive"]
+
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type=f"trading_pairs_{market}_{status}",
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
 
-        # Add metadata
-        export_result["exchange"] = exchange
-        export_result["market"] = market
-        export_result["status_filter"] = status
+    # Export based on format (file I/O runs off the event loop), or return the data inline
+    if file_path is None:
+        export_result = _inline_export(pairs)
+    else:
+        export_result = await asyncio.to_thread(DataExporter.export, pairs, file_path, format)
 
-        return export_result
+    # Add metadata
+    export_result["exchange"] = exchange
+    export_result["market"] = market
+    export_result["status_filter"] = status
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "market": market
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "market": market
-        }
+    return export_result
 
 
 # ============================================================================
@@ -1211,7 +1221,8 @@ def export_trading_pairs(
 # ============================================================================
 
 @mcp.tool
-def calculate_indicator(
+@tool_errors("exchange", "symbol", status=True)
+async def calculate_indicator(
     exchange: str,
     symbol: str,
     interval: str,
@@ -1242,72 +1253,55 @@ def calculate_indicator(
     Example:
         calculate_indicator("binance", "BTCUSDT", "1h", "RSI", period=14)
     """
-    try:
-        # Fetch klines data
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            klines = exchange_instance.fetch_klines(
-                symbol=symbol,
-                interval=interval,
-                market=market,
-                limit=limit
-            )
+    # Fetch klines data
+    exchange_instance = ExchangeFactory.get(exchange)
+    klines = await exchange_instance.fetch_klines(
+        symbol=symbol,
+        interval=interval,
+        market=market,
+        limit=limit
+    )
 
-        # Calculate indicator based on type
-        if indicator == "RSI":
-            result = TechnicalIndicators.calculate_rsi(klines, period=period or 14)
-        elif indicator == "MACD":
-            result = TechnicalIndicators.calculate_macd(klines)
-        elif indicator == "SMA":
-            result = TechnicalIndicators.calculate_sma(klines, period=period or 20)
-        elif indicator == "EMA":
-            result = TechnicalIndicators.calculate_ema(klines, period=period or 20)
-        elif indicator == "BB":
-            result = TechnicalIndicators.calculate_bollinger_bands(klines, period=period or 20)
-        elif indicator == "ATR":
-            result = TechnicalIndicators.calculate_atr(klines, period=period or 14)
-        elif indicator == "STOCH":
-            result = TechnicalIndicators.calculate_stochastic(klines)
-        elif indicator == "CCI":
-            result = TechnicalIndicators.calculate_cci(klines, period=period or 20)
-        elif indicator == "OBV":
-            result = TechnicalIndicators.calculate_obv(klines)
-        elif indicator == "VWAP":
-            result = TechnicalIndicators.calculate_vwap(klines)
-        elif indicator == "MFI":
-            result = TechnicalIndicators.calculate_mfi(klines, period=period or 14)
-        elif indicator == "KC":
-            result = TechnicalIndicators.calculate_keltner_channels(klines, period=period or 20)
-        else:
-            raise ValueError(f"Unknown indicator: {indicator}")
-
-        # Add metadata
-        result["exchange"] = exchange
-        result["symbol"] = symbol
-        result["interval"] = interval
-        result["market"] = market
-
-        return result
-
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    # Calculate indicator based on type
+    if indicator == "RSI":
+        result = TechnicalIndicators.calculate_rsi(klines, period=period or 14)
+    elif indicator == "MACD":
+        result = TechnicalIndicators.calculate_macd(klines)
+    elif indicator == "SMA":
+        result = TechnicalIndicators.calculate_sma(klines, period=period or 20)
+    elif indicator == "EMA":
+        result = TechnicalIndicators.calculate_ema(klines, period=period or 20)
+    elif indicator == "BB":
+        result = TechnicalIndicators.calculate_bollinger_bands(klines, period=period or 20)
+    elif indicator == "ATR":
+        result = TechnicalIndicators.calculate_atr(klines, period=period or 14)
+    elif indicator == "STOCH":
+        result = TechnicalIndicators.calculate_stochastic(klines)
+    elif indicator == "CCI":
+        result = TechnicalIndicators.calculate_cci(klines, period=period or 20)
+    elif indicator == "OBV":
+        result = TechnicalIndicators.calculate_obv(klines)
+    elif indicator == "VWAP":
+        result = TechnicalIndicators.calculate_vwap(klines)
+    elif indicator == "MFI":
+        result = TechnicalIndicators.calculate_mfi(klines, period=period or 14)
+    elif indicator == "KC":
+        result = TechnicalIndicators.calculate_keltner_channels(klines, period=period or 20)
+    else:
+        raise ValueError(f"Unknown indicator: {indicator}")
+
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbol"] = symbol
+    result["interval"] = interval
+    result["market"] = market
+
+    return result
 
 
 @mcp.tool
-def calculate_multiple_indicators(
+@tool_errors("exchange", "symbol", status=True)
+async def calculate_multiple_indicators(
     exchange: str,
     symbol: str,
     interval: str,
@@ -1337,56 +1331,55 @@ def calculate_multiple_indicators(
             indicators=["RSI", "MACD", "EMA_50", "BB"]
         )
     """
-    try:
-        # Fetch klines data
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            klines = exchange_instance.fetch_klines(
-                symbol=symbol,
-                interval=interval,
-                market=market,
-                limit=limit
-            )
+    # Fetch klines data
+    exchange_instance = ExchangeFactory.get(exchange)
+    klines = await exchange_instance.fetch_klines(
+        symbol=symbol,
+        interval=interval,
+        market=market,
+        limit=limit
+    )
 
-        # Calculate multiple indicators
-        result = TechnicalIndicators.calculate_multiple_indicators(klines, indicators)
+    # Calculate multiple indicators
+    result = TechnicalIndicators.calculate_multiple_indicators(klines, indicators)
 
-        # Add metadata
-        result["exchange"] = exchange
-        result["symbol"] = symbol
-        result["interval"] = interval
-        result["market"] = market
-        result["klines_count"] = len(klines)
+    # Add metadata
+    result["exchange"] = exchange
+    result["symbol"] = symbol
+    result["interval"] = interval
+    result["market"] = market
+    result["klines_count"] = len(klines)
 
-        return result
+    return result
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+
+def _calculate_and_export(
+    klines: List[dict],
+    indicators: List[str],
+    file_path: Optional[str],
+    format: str
+) -> Tuple[dict, dict]:
+    """Calculate indicators for klines and export the resulting rows (blocking)"""
+    indicator_result = TechnicalIndicators.calculate_multiple_indicators(klines, indicators)
+    if file_path is None:
+        export_result = _inline_export(indicator_result["data"])
+    else:
+        export_result = DataExporter.export(indicator_result["data"], file_path, format)
+    return indicator_result, export_result
 
 
 @mcp.tool
-def export_indicator_data(
+@tool_errors("exchange", "symbol", status=True)
+async def export_indicator_data(
     exchange: str,
     symbol: str,
     interval: str,
     indicators: List[str],
     market: str = "spot",
     file_path: Optional[str] = None,
-    format: Literal["json", "csv"] = "json",
-    limit: int = 100
+    format: Literal["json", "csv", "parquet", "feather"] = "json",
+    limit: int = 100,
+    return_data: bool = False
 ) -> dict:
     """
     Calculate indicators and export to CSV or JSON file.
@@ -1398,8 +1391,10 @@ def export_indicator_data(
         indicators: List of indicator names to calculate
         market: Market type ('spot' or 'futures', default: 'spot')
         file_path: Output file path (optional, auto-generated if not provided)
-        format: Export format - 'json' or 'csv' (default: 'json')
+        format: Export format - 'json', 'csv', 'parquet' or 'feather' (default: 'json')
         limit: Number of klines to fetch (default: 100)
+        return_data: Return the data in the response instead of writing a file;
+            ignored when file_path is given (default: False)
 
     Returns:
         Dictionary with export status and file details
@@ -1411,70 +1406,121 @@ def export_indicator_data(
             format="csv"
         )
     """
-    try:
-        # Fetch klines and calculate indicators
-        with ExchangeFactory.create(exchange) as exchange_instance:
-            klines = exchange_instance.fetch_klines(
-                symbol=symbol,
-                interval=interval,
-                market=market,
-                limit=limit
-            )
-
-        # Calculate indicators
-        indicator_result = TechnicalIndicators.calculate_multiple_indicators(klines, indicators)
-        data = indicator_result["data"]
-
-        # Generate file path if not provided
-        if file_path is None:
-            indicators_str = "_".join(indicators[:3])  # Use first 3 indicators in filename
-            filename = DataExporter.generate_filename(
-                exchange=exchange,
-                data_type=f"indicators_{indicators_str}_{interval}",
-                symbol=symbol,
-                extension=format
-            )
-            file_path = f"exports/{filename}"
+    # Fetch klines and calculate indicators
+    exchange_instance = ExchangeFactory.get(exchange)
+    klines = await exchange_instance.fetch_klines(
+        symbol=symbol,
+        interval=interval,
+        market=market,
+        limit=limit
+    )
 
-        # Export based on format
-        if format == "json":
-            export_result = DataExporter.export_to_json(data, file_path)
-        else:  # csv
-            export_result = DataExporter.export_to_csv(data, file_path)
+    # Generate file path if not provided (inline results are not written)
+    if file_path is None and not return_data:
+        indicators_str = "_".join(indicators[:3])  # Use first 3 indicators in filename
+        filename = DataExporter.generate_filename(
+            exchange=exchange,
+            data_type=f"indicators_{indicators_str}_{interval}",
+            symbol=symbol,
+            extension=format
+        )
+        file_path = str(EXPORTS_DIR / filename)
 
-        # Add metadata
-        export_result["exchange"] = exchange
-        export_result["symbol"] = symbol
-        export_result["interval"] = interval
-        export_result["market"] = market
-        export_result["indicators_calculated"] = indicator_result["indicators_calculated"]
+    # Calculate indicators and write the file in a worker thread, so the event
+    # loop keeps serving other requests' fetches while this one computes/writes
+    indicator_result, export_result = await asyncio.to_thread(
+        _calculate_and_export, klines, indicators, file_path, format
+    )
 
-        return export_result
+    # Add metadata
+    export_result["exchange"] = exchange
+    export_result["symbol"] = symbol
+    export_result["interval"] = interval
+    export_result["market"] = market
+    export_result["indicators_calculated"] = indicator_result["indicators_calculated"]
 
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    return export_result
 
 
 # ============================================================================
 # PANDA METRICS TOOLS
 # ============================================================================
 
-@mcp.tool
-def get_divine_dip_metric(
+# Shared parts of the error responses returned by the metric tools
+_INVALID_INPUT = MappingProxyType({"error": "Invalid input", "error_type": "ValueError"})
+_CONFIGURATION_ERROR = MappingProxyType({
+    "error": "Configuration error",
+    "error_type": "ValueError",
+    "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
+})
+
+
+def _invalid_input(message: str, **context) -> dict:
+    """Build a metric tool validation error response"""
+    return {**_INVALID_INPUT, "message": message, **context}
+
+
+def _configuration_error(message: str) -> dict:
+    """Build a metric tool error response for a missing API configuration"""
+    return {**_CONFIGURATION_ERROR, "message": message}
+
+
+def _raw_metric_response(metric: str, raw_data: dict) -> dict:
+    """Wrap an unformatted backend response returned for raw=True"""
+    return {"metric": metric, "layout": "api_native", "data": raw_data}
+
+
+def _metric_layout(result: dict, columnar: bool) -> dict:
+    """Convert a formatted metric response's "data" to one list per field when columnar is set"""
+    if columnar:
+        result["data"] = to_columns(result["data"])
+        result["layout"] = "columnar"
+    return result
+
+
+def _metric_tool(*context: str) -> Callable:
+    """
+    Register a panda-backend-api metric tool
+
+    Applies what every metric tool shares, outermost first: MCP registration,
+    error responses echoing the *context arguments (validation ValueErrors
+    become "Invalid input" responses), the configuration check for the
+    metrics client and the on-disk response cache.
+
+    Args:
+        *context: Names of tool arguments echoed back in error responses
+
+    Returns:
+        Decorator for the tool function
+
+    Example:
+        @_metric_tool("metric", "symbol")
+        async def get_jlabs_metric(metric: str, symbol: str, ...) -> dict:
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cached_func = file_cached(ttl=_metric_cache_ttl)(func)
+
+        @functools.wraps(cached_func)
+        async def wrapper(*args, **kwargs):
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            try:
+                get_metrics_client(
+                    base_url=arguments.get("api_base_url"),
+                    api_key=arguments.get("api_key")
+                )
+            except ValueError as e:
+                return _configuration_error(str(e))
+            return await cached_func(*args, **kwargs)
+
+        return mcp.tool(tool_errors(*context)(wrapper))
+
+    return decorator
+
+
+@_metric_tool("exchange_type")
+async def get_divine_dip_metric(
     exchange_type: Literal["CEX", "DEX"],
     timeframe: str,
     start_epoch: int,
@@ -1488,7 +1534,9 @@ def get_divine_dip_metric(
     # DEX parameters
     chain: Optional[str] = None,
     pool_address: Optional[str] = None,
-    include_statistics: bool = True
+    include_statistics: bool = True,
+    raw: bool = False,
+    columnar: bool = False
 ) -> dict:
     """
     Fetch Divine Dip metric from panda-backend-api.
@@ -1512,6 +1560,10 @@ def get_divine_dip_metric(
         chain: Blockchain network for DEX (e.g., 'ethereum', 'bsc', 'solana')
         pool_address: DEX pool address (e.g., '0x1234...')
         include_statistics: Include statistical summary (default: True)
+        raw: Return the backend response as-is under "data", skipping reformatting,
+             request metadata and statistics (default: False)
+        columnar: Return "data" as one list per field (e.g., {"t": [...], "value": [...]})
+                  instead of a list of points (default: False)
 
     Returns:
         Dictionary containing divine_dip metric data with timestamps and values
@@ -1568,149 +1620,107 @@ def get_divine_dip_metric(
             api_key="your-api-key"
         )
     """
-    try:
-        # Validate parameters based on exchange type
-        if exchange_type == "CEX":
-            if not exchange or not token:
-                return {
-                    "error": "Invalid input",
-                    "error_type": "ValueError",
-                    "message": "CEX metrics require 'exchange' and 'token' parameters",
-                    "exchange_type": exchange_type
-                }
-
-            # Validate CEX parameters
-            try:
-                DivineDipMetric.validate_cex_params(
-                    exchange=exchange,
-                    token=token,
-                    timeframe=timeframe,
-                    start_epoch=start_epoch,
-                    end_epoch=end_epoch
-                )
-            except ValueError as e:
-                return {
-                    "error": "Invalid input",
-                    "error_type": "ValueError",
-                    "message": str(e),
-                    "exchange_type": exchange_type,
-                    "exchange": exchange,
-                    "token": token,
-                    "timeframe": timeframe
-                }
-
-        elif exchange_type == "DEX":
-            if not chain or not pool_address:
-                return {
-                    "error": "Invalid input",
-                    "error_type": "ValueError",
-                    "message": "DEX metrics require 'chain' and 'pool_address' parameters",
-                    "exchange_type": exchange_type
-                }
-
-            # Validate DEX parameters
-            try:
-                DivineDipMetric.validate_dex_params(
-                    chain=chain,
-                    pool_address=pool_address,
-                    timeframe=timeframe,
-                    start_epoch=start_epoch,
-                    end_epoch=end_epoch
-                )
-            except ValueError as e:
-                return {
-                    "error": "Invalid input",
-                    "error_type": "ValueError",
-                    "message": str(e),
-                    "exchange_type": exchange_type,
-                    "chain": chain,
-                    "pool_address": pool_address,
-                    "timeframe": timeframe
-                }
-        else:
-            return {
-                "error": "Invalid input",
-                "error_type": "ValueError",
-                "message": f"Invalid exchange_type: {exchange_type}. Must be 'CEX' or 'DEX'",
-                "exchange_type": exchange_type
-            }
+    # Validate parameters based on exchange type
+    if exchange_type == "CEX":
+        if not exchange or not token:
+            return _invalid_input(
+                "CEX metrics require 'exchange' and 'token' parameters",
+                exchange_type=exchange_type
+            )
 
-        # Create API client and fetch data (will use env vars if not provided)
+        # Validate CEX parameters
         try:
-            client = PandaMetricsClient(base_url=api_base_url, api_key=api_key)
-        except ValueError as e:
-            return {
-                "error": "Configuration error",
-                "error_type": "ValueError",
-                "message": str(e),
-                "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
-            }
-
-        with client:
-            raw_data = client.fetch_metric(
-                metric="divine_dip",
-                exchange_type=exchange_type,
+            DivineDipMetric.validate_cex_params(
+                exchange=exchange,
+                token=token,
                 timeframe=timeframe,
                 start_epoch=start_epoch,
-                end_epoch=end_epoch,
-                version=version,
+                end_epoch=end_epoch
+            )
+        except ValueError as e:
+            return _invalid_input(
+                str(e),
+                exchange_type=exchange_type,
                 exchange=exchange,
                 token=token,
+                timeframe=timeframe
+            )
+
+    elif exchange_type == "DEX":
+        if not chain or not pool_address:
+            return _invalid_input(
+                "DEX metrics require 'chain' and 'pool_address' parameters",
+                exchange_type=exchange_type
+            )
+
+        # Validate DEX parameters
+        try:
+            DivineDipMetric.validate_dex_params(
+                chain=chain,
+                pool_address=pool_address,
+                timeframe=timeframe,
+                start_epoch=start_epoch,
+                end_epoch=end_epoch
+            )
+        except ValueError as e:
+            return _invalid_input(
+                str(e),
+                exchange_type=exchange_type,
                 chain=chain,
-                pool_address=pool_address
+                pool_address=pool_address,
+                timeframe=timeframe
             )
+    else:
+        return _invalid_input(
+            f"Invalid exchange_type: {exchange_type}. Must be 'CEX' or 'DEX'",
+            exchange_type=exchange_type
+        )
 
-        # Format response
-        result = DivineDipMetric.format_response(raw_data)
+    # Get the shared API client and fetch data (will use env vars if not provided)
+    client = get_metrics_client(base_url=api_base_url, api_key=api_key)
+
+    raw_data = await client.fetch_metric(
+        metric="divine_dip",
+        exchange_type=exchange_type,
+        timeframe=timeframe,
+        start_epoch=start_epoch,
+        end_epoch=end_epoch,
+        version=version,
+        exchange=exchange,
+        token=token,
+        chain=chain,
+        pool_address=pool_address
+    )
 
-        # Add request metadata
-        result["exchange_type"] = exchange_type
-        result["timeframe"] = timeframe
-        result["start_epoch"] = start_epoch
-        result["end_epoch"] = end_epoch
-        result["version"] = version
+    if raw:
+        return _raw_metric_response("divine_dip", raw_data)
 
-        if exchange_type == "CEX":
-            result["exchange"] = exchange
-            result["token"] = token
-        else:
-            result["chain"] = chain
-            result["pool_address"] = pool_address
+    # Format response
+    result = DivineDipMetric.format_response(raw_data)
 
-        # Add statistics if requested
-        if include_statistics:
-            result["statistics"] = DivineDipMetric.calculate_statistics(result["data"])
+    # Add request metadata
+    result["exchange_type"] = exchange_type
+    result["timeframe"] = timeframe
+    result["start_epoch"] = start_epoch
+    result["end_epoch"] = end_epoch
+    result["version"] = version
 
-        return result
+    if exchange_type == "CEX":
+        result["exchange"] = exchange
+        result["token"] = token
+    else:
+        result["chain"] = chain
+        result["pool_address"] = pool_address
 
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "exchange_type": exchange_type
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "exchange_type": exchange_type
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "exchange_type": exchange_type
-        }
+    # Add statistics if requested
+    if include_statistics:
+        result["statistics"] = DivineDipMetric.calculate_statistics(result["data"])
 
+    return _metric_layout(result, columnar)
 
-@mcp.tool
-def get_orderbook_metric(
+
+@_metric_tool("metric", "symbol", "exchange")
+async def get_orderbook_metric(
     metric: str,
     symbol: str,
     exchange: str,
@@ -1720,7 +1730,9 @@ def get_orderbook_metric(
     epoch_high: int,
     api_base_url: Optional[str] = None,
     api_key: Optional[str] = None,
-    include_statistics: bool = True
+    include_statistics: bool = True,
+    raw: bool = False,
+    columnar: bool = False
 ) -> dict:
     """
     Fetch orderbook metrics from panda-backend-api.
@@ -1748,9 +1760,15 @@ def get_orderbook_metric(
         api_base_url: Base URL for panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
         api_key: API key for authentication (defaults to PANDA_API_KEY env var)
         include_statistics: Include statistical summary (default: True)
+        raw: Return the backend response as-is under "data", skipping reformatting,
+             request metadata and statistics (default: False)
+        columnar: Return "data" as one list per field (e.g., {"t": [...], "value": [...]})
+                  instead of a list of points (default: False)
 
     Returns:
-        Dictionary containing orderbook metric data with timestamps and values
+        Dictionary containing orderbook metric data with timestamps and values.
+        When the server has a public URL configured, large results carry
+        'data_url' (a JSON download link) in place of 'data'.
 
     Example (Bid-Ask Ratio):
         get_orderbook_metric(
@@ -1793,101 +1811,56 @@ def get_orderbook_metric(
             epoch_high=1763317860
         )
     """
-    try:
-        # Validate parameters
-        try:
-            OrderbookMetric.validate_params(
-                metric=metric,
-                symbol=symbol,
-                exchange=exchange,
-                timeframe=timeframe,
-                volume=volume,
-                epoch_low=epoch_low,
-                epoch_high=epoch_high
-            )
-        except ValueError as e:
-            return {
-                "error": "Invalid input",
-                "error_type": "ValueError",
-                "message": str(e),
-                "metric": metric,
-                "symbol": symbol,
-                "exchange": exchange
-            }
-
-        # Create API client and fetch data (will use env vars if not provided)
-        try:
-            client = PandaMetricsClient(base_url=api_base_url, api_key=api_key)
-        except ValueError as e:
-            return {
-                "error": "Configuration error",
-                "error_type": "ValueError",
-                "message": str(e),
-                "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
-            }
-
-        with client:
-            raw_data = client.fetch_orderbook_metric(
-                metric=metric,
-                symbol=symbol,
-                exchange=exchange,
-                timeframe=timeframe,
-                volume=volume,
-                epoch_low=epoch_low,
-                epoch_high=epoch_high
-            )
-
-        # Format response
-        result = OrderbookMetric.format_response(raw_data, metric)
+    # Validate parameters (errors become Invalid input responses)
+    OrderbookMetric.validate_params(
+        metric=metric,
+        symbol=symbol,
+        exchange=exchange,
+        timeframe=timeframe,
+        volume=volume,
+        epoch_low=epoch_low,
+        epoch_high=epoch_high
+    )
 
-        # Add request metadata
-        result["symbol"] = symbol
-        result["exchange"] = OrderbookMetric.normalize_exchange(exchange)
-        result["timeframe"] = timeframe
-        result["volume"] = volume.lower()
-        result["epoch_low"] = epoch_low
-        result["epoch_high"] = epoch_high
-
-        # Add statistics if requested
-        if include_statistics:
-            result["statistics"] = OrderbookMetric.calculate_statistics(
-                result["data"],
-                metric
-            )
+    # Get the shared API client and fetch data (will use env vars if not provided)
+    client = get_metrics_client(base_url=api_base_url, api_key=api_key)
+
+    raw_data = await client.fetch_orderbook_metric(
+        metric=metric,
+        symbol=symbol,
+        exchange=exchange,
+        timeframe=timeframe,
+        volume=volume,
+        epoch_low=epoch_low,
+        epoch_high=epoch_high
+    )
 
-        return result
+    if raw:
+        return offload_large_field(_raw_metric_response(metric, raw_data), "data")
+
+    # Format response
+    result = OrderbookMetric.format_response(raw_data, metric)
+
+    # Add request metadata
+    result["symbol"] = symbol
+    result["exchange"] = OrderbookMetric.normalize_exchange(exchange)
+    result["timeframe"] = timeframe
+    result["volume"] = volume.lower()
+    result["epoch_low"] = epoch_low
+    result["epoch_high"] = epoch_high
+
+    # Add statistics if requested
+    if include_statistics:
+        result["statistics"] = OrderbookMetric.calculate_statistics(
+            result["data"],
+            metric
+        )
 
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
+    return offload_large_field(_metric_layout(result, columnar), "data")
 
 
-@mcp.tool
-def get_jlabs_metric(
+@_metric_tool("metric", "symbol")
+async def get_jlabs_metric(
     metric: str,
     symbol: str,
     time_delta: int,
@@ -1895,7 +1868,9 @@ def get_jlabs_metric(
     end_epoch: int,
     api_base_url: Optional[str] = None,
     api_key: Optional[str] = None,
-    include_statistics: bool = True
+    include_statistics: bool = True,
+    raw: bool = False,
+    columnar: bool = False
 ) -> dict:
     """
     Fetch JLabs V1 metrics (slippage or price_equilibrium) from panda-backend-api.
@@ -1921,6 +1896,10 @@ def get_jlabs_metric(
         api_base_url: Base URL for panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
         api_key: API key for authentication (defaults to PANDA_API_KEY env var)
         include_statistics: Include statistical summary (default: True)
+        raw: Return the backend response as-is under "data", skipping reformatting,
+             request metadata and statistics (default: False)
+        columnar: Return "data" as one list per field (e.g., {"t": [...], "value": [...]})
+                  instead of a list of points (default: False)
 
     Returns:
         Dictionary containing metric data with timestamps and values
@@ -1976,94 +1955,50 @@ def get_jlabs_metric(
             - Lower values = Less stable, potential for volatility
             - Use to identify support/resistance levels
     """
-    try:
-        # Validate parameters
-        try:
-            JLabsAnalytics.validate_params(
-                metric=metric,
-                symbol=symbol,
-                time_delta=time_delta,
-                start_epoch=start_epoch,
-                end_epoch=end_epoch
-            )
-        except ValueError as e:
-            return {
-                "error": "Invalid input",
-                "error_type": "ValueError",
-                "message": str(e),
-                "metric": metric,
-                "symbol": symbol
-            }
+    # Validate parameters (errors become Invalid input responses)
+    JLabsAnalytics.validate_params(
+        metric=metric,
+        symbol=symbol,
+        time_delta=time_delta,
+        start_epoch=start_epoch,
+        end_epoch=end_epoch
+    )
 
-        # Create API client and fetch data (will use env vars if not provided)
-        try:
-            client = PandaMetricsClient(base_url=api_base_url, api_key=api_key)
-        except ValueError as e:
-            return {
-                "error": "Configuration error",
-                "error_type": "ValueError",
-                "message": str(e),
-                "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
-            }
+    # Get the shared API client and fetch data (will use env vars if not provided)
+    client = get_metrics_client(base_url=api_base_url, api_key=api_key)
 
-        with client:
-            raw_data = client.fetch_jlabs_v1_metric(
-                metric=metric,
-                symbol=symbol,
-                time_delta=time_delta,
-                start_epoch=start_epoch,
-                end_epoch=end_epoch
-            )
+    raw_data = await client.fetch_jlabs_v1_metric(
+        metric=metric,
+        symbol=symbol,
+        time_delta=time_delta,
+        start_epoch=start_epoch,
+        end_epoch=end_epoch
+    )
 
-        # Format response
-        result = JLabsAnalytics.format_response(raw_data, metric)
+    if raw:
+        return _raw_metric_response(metric, raw_data)
 
-        # Add request metadata
-        result["symbol"] = symbol
-        result["time_delta"] = time_delta
-        result["start_epoch"] = start_epoch
-        result["end_epoch"] = end_epoch
+    # Format response
+    result = JLabsAnalytics.format_response(raw_data, metric)
 
-        # Add statistics if requested
-        if include_statistics:
-            result["statistics"] = JLabsAnalytics.calculate_statistics(
-                result["data"],
-                metric
-            )
+    # Add request metadata
+    result["symbol"] = symbol
+    result["time_delta"] = time_delta
+    result["start_epoch"] = start_epoch
+    result["end_epoch"] = end_epoch
 
-        return result
+    # Add statistics if requested
+    if include_statistics:
+        result["statistics"] = JLabsAnalytics.calculate_statistics(
+            result["data"],
+            metric
+        )
 
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
+    return _metric_layout(result, columnar)
 
 
-@mcp.tool
-def get_orderflow_metric(
+@_metric_tool("metric", "symbol", "exchange")
+async def get_orderflow_metric(
     metric: str,
     symbol: str,
     exchange: str,
@@ -2073,7 +2008,9 @@ def get_orderflow_metric(
     epoch_high: int,
     api_base_url: Optional[str] = None,
     api_key: Optional[str] = None,
-    include_statistics: bool = True
+    include_statistics: bool = True,
+    raw: bool = False,
+    columnar: bool = False
 ) -> dict:
     """
     Fetch orderflow/tradebook metrics from panda-backend-api.
@@ -2104,6 +2041,10 @@ def get_orderflow_metric(
         api_base_url: Base URL for panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
         api_key: API key for authentication (defaults to PANDA_API_KEY env var)
         include_statistics: Include statistical summary (default: True)
+        raw: Return the backend response as-is under "data", skipping reformatting,
+             request metadata and statistics (default: False)
+        columnar: Return "data" as one list per field (e.g., {"t": [...], "value": [...]})
+                  instead of a list of points (default: False)
 
     Returns:
         Dictionary containing orderflow metric data with timestamps and values
@@ -2170,102 +2111,57 @@ def get_orderflow_metric(
             - Falling CVD = Distribution
             - CVD divergence from price = potential reversal
     """
-    try:
-        # Validate parameters
-        try:
-            OrderflowMetric.validate_params(
-                metric=metric,
-                symbol=symbol,
-                exchange=exchange,
-                timeframe=timeframe,
-                volume=volume,
-                epoch_low=epoch_low,
-                epoch_high=epoch_high
-            )
-        except ValueError as e:
-            return {
-                "error": "Invalid input",
-                "error_type": "ValueError",
-                "message": str(e),
-                "metric": metric,
-                "symbol": symbol,
-                "exchange": exchange
-            }
-
-        # Create API client and fetch data (will use env vars if not provided)
-        try:
-            client = PandaMetricsClient(base_url=api_base_url, api_key=api_key)
-        except ValueError as e:
-            return {
-                "error": "Configuration error",
-                "error_type": "ValueError",
-                "message": str(e),
-                "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
-            }
-
-        with client:
-            raw_data = client.fetch_orderflow_metric(
-                metric=metric,
-                symbol=symbol,
-                exchange=exchange,
-                timeframe=timeframe,
-                volume=volume,
-                epoch_low=epoch_low,
-                epoch_high=epoch_high
-            )
-
-        # Format response
-        result = OrderflowMetric.format_response(raw_data, metric)
+    # Validate parameters (errors become Invalid input responses)
+    OrderflowMetric.validate_params(
+        metric=metric,
+        symbol=symbol,
+        exchange=exchange,
+        timeframe=timeframe,
+        volume=volume,
+        epoch_low=epoch_low,
+        epoch_high=epoch_high
+    )
 
-        # Add request metadata
-        result["symbol"] = symbol
-        result["exchange"] = OrderflowMetric.normalize_exchange(exchange)
-        result["timeframe"] = timeframe
-        result["volume"] = volume.lower()
-        result["volume_interpretation"] = OrderflowMetric.get_volume_interpretation(volume)
-        result["epoch_low"] = epoch_low
-        result["epoch_high"] = epoch_high
-
-        # Add statistics if requested
-        if include_statistics:
-            result["statistics"] = OrderflowMetric.calculate_statistics(
-                result["data"],
-                metric
-            )
+    # Get the shared API client and fetch data (will use env vars if not provided)
+    client = get_metrics_client(base_url=api_base_url, api_key=api_key)
+
+    raw_data = await client.fetch_orderflow_metric(
+        metric=metric,
+        symbol=symbol,
+        exchange=exchange,
+        timeframe=timeframe,
+        volume=volume,
+        epoch_low=epoch_low,
+        epoch_high=epoch_high
+    )
 
-        return result
+    if raw:
+        return _raw_metric_response(metric, raw_data)
+
+    # Format response
+    result = OrderflowMetric.format_response(raw_data, metric)
+
+    # Add request metadata
+    result["symbol"] = symbol
+    result["exchange"] = OrderflowMetric.normalize_exchange(exchange)
+    result["timeframe"] = timeframe
+    result["volume"] = volume.lower()
+    result["volume_interpretation"] = OrderflowMetric.get_volume_interpretation(volume)
+    result["epoch_low"] = epoch_low
+    result["epoch_high"] = epoch_high
+
+    # Add statistics if requested
+    if include_statistics:
+        result["statistics"] = OrderflowMetric.calculate_statistics(
+            result["data"],
+            metric
+        )
 
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "metric": metric,
-            "symbol": symbol
-        }
+    return _metric_layout(result, columnar)
 
 
-@mcp.tool
-def get_jlabs_model(
+@_metric_tool("metric")
+async def get_jlabs_model(
     metric: Literal["cari", "dxy_risk", "rosi", "token_rating"],
     timeframe: str,
     symbol: Optional[str] = None,
@@ -2275,7 +2171,9 @@ def get_jlabs_model(
     api_version: Literal["v1", "v2", "v3"] = "v1",
     api_base_url: Optional[str] = None,
     api_key: Optional[str] = None,
-    include_statistics: bool = True
+    include_statistics: bool = True,
+    raw: bool = False,
+    columnar: bool = False
 ) -> dict:
     """
     Fetch JLabs proprietary models (CARI, DXY Risk, ROSI, Token Rating) from panda-backend-api.
@@ -2310,6 +2208,10 @@ def get_jlabs_model(
         api_base_url: Base URL for panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
         api_key: API key for authentication (defaults to PANDA_API_KEY env var)
         include_statistics: Include statistical summary (default: True)
+        raw: Return the backend response as-is under "data", skipping reformatting,
+             request metadata and statistics (default: False)
+        columnar: Return "data" as one list per field (e.g., {"t": [...], "value": [...]})
+                  instead of a list of points (default: False)
 
     Returns:
         Dictionary containing model data with timestamps and values
@@ -2383,105 +2285,140 @@ def get_jlabs_model(
             6-8: Strong
             > 8: Very Strong
     """
-    try:
-        # Strip USDT suffix from symbol if provided
-        if symbol:
-            symbol = JLabsModels.strip_usdt_suffix(symbol)
+    # Strip USDT suffix from symbol if provided
+    if symbol:
+        symbol = JLabsModels.strip_usdt_suffix(symbol)
+
+    # Validate parameters (errors become Invalid input responses)
+    JLabsModels.validate_params(
+        metric=metric,
+        symbol=symbol,
+        timeframe=timeframe,
+        start_epoch=start_epoch,
+        end_epoch=end_epoch,
+        metric_param=metric_param,
+        api_version=api_version
+    )
 
-        # Validate parameters
-        try:
-            JLabsModels.validate_params(
-                metric=metric,
-                symbol=symbol,
-                timeframe=timeframe,
-                start_epoch=start_epoch,
-                end_epoch=end_epoch,
-                metric_param=metric_param,
-                api_version=api_version
-            )
-        except ValueError as e:
-            return {
-                "error": "Invalid input",
-                "error_type": "ValueError",
-                "message": str(e),
-                "metric": metric
-            }
+    # Get the shared API client and fetch data (will use env vars if not provided)
+    client = get_metrics_client(base_url=api_base_url, api_key=api_key)
+
+    # Fetch data based on API version
+    if api_version == "v1":
+        raw_data = await client.fetch_jlabs_proprietary_v1(
+            metric=metric,
+            symbol=symbol,
+            timeframe=timeframe,
+            start_epoch=start_epoch,
+            end_epoch=end_epoch
+        )
+    else:  # v2 or v3
+        raw_data = await client.fetch_jlabs_proprietary_v2(
+            metric=metric,
+            token=symbol,
+            timeframe=timeframe,
+            version=int(api_version[1:]),
+            metric_param=metric_param
+        )
 
-        # Create API client and fetch data (will use env vars if not provided)
-        try:
-            client = PandaMetricsClient(base_url=api_base_url, api_key=api_key)
-        except ValueError as e:
-            return {
-                "error": "Configuration error",
-                "error_type": "ValueError",
-                "message": str(e),
-                "hint": "Set PANDA_BACKEND_API_URL in .env file or provide api_base_url parameter"
-            }
+    if raw:
+        return _raw_metric_response(metric, raw_data)
 
-        with client:
-            # Fetch data based on API version
-            if api_version == "v1":
-                raw_data = client.fetch_jlabs_proprietary_v1(
-                    metric=metric,
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    start_epoch=start_epoch,
-                    end_epoch=end_epoch
-                )
-                result = JLabsModels.format_response_v1(raw_data, metric)
-            else:  # v2 or v3
-                raw_data = client.fetch_jlabs_proprietary_v2(
-                    metric=metric,
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    metric_param=metric_param,
-                    api_version=api_version
-                )
-                result = JLabsModels.format_response_v2(raw_data, metric, metric_param)
-
-        # Add request metadata
-        result["timeframe"] = timeframe
-        if symbol:
-            result["symbol"] = symbol
-        if start_epoch:
-            result["start_epoch"] = start_epoch
-        if end_epoch:
-            result["end_epoch"] = end_epoch
-
-        # Add statistics if requested
-        if include_statistics and result.get("data"):
-            result["statistics"] = JLabsModels.calculate_statistics(
-                result["data"],
-                metric,
-                api_version
-            )
+    # Format response
+    if api_version == "v1":
+        result = JLabsModels.format_response_v1(raw_data, metric)
+    else:
+        result = JLabsModels.format_response_v2(raw_data, metric, metric_param)
 
-        return result
+    # Add request metadata
+    result["timeframe"] = timeframe
+    if symbol:
+        result["symbol"] = symbol
+    if start_epoch:
+        result["start_epoch"] = start_epoch
+    if end_epoch:
+        result["end_epoch"] = end_epoch
 
-    except ValueError as e:
-        # User input error
-        return {
-            "error": "Invalid input",
-            "error_type": "ValueError",
-            "message": str(e),
-            "metric": metric
-        }
-    except httpx.HTTPError as e:
-        # Network or API error
-        return {
-            "error": "API request failed",
-            "error_type": "HTTPError",
-            "message": str(e),
-            "metric": metric
-        }
-    except Exception as e:
-        # Unexpected error
-        return {
-            "error": "Unexpected error",
-            "error_type": type(e).__name__,
-            "message": str(e),
-            "metric": metric
+    # Add statistics if requested
+    if include_statistics and result.get("data"):
+        result["statistics"] = JLabsModels.calculate_statistics(
+            result["data"],
+            metric,
+            api_version
+        )
+
+    return _metric_layout(result, columnar)
+
+
+# Metric tools callable from get_metrics_batch, by tool name. validate_call
+# applies the same argument validation and coercion as a direct MCP call;
+# a ValidationError is a ValueError, so it is reported as invalid input
+METRIC_TOOLS = {
+    tool.name: validate_call(tool.fn)
+    for tool in (
+        get_divine_dip_metric,
+        get_orderbook_metric,
+        get_jlabs_metric,
+        get_orderflow_metric,
+        get_jlabs_model,
+    )
+}
+MAX_METRIC_BATCH = 20
+
+
+@mcp.tool
+@tool_errors()
+async def get_metrics_batch(requests: List[dict]) -> dict:
+    """
+    Run several metric tool calls concurrently and return all their results.
+
+    Each request names one of the metric tools and its arguments. The calls
+    run in parallel, so the batch takes about as long as the slowest call.
+    Each result is exactly what the individual tool would have returned,
+    including its error response if that call failed.
+
+    Args:
+        requests: List of {"tool": <metric tool name>, "arguments": {...}} items
+                  (at most 20). Tools: get_divine_dip_metric, get_orderbook_metric,
+                  get_jlabs_metric, get_orderflow_metric, get_jlabs_model
+
+    Returns:
+        Dictionary with the number of requests and the results in request order
+
+    Example:
+        get_metrics_batch([
+            {"tool": "get_orderbook_metric", "arguments": {
+                "metric": "bid_ask_ratio", "symbol": "BTCUSDT", "exchange": "binance-futures",
+                "timeframe": "1D", "volume": "0-1", "epoch_low": 1628360700,
+                "epoch_high": 1763317860}},
+            {"tool": "get_orderflow_metric", "arguments": {
+                "metric": "trade_vol", "symbol": "BTCUSDT", "exchange": "binance-futures",
+                "timeframe": "4H", "volume": "0-1k", "epoch_low": 1758110100,
+                "epoch_high": 1763249400}}
+        ])
+        Returns: {
+            "count": 2,
+            "results": [{"metric": "bid_ask_ratio", ...}, {"metric": "trade_vol", ...}]
         }
+    """
+    if len(requests) > MAX_METRIC_BATCH:
+        raise ValueError(f"At most {MAX_METRIC_BATCH} requests are allowed per batch")
+
+    # Every failure, including bad arguments, becomes that request's error
+    # response; the other requests still run
+    @tool_errors("tool")
+    async def run(tool: Optional[str], arguments: dict) -> dict:
+        tool_fn = METRIC_TOOLS.get(tool)
+        if tool_fn is None:
+            raise ValueError(f"Unknown metric tool: {tool}. Supported: {', '.join(METRIC_TOOLS)}")
+        if not isinstance(arguments, dict):
+            raise ValueError("'arguments' must be an object of tool arguments")
+        return await tool_fn(**arguments)
+
+    results = await asyncio.gather(
+        *(run(request.get("tool"), request.get("arguments", {})) for request in requests)
+    )
+    return {"count": len(results), "results": results}
 
 
 # ============================================================================
@@ -2496,12 +2433,11 @@ def get_exchanges_resource() -> str:
     Returns:
         JSON string with exchange information
     """
-    result = list_supported_exchanges()
-    return json.dumps(result, indent=2)
+    return EXCHANGES_JSON
 
 
 @mcp.resource("exchange://{exchange}/{market}/active")
-def get_active_pairs_resource(exchange: str, market: str) -> str:
+async def get_active_pairs_resource(exchange: str, market: str) -> str:
     """
     MCP Resource: Active trading pairs for a specific exchange and market
 
@@ -2512,13 +2448,13 @@ def get_active_pairs_resource(exchange: str, market: str) -> str:
     Returns:
         JSON string with active trading pairs
     """
-    # Resources use tools which already handle context management
-    result = get_trading_pairs(exchange, market, "active")
-    return json.dumps(result, indent=2)
+    # Resources reuse the tool implementation, which handles context management
+    result = await get_trading_pairs.fn(exchange, market, "active")
+    return dumps_bytes(result, pretty=True).decode()
 
 
 @mcp.resource("exchange://{exchange}/{market}/inactive")
-def get_inactive_pairs_resource(exchange: str, market: str) -> str:
+async def get_inactive_pairs_resource(exchange: str, market: str) -> str:
     """
     MCP Resource: Inactive trading pairs for a specific exchange and market
 
@@ -2529,14 +2465,28 @@ def get_inactive_pairs_resource(exchange: str, market: str) -> str:
     Returns:
         JSON string with inactive trading pairs
     """
-    # Resources use tools which already handle context management
-    result = get_trading_pairs(exchange, market, "inactive")
-    return json.dumps(result, indent=2)
+    # Resources reuse the tool implementation, which handles context management
+    result = await get_trading_pairs.fn(exchange, market, "inactive")
+    return dumps_bytes(result, pretty=True).decode()
+
+
+# The health body never changes, so it is serialized once
+HEALTH_BODY = dumps_bytes({"status": "healthy", "service": "mcp-server"})
 
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
-    return JSONResponse({"status": "healthy", "service": "mcp-server"})
+    return Response(HEALTH_BODY, media_type="application/json")
+
+
+@mcp.custom_route(PAYLOAD_ROUTE + "/{payload_id}", methods=["GET"])
+async def get_payload(request):
+    """Stream a tool result field that was too large to return inline"""
+    path = get_payload_path(request.path_params["payload_id"])
+    if path is None:
+        return JSONResponse({"error": "Payload not found or expired"}, status_code=404)
+    # Sent from disk in chunks, so large kline dumps are never held in memory
+    return FileResponse(path, media_type="application/json")
 
 
 
@@ -2556,4 +2506,64 @@ async def health_check(request):
 #         "scope": token.claims.get("scope")
 #     }
 
-app = mcp.http_app(middleware=middleware)
\ No newline at end of file
+app = mcp.http_app(middleware=list(middleware))
+
+# Exchange/market pairs prefetched at startup so the first user request is a cache hit.
+# Opt-in via PANDA_WARMUP: every worker runs its own warmup and the per-worker
+# rate limiters cannot see each other, so src.server only enables it for one worker
+WARMUP_ENABLED = os.getenv("PANDA_WARMUP", "false").lower() in ("1", "true", "yes")
+WARMUP_PAIRS = (
+    ("binance", "spot"),
+    ("binance", "futures"),
+    ("bybit", "spot"),
+    ("bybit", "futures"),
+    ("hyperliquid", "spot"),
+    ("hyperliquid", "futures"),
+)
+WARMUP_CONCURRENCY = 4
+
+
+async def _warmup_pairs() -> None:
+    """
+    Prefetch trading pairs for WARMUP_PAIRS to seed the pair caches
+
+    Failures are logged and otherwise ignored; the next request simply
+    fetches the pairs itself.
+    """
+    semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
+
+    async def warm(exchange: str, market: str) -> None:
+        async with semaphore:
+            await ExchangeFactory.get(exchange).fetch_all_pairs(market)
+
+    results = await asyncio.gather(
+        *(warm(exchange, market) for exchange, market in WARMUP_PAIRS),
+        return_exceptions=True
+    )
+    for (exchange, market), result in zip(WARMUP_PAIRS, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Warmup failed for {exchange} {market}: {result}")
+    logger.info("Trading pair warmup finished")
+
+
+# The FastMCP server lifespan runs once per MCP session, so the shared HTTP
+# client is closed from the ASGI app lifespan instead (once per worker).
+_mcp_app_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def _app_lifespan(starlette_app):
+    async with _mcp_app_lifespan(starlette_app):
+        # Runs in the background so startup is not blocked on the exchanges
+        warmup = asyncio.create_task(_warmup_pairs()) if WARMUP_ENABLED else None
+        try:
+            yield
+        finally:
+            if warmup is not None:
+                warmup.cancel()
+            ExchangeFactory.clear_instances()
+            await close_http_client()
+            close_metrics_clients()
+
+
+app.router.lifespan_context = _app_lifespan
\ No newline at end of file
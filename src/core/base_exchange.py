@@ -4,66 +4,212 @@ Abstract base class for cryptocurrency exchange adapters
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Optional
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional, Union
+from urllib.parse import urlsplit
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 import logging
-import time
+import os
+from .http_client import DEFAULT_HEADERS, DEFAULT_LIMITS, DEFAULT_TIMEOUT, http_retry
+from .rate_limiter import RateLimiter
+from ..utils.cache import get_cache
+from ..utils.serialization import loads
 
 logger = logging.getLogger(__name__)
 
 
+def to_number(value) -> Optional[float]:
+    """
+    Convert a numeric string from an exchange API to a float
+
+    Args:
+        value: Numeric string or number (None or '' when the field is empty)
+
+    Returns:
+        Float value, or None for empty fields
+    """
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def group_by_symbol(records: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Split records from an all-symbols endpoint into per-symbol lists
+
+    Args:
+        records: Parsed records, each with a 'symbol' key
+
+    Returns:
+        Dictionary mapping each symbol to its records, in their original order
+
+    Example:
+        group_by_symbol([{"symbol": "BTCUSDT", ...}, {"symbol": "ETHUSDT", ...}])
+        Returns: {"BTCUSDT": [{...}], "ETHUSDT": [{...}]}
+    """
+    grouped = defaultdict(list)
+    for record in records:
+        grouped[record["symbol"]].append(record)
+    return dict(grouped)
+
+
+# Token buckets for hosts with a RATE_LIMITS entry, keyed on host. Buckets
+# live in process memory and are not shared between uvicorn workers, so each
+# worker budgets for an equal share of the per-IP limit
+_rate_limiters: Dict[str, RateLimiter] = {}
+RATE_LIMIT_WORKERS = max(int(os.getenv("WEB_CONCURRENCY") or 1), 1)
+
+# In-flight fetch_all_pairs calls, keyed on (adapter class name, market type)
+_inflight_pairs: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
 class BaseExchange(ABC):
     """Abstract base class for exchange implementations"""
 
-    def __init__(self, db_handler=None, cache_ttl: int = 60):
+    # Instance attributes; subclasses declare their own __slots__ as well
+    __slots__ = ("db_handler", "_client", "_owns_client", "cache_ttl", "_pairs_cache")
+
+    # Features implemented by the adapter, checked by tools before dispatch:
+    # pairs, klines, funding_history, funding_info, open_interest,
+    # open_interest_history, market_data
+    CAPABILITIES: FrozenSet[str] = frozenset({"pairs"})
+
+    # Market types served by process_<market> methods, and their lookup set
+    SUPPORTED_MARKETS: Tuple[str, ...] = ()
+    SUPPORTED_MARKET_SET: FrozenSet[str] = frozenset()
+
+    # Client-side rate limiting: request weight allowed per minute by host,
+    # weight of each endpoint path, and the response header reporting the
+    # weight already used (see _throttle)
+    RATE_LIMITS: Dict[str, int] = {}
+    REQUEST_WEIGHTS: Dict[str, int] = {}
+    USED_WEIGHT_HEADER: Optional[str] = None
+
+    # process_<market> methods by market type, collected per subclass
+    _market_processors: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the subclass's process_<market> methods into _market_processors"""
+        super().__init_subclass__(**kwargs)
+        prefix = "process_"
+        cls._market_processors = {
+            name[len(prefix):]: method
+            for klass in reversed(cls.__mro__)
+            for name, method in vars(klass).items()
+            if name.startswith(prefix) and callable(method)
+        }
+
+    def __init__(
+        self,
+        db_handler=None,
+        cache_ttl: int = 60,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize base exchange handler
 
         Args:
             db_handler: Optional database handler for querying pair metadata
             cache_ttl: Cache time-to-live in seconds (default: 60)
+            http_client: Optional shared async HTTP client. When provided the
+                exchange borrows it and never closes it.
         """
         self.db_handler = db_handler
-        self._client: Optional[httpx.Client] = None
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, Tuple[float, Dict]] = {}  # {market_type: (timestamp, data)}
+        # Pair lists are cached per adapter class and TTL, so instances of an
+        # exchange share entries without one instance's TTL overriding another's
+        self._pairs_cache = get_cache(
+            f"exchange_pairs:{type(self).__name__}:{cache_ttl}", ttl=cache_ttl
+        )
 
     @property
-    def client(self) -> httpx.Client:
-        """Lazy-initialized HTTP client"""
+    def client(self) -> httpx.AsyncClient:
+        """
+        Lazy-initialized async HTTP client
+
+        Instances from ExchangeFactory.get() borrow the shared client; a
+        standalone instance gets its own pool with the same timeout, HTTP/2
+        and keepalive settings.
+        """
         if self._client is None:
-            self._client = httpx.Client(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_TIMEOUT,
+                limits=DEFAULT_LIMITS,
+                headers=DEFAULT_HEADERS,
+                http2=True
+            )
+            self._owns_client = True
         return self._client
 
-    def close(self):
-        """Explicitly close the HTTP client"""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+    async def close(self):
+        """Close the HTTP client if this exchange owns it"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
 
-    def __enter__(self):
-        """Context manager entry"""
+    async def __aenter__(self):
+        """Async context manager entry"""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - ensures client cleanup"""
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - ensures owned client cleanup"""
+        await self.close()
         return False
 
-    def __del__(self):
-        """Cleanup fallback - should not be relied upon"""
-        if hasattr(self, '_client') and self._client is not None:
-            try:
-                self._client.close()
-            except Exception:
-                pass  # Silently ignore errors during cleanup
+    async def _throttle(self, url: str) -> None:
+        """
+        Wait for rate-limit budget before requesting url
+
+        Hosts listed in RATE_LIMITS share one token bucket per process; each
+        request debits the weight given by _request_weight. Requests to other
+        hosts are not limited. The bucket holds 1/RATE_LIMIT_WORKERS of the
+        host's limit, since the limit applies to the IP and every worker
+        process keeps its own bucket.
+
+        Args:
+            url: API endpoint URL about to be requested
+        """
+        parts = urlsplit(url)
+        limit = self.RATE_LIMITS.get(parts.netloc)
+        if limit is None:
+            return
+        limiter = _rate_limiters.get(parts.netloc)
+        if limiter is None:
+            share = limit // RATE_LIMIT_WORKERS
+            limiter = _rate_limiters[parts.netloc] = RateLimiter(share, share / 60)
+        await limiter.acquire(self._request_weight(parts.path, parts.query))
+
+    def _request_weight(self, path: str, query: str) -> int:
+        """
+        Get the rate-limit weight of a request
+
+        Adapters override this for endpoints whose weight depends on the
+        query (e.g., on the number of rows requested).
+
+        Args:
+            path: URL path of the request
+            query: URL query string of the request
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
-    def _fetch_with_retry(self, url: str) -> dict:
+        Returns:
+            The REQUEST_WEIGHTS entry for the path (default 1)
+        """
+        return self.REQUEST_WEIGHTS.get(path, 1)
+
+    def _sync_rate_limit(self, response: httpx.Response) -> None:
+        """Align the host's token bucket with the used weight reported by the server"""
+        if self.USED_WEIGHT_HEADER is None:
+            return
+        limiter = _rate_limiters.get(response.url.host)
+        used = response.headers.get(self.USED_WEIGHT_HEADER)
+        if limiter is not None and used is not None and used.isdigit():
+            # The header counts the whole IP; charge this worker its share
+            limiter.sync_used(-(-int(used) // RATE_LIMIT_WORKERS))
+
+    @http_retry
+    async def _fetch_with_retry(self, url: str) -> dict:
         """
         Fetch data from URL with retry logic
 
@@ -77,11 +223,34 @@ class BaseExchange(ABC):
             httpx.HTTPError: If request fails after retries
         """
         logger.info(f"Fetching data from: {url}")
-        response = self.client.get(url)
+        await self._throttle(url)
+        response = await self.client.get(url)
+        self._sync_rate_limit(response)
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
-    def fetch_symbols_retry(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
+    @http_retry
+    async def _fetch_bytes_with_retry(self, url: str) -> bytes:
+        """
+        Fetch the raw response body from URL with retry logic
+
+        Args:
+            url: API endpoint URL
+
+        Returns:
+            Response body bytes (decompressed, not parsed)
+
+        Raises:
+            httpx.HTTPError: If request fails after retries
+        """
+        logger.info(f"Fetching raw data from: {url}")
+        await self._throttle(url)
+        response = await self.client.get(url)
+        self._sync_rate_limit(response)
+        response.raise_for_status()
+        return response.content
+
+    async def fetch_symbols_retry(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Wrapper for fetch_symbols_from_exchange with consistent interface
 
@@ -92,10 +261,10 @@ class BaseExchange(ABC):
         Returns:
             Tuple of (trading_symbols, non_trading_symbols)
         """
-        return self.fetch_symbols_from_exchange(url, exchange)
+        return await self.fetch_symbols_from_exchange(url, exchange)
 
     @abstractmethod
-    def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
+    async def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Fetch trading and non-trading symbols from exchange API
 
@@ -110,7 +279,6 @@ class BaseExchange(ABC):
         pass
 
     @classmethod
-    @abstractmethod
     def get_supported_markets(cls) -> List[str]:
         """
         Get list of supported market types for this exchange
@@ -118,9 +286,9 @@ class BaseExchange(ABC):
         Returns:
             List of market identifiers (e.g., ['spot', 'futures'])
         """
-        pass
+        return list(cls.SUPPORTED_MARKETS)
 
-    def fetch_klines(
+    async def fetch_klines(
         self,
         symbol: str,
         interval: str,
@@ -151,6 +319,57 @@ class BaseExchange(ABC):
             f"Kline fetching not implemented for {self.__class__.__name__}"
         )
 
+    async def fetch_klines_many(
+        self,
+        symbols: List[str],
+        interval: str,
+        market: str = "spot",
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 500,
+        concurrency: int = 8
+    ) -> List[Union[List[Dict], Exception]]:
+        """
+        Fetch klines for several symbols concurrently
+
+        At most `concurrency` requests are in flight at once, keeping bursts
+        below the exchange's request-weight limits. A failed symbol does not
+        abort the others.
+
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT'])
+            interval: Kline interval (e.g., '1m', '5m', '1h', '1d')
+            market: Market type (default: 'spot')
+            start_time: Start time in milliseconds (optional)
+            end_time: End time in milliseconds (optional)
+            limit: Number of klines to fetch per symbol (default: 500)
+            concurrency: Maximum concurrent requests (default: 8)
+
+        Returns:
+            One entry per symbol, in order: the symbol's klines as returned
+            by fetch_klines, or the exception its fetch raised
+
+        Example:
+            results = await exchange.fetch_klines_many(['BTCUSDT', 'ETHUSDT'], '1h')
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_symbol(symbol: str) -> List[Dict]:
+            async with semaphore:
+                return await self.fetch_klines(
+                    symbol=symbol,
+                    interval=interval,
+                    market=market,
+                    start_time=start_time,
+                    end_time=end_time,
+                    limit=limit
+                )
+
+        return await asyncio.gather(
+            *(fetch_symbol(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+
     def generate_symbol_updates_with_non_trading(
         self,
         exchange: str,
@@ -192,7 +411,7 @@ class BaseExchange(ABC):
 
         return active, inactive
 
-    def fetch_all_pairs(self, market_type: str, use_cache: bool = True) -> Dict[str, List[Dict]]:
+    async def fetch_all_pairs(self, market_type: str, use_cache: bool = True) -> Dict[str, List[Dict]]:
         """
         Fetch all pairs for a given market type with optional caching
 
@@ -201,36 +420,54 @@ class BaseExchange(ABC):
             use_cache: Whether to use cached data if available (default: True)
 
         Returns:
-            Dictionary with 'active' and 'inactive' keys containing pair lists
+            Dictionary with 'active' and 'inactive' keys containing pair lists;
+            the lists and pair dicts are copies, so callers may modify them
         """
-        if market_type not in self.__class__.get_supported_markets():
+        if market_type not in self.SUPPORTED_MARKET_SET:
             raise ValueError(
                 f"Unsupported market type '{market_type}'. "
-                f"Supported markets: {self.__class__.get_supported_markets()}"
+                f"Supported markets: {self.get_supported_markets()}"
             )
 
         # Check cache
-        if use_cache and market_type in self._cache:
-            timestamp, cached_data = self._cache[market_type]
-            if time.time() - timestamp < self.cache_ttl:
+        if use_cache:
+            cached_data = self._pairs_cache.get(market_type)
+            if cached_data is not None:
                 logger.info(f"Using cached data for {market_type}")
-                return cached_data
+                return self._copy_pairs(cached_data)
 
         # Use the specific market processing method
-        method_name = f"process_{market_type}"
-        if not hasattr(self, method_name):
-            raise NotImplementedError(f"Method {method_name} not implemented")
+        method = self._market_processors.get(market_type)
+        if method is None:
+            raise NotImplementedError(f"Method process_{market_type} not implemented")
+
+        # Concurrent fetches of the same market share one upstream call
+        key = (type(self).__name__, market_type)
+        task = _inflight_pairs.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_pairs(method.__get__(self)))
+            _inflight_pairs[key] = task
+            task.add_done_callback(lambda _: _inflight_pairs.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight pair fetch for {market_type}")
+        result = await asyncio.shield(task)
+
+        # Update cache
+        if use_cache:
+            self._pairs_cache.set(market_type, result)
+
+        return self._copy_pairs(result)
 
-        method = getattr(self, method_name)
-        active, inactive = method()
+    @staticmethod
+    def _copy_pairs(pairs: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+        """Copy the pair lists and their (flat) pair dicts so callers never share the cached ones"""
+        return {status: [dict(pair) for pair in items] for status, items in pairs.items()}
 
-        result = {
+    @staticmethod
+    async def _fetch_pairs(method) -> Dict[str, List[Dict]]:
+        """Run a process_<market> method and shape its result"""
+        active, inactive = await method()
+        return {
             "active": active,
             "inactive": inactive
         }
-
-        # Update cache
-        if use_cache:
-            self._cache[market_type] = (time.time(), result)
-
-        return result
@@ -4,7 +4,9 @@ Registry and factory for managing exchange adapters
 """
 
 from typing import Dict, Type, List
+import threading
 from .base_exchange import BaseExchange
+from .http_client import get_http_client
 from ..exchanges.binance import BinanceExchange
 from ..exchanges.bybit import BybitExchange
 from ..exchanges.hyperliquid import HyperliquidExchange
@@ -14,6 +16,9 @@ class ExchangeFactory:
     """Factory for creating and managing exchange instances"""
 
     _registry: Dict[str, Type[BaseExchange]] = {}
+    _info: Dict[str, Dict] = {}  # get_exchange_info results, built at registration
+    _instances: Dict[str, BaseExchange] = {}
+    _instances_lock = threading.Lock()
 
     @classmethod
     def register(cls, name: str, exchange_class: Type[BaseExchange]) -> None:
@@ -24,16 +29,25 @@ class ExchangeFactory:
             name: Exchange name (e.g., 'binance')
             exchange_class: Exchange class that inherits from BaseExchange
         """
-        cls._registry[name.lower()] = exchange_class
+        key = name.lower()
+        cls._registry[key] = exchange_class
+        cls._info[key] = {
+            "name": key,
+            "class": exchange_class.__name__,
+            "supported_markets": exchange_class.get_supported_markets(),
+            "capabilities": sorted(exchange_class.CAPABILITIES),
+            "description": exchange_class.__doc__ or "No description available"
+        }
 
     @classmethod
-    def create(cls, name: str, db_handler=None) -> BaseExchange:
+    def create(cls, name: str, db_handler=None, http_client=None) -> BaseExchange:
         """
         Create an exchange instance
 
         Args:
             name: Exchange name (e.g., 'binance')
             db_handler: Optional database handler
+            http_client: Optional shared httpx.AsyncClient to borrow
 
         Returns:
             Exchange instance
@@ -47,7 +61,43 @@ class ExchangeFactory:
                 f"Exchange '{name}' not found. "
                 f"Available exchanges: {cls.list_exchanges()}"
             )
-        return exchange_class(db_handler)
+        return exchange_class(db_handler, http_client=http_client)
+
+    @classmethod
+    def get(cls, name: str) -> BaseExchange:
+        """
+        Get the long-lived exchange instance for this process
+
+        Instances are created once per exchange and share the process-wide
+        HTTP client, so connection pools and pair caches survive across
+        tool calls. The shared client is closed on application shutdown.
+
+        Args:
+            name: Exchange name (e.g., 'binance')
+
+        Returns:
+            Shared exchange instance
+
+        Raises:
+            ValueError: If exchange is not registered
+        """
+        key = name.lower()
+        instance = cls._instances.get(key)
+        if instance is not None and not instance.client.is_closed:
+            return instance
+
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None or instance.client.is_closed:
+                instance = cls.create(key, http_client=get_http_client())
+                cls._instances[key] = instance
+            return instance
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Drop all cached exchange instances (e.g., on application shutdown)"""
+        with cls._instances_lock:
+            cls._instances.clear()
 
     @classmethod
     def list_exchanges(cls) -> List[str]:
@@ -68,27 +118,18 @@ class ExchangeFactory:
             name: Exchange name
 
         Returns:
-            Dictionary with exchange information
+            Dictionary with exchange information (shared; do not modify)
 
         Raises:
             ValueError: If exchange is not registered
         """
-        exchange_class = cls._registry.get(name.lower())
-        if not exchange_class:
+        info = cls._info.get(name.lower())
+        if info is None:
             raise ValueError(
                 f"Exchange '{name}' not found. "
                 f"Available exchanges: {cls.list_exchanges()}"
             )
-
-        # Call classmethod directly without creating instance
-        markets = exchange_class.get_supported_markets()
-
-        return {
-            "name": name,
-            "class": exchange_class.__name__,
-            "supported_markets": markets,
-            "description": exchange_class.__doc__ or "No description available"
-        }
+        return info
 
 
 # Register available exchanges
@@ -0,0 +1,84 @@
+"""
+Shared HTTP Client
+Process-wide httpx.AsyncClient reused by every exchange adapter
+"""
+
+from typing import Optional
+import httpx
+import logging
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for the shared client
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=64,
+    max_connections=200,
+    keepalive_expiry=60
+)
+# Exchange metadata and kline responses are large, repetitive JSON; brotli and
+# zstd decoding come from the httpx[brotli,zstd] extras
+DEFAULT_HEADERS = {"Accept-Encoding": "br, zstd, gzip"}
+
+# Upstream statuses worth retrying; other 4xx responses fail immediately
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_ATTEMPTS = 3
+RETRY_MAX_WAIT = 10
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """
+    Check whether a failed request should be retried
+
+    Args:
+        exc: Exception raised by the request
+
+    Returns:
+        True for transport errors (timeouts, resets) and 429/5xx responses
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+# Full-jitter exponential backoff, so concurrent callers that failed together
+# do not retry in lockstep; the last error is re-raised once attempts run out
+http_retry = retry(
+    stop=stop_after_attempt(RETRY_ATTEMPTS),
+    wait=wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT),
+    retry=retry_if_exception(is_retryable),
+    reraise=True
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use
+
+    The client is created lazily so that each worker process builds its own
+    connection pool inside its own event loop.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        logger.info("Creating shared HTTP client")
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            headers=DEFAULT_HEADERS,
+            http2=True
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared async HTTP client if it was created"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,77 @@
+"""
+Rate Limiter
+Client-side token bucket that keeps exchange requests within their weight budget
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Async token bucket for weighted request limits
+
+    Each request debits its weight before it is sent; when the bucket is
+    empty the caller waits locally instead of being rejected with a 429.
+    Waiters are served in arrival order.
+
+    The bucket lives in process memory. Several server processes on one IP
+    each need a bucket sized to their share of the exchange's limit.
+
+    Example:
+        limiter = RateLimiter(capacity=2400, refill_per_sec=40)
+        await limiter.acquire(5)
+    """
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        """
+        Initialize a full bucket
+
+        Args:
+            capacity: Maximum weight that can be spent in a burst
+            refill_per_sec: Weight restored per second
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+        self._updated = now
+
+    async def acquire(self, weight: int = 1) -> None:
+        """
+        Wait until `weight` tokens are available and spend them
+
+        Args:
+            weight: Request weight (capped at the bucket capacity)
+        """
+        weight = min(weight, self.capacity)
+        # The lock is held while sleeping so later callers queue behind this one
+        async with self._lock:
+            self._refill()
+            if self._tokens < weight:
+                delay = (weight - self._tokens) / self.refill_per_sec
+                logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= weight
+
+    def sync_used(self, used: int) -> None:
+        """
+        Align the bucket with the weight the server reports as used
+
+        Only ever lowers the available tokens, so requests from other
+        processes sharing the same IP budget are accounted for.
+
+        Args:
+            used: Weight used in the current window, as reported by the server
+        """
+        self._refill()
+        self._tokens = min(self._tokens, max(self.capacity - used, 0))
@@ -3,36 +3,118 @@ Binance Exchange Adapter
 Handles both Spot and Futures markets for Binance
 """
 
+import asyncio
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional
-from ..core.base_exchange import BaseExchange
+from urllib.parse import parse_qs, urlencode
+from ..core.base_exchange import BaseExchange, to_number
+
+# REST endpoints (exchangeInfo URLs are per-instance spot_url/futures_url)
+_KLINES_URLS = {
+    "spot": "https://api.binance.com/api/v3/klines",
+    "futures": "https://fapi.binance.com/fapi/v1/klines",
+}
+_FUNDING_RATE_URL = "https://fapi.binance.com/fapi/v1/fundingRate"
+_FUNDING_INFO_URL = "https://fapi.binance.com/fapi/v1/fundingInfo"
+_OPEN_INTEREST_URL = "https://fapi.binance.com/fapi/v1/openInterest"
+_OPEN_INTEREST_HIST_URL = "https://fapi.binance.com/futures/data/openInterestHist"
+
+# Futures kline weight by limit: (exclusive upper bound, weight); above 1000 rows the weight is 10
+_FUTURES_KLINES_PATH = "/fapi/v1/klines"
+_FUTURES_KLINE_WEIGHTS = ((100, 1), (500, 2), (1001, 5))
+
+# Positions 0-10 of a Binance kline array (position 11 is an unused field)
+_KLINE_FIELDS = itemgetter(*range(11))
+
+# Fixed-length kline intervals in milliseconds ('1M' varies and cannot be paged)
+_INTERVAL_MS = {
+    "1s": 1_000,
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "3d": 259_200_000,
+    "1w": 604_800_000,
+}
+# Upper bound on pages per fetch_klines_paged call, kept well below Binance's request weight budget
+MAX_KLINE_PAGES = 100
 
 
 class BinanceExchange(BaseExchange):
     """Binance exchange implementation for Spot and Futures markets"""
 
-    def __init__(self, db_handler=None):
+    CAPABILITIES = frozenset({
+        "pairs",
+        "klines",
+        "klines_raw",
+        "klines_paged",
+        "funding_history",
+        "funding_info",
+        "open_interest",
+        "open_interest_history",
+    })
+    SUPPORTED_MARKETS = ("spot", "futures")
+    SUPPORTED_MARKET_SET = frozenset(SUPPORTED_MARKETS)
+
+    # Accepted request values (tuples keep display order for error messages)
+    KLINE_INTERVALS = (
+        "1s", "1m", "3m", "5m", "15m", "30m", "1h", "2h",
+        "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M",
+    )
+    KLINE_INTERVAL_SET = frozenset(KLINE_INTERVALS)
+    OI_PERIODS = ("5m", "15m", "30m", "1h", "2h", "4h", "6h", "12h", "1d")
+    OI_PERIOD_SET = frozenset(OI_PERIODS)
+    # Binance IP weight budgets per minute (spot and USD-M futures)
+    RATE_LIMITS = {"api.binance.com": 6000, "fapi.binance.com": 2400}
+    # Endpoint weights; futures klines are weighted by limit in _request_weight
+    REQUEST_WEIGHTS = {
+        "/api/v3/exchangeInfo": 20,
+        "/api/v3/klines": 2,
+        "/fapi/v1/exchangeInfo": 1,
+        "/fapi/v1/fundingRate": 1,
+        "/fapi/v1/fundingInfo": 1,
+        "/fapi/v1/openInterest": 1,
+        "/futures/data/openInterestHist": 1,
+    }
+    USED_WEIGHT_HEADER = "x-mbx-used-weight-1m"
+
+    # Maximum klines per request, by market
+    KLINE_PAGE_LIMITS = {"spot": 1000, "futures": 1500}
+
+    __slots__ = ("spot_url", "futures_url", "default_quote_asset")
+
+    def __init__(self, db_handler=None, http_client=None):
         """
         Initialize Binance exchange handler
 
         Args:
             db_handler: Optional database handler instance for querying pair metadata
+            http_client: Optional shared httpx.AsyncClient
         """
-        super().__init__(db_handler)
+        super().__init__(db_handler, http_client=http_client)
         self.spot_url = "https://api.binance.com/api/v3/exchangeInfo?permissions=SPOT"
         self.futures_url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
         self.default_quote_asset = "USDT"
 
-    @classmethod
-    def get_supported_markets(cls) -> List[str]:
-        """
-        Get list of supported market types
-
-        Returns:
-            List of market identifiers
-        """
-        return ["spot", "futures"]
-
-    def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
+    def _request_weight(self, path: str, query: str) -> int:
+        """Weigh futures kline requests by their limit, as Binance does"""
+        if path != _FUTURES_KLINES_PATH:
+            return super()._request_weight(path, query)
+        limit = int(parse_qs(query).get("limit", ["500"])[0])
+        for max_limit, weight in _FUTURES_KLINE_WEIGHTS:
+            if limit < max_limit:
+                return weight
+        return 10
+
+    async def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Fetches trading and non-trading symbols from Binance API
 
@@ -44,36 +126,53 @@ class BinanceExchange(BaseExchange):
             Tuple of (trading_symbols, non_trading_symbols)
             Each symbol dict contains 'symbol' (base asset) and 'pair' (trading pair)
         """
-        quote_asset = self.default_quote_asset
-        data = self._fetch_with_retry(url)
+        parser = self._SYMBOL_PARSERS.get(exchange)
+        if parser is None:
+            raise ValueError(f"Invalid Binance exchange type: {exchange}")
 
+        data = await self._fetch_with_retry(url)
+        return parser(data.get("symbols", []), self.default_quote_asset)
+
+    @staticmethod
+    def _parse_spot_symbols(symbols: List[Dict], quote_asset: str) -> Tuple[List[Dict], List[Dict]]:
+        """Split spot exchangeInfo symbols quoted in quote_asset by trading status"""
         trading_symbols = []
         non_trading_symbols = []
+        # Bound once; the loop runs over ~2000 symbols per refresh
+        add_trading = trading_symbols.append
+        add_non_trading = non_trading_symbols.append
 
-        if exchange == "binance-spot":
-            # Single-pass filtering for better performance
-            for item in data.get("symbols", []):
-                if item.get("quoteAsset") == quote_asset:
-                    symbol_data = {"symbol": item["baseAsset"], "pair": item["symbol"]}
-                    if item.get("status") == "TRADING":
-                        trading_symbols.append(symbol_data)
-                    else:
-                        non_trading_symbols.append(symbol_data)
-        elif exchange == "binance-futures":
-            # Single-pass filtering for better performance
-            for item in data.get("symbols", []):
-                if (item.get("quoteAsset") == quote_asset and
-                    item.get("contractType") == "PERPETUAL"):
-                    symbol_data = {"symbol": item["baseAsset"], "pair": item["pair"]}
-                    if item.get("status") == "TRADING":
-                        trading_symbols.append(symbol_data)
-                    else:
-                        non_trading_symbols.append(symbol_data)
-        else:
-            raise ValueError(f"Invalid Binance exchange type: {exchange}")
+        # Single-pass filtering for better performance
+        for item in symbols:
+            if item.get("quoteAsset") == quote_asset:
+                add = add_trading if item.get("status") == "TRADING" else add_non_trading
+                add({"symbol": item["baseAsset"], "pair": item["symbol"]})
 
         return trading_symbols, non_trading_symbols
 
+    @staticmethod
+    def _parse_futures_symbols(symbols: List[Dict], quote_asset: str) -> Tuple[List[Dict], List[Dict]]:
+        """Split perpetual futures exchangeInfo symbols quoted in quote_asset by trading status"""
+        trading_symbols = []
+        non_trading_symbols = []
+        add_trading = trading_symbols.append
+        add_non_trading = non_trading_symbols.append
+
+        # Single-pass filtering for better performance
+        for item in symbols:
+            if (item.get("quoteAsset") == quote_asset and
+                item.get("contractType") == "PERPETUAL"):
+                add = add_trading if item.get("status") == "TRADING" else add_non_trading
+                add({"symbol": item["baseAsset"], "pair": item["pair"]})
+
+        return trading_symbols, non_trading_symbols
+
+    # exchangeInfo parser for each exchange identifier
+    _SYMBOL_PARSERS = {
+        "binance-spot": _parse_spot_symbols,
+        "binance-futures": _parse_futures_symbols,
+    }
+
     def generate_symbol_updates(
         self,
         exchange: str,
@@ -95,7 +194,7 @@ class BinanceExchange(BaseExchange):
             exchange, trading_pairs, non_trading_pairs
         )
 
-    def fetch_klines(
+    async def fetch_klines(
         self,
         symbol: str,
         interval: str,
@@ -137,25 +236,166 @@ class BinanceExchange(BaseExchange):
         Example:
             klines = exchange.fetch_klines('BTCUSDT', '1h', limit=100)
         """
+        url = self._klines_url(symbol, interval, market, start_time, end_time, limit, timezone)
+
+        # Fetch data
+        raw_data = await self._fetch_with_retry(url)
+
+        # Parse response into structured format
+        return [
+            {
+                "open_time": open_time,
+                "open": float(open_),
+                "high": float(high),
+                "low": float(low),
+                "close": float(close),
+                "volume": float(volume),
+                "close_time": close_time,
+                "quote_volume": float(quote_volume),
+                "trades": trades,
+                "taker_buy_base": float(taker_buy_base),
+                "taker_buy_quote": float(taker_buy_quote)
+            }
+            for (
+                open_time, open_, high, low, close, volume, close_time,
+                quote_volume, trades, taker_buy_base, taker_buy_quote
+            ) in map(_KLINE_FIELDS, raw_data)
+        ]
+
+    async def fetch_klines_paged(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        market: str = "spot",
+        concurrency: int = 8,
+        timezone: str = "0"
+    ) -> List[Dict]:
+        """
+        Fetch every kline in a time range, splitting it into concurrent pages
+
+        A single fetch_klines call stops at the per-request limit (1000 spot,
+        1500 futures). This computes the pages the range needs from the
+        interval length, fetches them concurrently and joins them in order.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            interval: Kline interval - any fetch_klines interval except '1M'
+            start_time: Start time in milliseconds (inclusive)
+            end_time: End time in milliseconds (inclusive)
+            market: Market type ('spot' or 'futures', default: 'spot')
+            concurrency: Maximum concurrent page requests (default: 8)
+            timezone: Timezone offset for spot market (default: '0' for UTC)
+
+        Returns:
+            List of kline dictionaries, as returned by fetch_klines
+
+        Raises:
+            ValueError: If parameters are invalid or the range needs more than
+                MAX_KLINE_PAGES pages; raised before any request is sent
+
+        Example:
+            # One year of hourly candles in 9 concurrent requests
+            klines = await exchange.fetch_klines_paged('BTCUSDT', '1h', start, end)
+        """
+        interval_ms = _INTERVAL_MS.get(interval)
+        if interval_ms is None:
+            raise ValueError(
+                f"Invalid interval '{interval}' for paged fetch. "
+                f"Supported intervals: {', '.join(_INTERVAL_MS)}"
+            )
+        page_limit = self.KLINE_PAGE_LIMITS.get(market)
+        if page_limit is None:
+            raise ValueError(f"Invalid market type '{market}'. Supported: 'spot', 'futures'")
+        if start_time < 0 or start_time >= end_time:
+            raise ValueError("start_time must be non-negative and less than end_time")
+
+        page_span = page_limit * interval_ms
+        page_starts = range(start_time, end_time + 1, page_span)
+        if len(page_starts) > MAX_KLINE_PAGES:
+            raise ValueError(
+                f"Time range needs {len(page_starts)} pages of {page_limit} klines; "
+                f"the maximum is {MAX_KLINE_PAGES}. Narrow the range or use a longer interval"
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page_start: int) -> List[Dict]:
+            async with semaphore:
+                return await self.fetch_klines(
+                    symbol=symbol,
+                    interval=interval,
+                    market=market,
+                    start_time=page_start,
+                    end_time=min(page_start + page_span - 1, end_time),
+                    limit=page_limit,
+                    timezone=timezone
+                )
+
+        pages = await asyncio.gather(*(fetch_page(page_start) for page_start in page_starts))
+
+        klines = []
+        for page in pages:
+            klines.extend(page)
+        return klines
+
+    async def fetch_klines_raw(
+        self,
+        symbol: str,
+        interval: str,
+        market: str = "spot",
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 500,
+        timezone: str = "0"
+    ) -> bytes:
+        """
+        Fetch kline data as the unparsed Binance JSON response
+
+        Takes the same arguments as fetch_klines. The body is Binance's native
+        layout: one array per kline, [open_time, open, high, low, close, volume,
+        close_time, quote_volume, trades, taker_buy_base, taker_buy_quote, ignore],
+        with prices and volumes as strings.
+
+        Returns:
+            Response body bytes
+
+        Raises:
+            ValueError: If market type is invalid or interval is not supported
+
+        Example:
+            body = await exchange.fetch_klines_raw('BTCUSDT', '1h', limit=100)
+        """
+        url = self._klines_url(symbol, interval, market, start_time, end_time, limit, timezone)
+        return await self._fetch_bytes_with_retry(url)
+
+    def _klines_url(
+        self,
+        symbol: str,
+        interval: str,
+        market: str,
+        start_time: Optional[int],
+        end_time: Optional[int],
+        limit: int,
+        timezone: str
+    ) -> str:
+        """Validate kline request parameters and build the request URL"""
         # Validate interval
-        valid_intervals = ['1s', '1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M']
-        if interval not in valid_intervals:
+        if interval not in self.KLINE_INTERVAL_SET:
             raise ValueError(
                 f"Invalid interval '{interval}'. "
-                f"Supported intervals: {', '.join(valid_intervals)}"
+                f"Supported intervals: {', '.join(self.KLINE_INTERVALS)}"
             )
 
         # Validate limit
         max_limit = 1000 if market == "spot" else 1500
-        if limit > max_limit:
-            raise ValueError(f"Limit cannot exceed {max_limit} for {market} market")
+        if limit > max_limit or limit < 1:
+            raise ValueError(f"Limit must be between 1 and {max_limit} for {market} market")
 
         # Build URL based on market type
-        if market == "spot":
-            base_url = "https://api.binance.com/api/v3/klines"
-        elif market == "futures":
-            base_url = "https://fapi.binance.com/fapi/v1/klines"
-        else:
+        base_url = _KLINES_URLS.get(market)
+        if base_url is None:
             raise ValueError(f"Invalid market type '{market}'. Supported: 'spot', 'futures'")
 
         # Build query parameters
@@ -168,39 +408,16 @@ class BinanceExchange(BaseExchange):
         if market == "spot" and timezone:
             params["timeZone"] = timezone
 
-        if start_time:
+        if start_time is not None:
             params["startTime"] = start_time
 
-        if end_time:
+        if end_time is not None:
             params["endTime"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
-
-        # Fetch data
-        raw_data = self._fetch_with_retry(url)
-
-        # Parse response into structured format
-        klines = []
-        for item in raw_data:
-            klines.append({
-                "open_time": item[0],
-                "open": item[1],
-                "high": item[2],
-                "low": item[3],
-                "close": item[4],
-                "volume": item[5],
-                "close_time": item[6],
-                "quote_volume": item[7],
-                "trades": item[8],
-                "taker_buy_base": item[9],
-                "taker_buy_quote": item[10]
-            })
+        return f"{base_url}?{urlencode(params)}"
 
-        return klines
-
-    def fetch_funding_rate_history(
+    async def fetch_funding_rate_history(
         self,
         symbol: Optional[str] = None,
         start_time: Optional[int] = None,
@@ -243,9 +460,6 @@ class BinanceExchange(BaseExchange):
         if limit > 1000 or limit < 1:
             raise ValueError("Limit must be between 1 and 1000")
 
-        # Build URL
-        base_url = "https://fapi.binance.com/fapi/v1/fundingRate"
-
         # Build query parameters
         params = {
             "limit": limit
@@ -254,32 +468,30 @@ class BinanceExchange(BaseExchange):
         if symbol:
             params["symbol"] = symbol
 
-        if start_time:
+        if start_time is not None:
             params["startTime"] = start_time
 
-        if end_time:
+        if end_time is not None:
             params["endTime"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        url = f"{_FUNDING_RATE_URL}?{urlencode(params)}"
 
         # Fetch data
-        raw_data = self._fetch_with_retry(url)
+        raw_data = await self._fetch_with_retry(url)
 
         # Parse response into structured format
-        funding_rates = []
-        for item in raw_data:
-            funding_rates.append({
+        return [
+            {
                 "symbol": item.get("symbol"),
-                "funding_rate": item.get("fundingRate"),
+                "funding_rate": to_number(item.get("fundingRate")),
                 "funding_time": item.get("fundingTime"),
-                "mark_price": item.get("markPrice")
-            })
+                "mark_price": to_number(item.get("markPrice"))
+            }
+            for item in raw_data
+        ]
 
-        return funding_rates
-
-    def fetch_funding_rate_info(self) -> List[Dict]:
+    async def fetch_funding_rate_info(self) -> List[Dict]:
         """
         Fetch funding rate configuration info for Binance futures
 
@@ -301,25 +513,21 @@ class BinanceExchange(BaseExchange):
             - Returns info only for symbols that had FundingRateCap/Floor/Interval adjustments
             - Standard funding interval is 8 hours for most pairs
         """
-        # Build URL
-        url = "https://fapi.binance.com/fapi/v1/fundingInfo"
-
         # Fetch data
-        raw_data = self._fetch_with_retry(url)
+        raw_data = await self._fetch_with_retry(_FUNDING_INFO_URL)
 
         # Parse response into structured format
-        funding_info = []
-        for item in raw_data:
-            funding_info.append({
+        return [
+            {
                 "symbol": item.get("symbol"),
-                "adjusted_funding_rate_cap": item.get("adjustedFundingRateCap"),
-                "adjusted_funding_rate_floor": item.get("adjustedFundingRateFloor"),
+                "adjusted_funding_rate_cap": to_number(item.get("adjustedFundingRateCap")),
+                "adjusted_funding_rate_floor": to_number(item.get("adjustedFundingRateFloor")),
                 "funding_interval_hours": item.get("fundingIntervalHours")
-            })
-
-        return funding_info
+            }
+            for item in raw_data
+        ]
 
-    def fetch_open_interest(self, symbol: str) -> Dict:
+    async def fetch_open_interest(self, symbol: str) -> Dict:
         """
         Fetch current open interest for a futures symbol
 
@@ -340,25 +548,20 @@ class BinanceExchange(BaseExchange):
             - Only available for futures contracts
             - Returns real-time open interest data
         """
-        # Build URL
-        base_url = "https://fapi.binance.com/fapi/v1/openInterest"
-
-        # Build query parameters
-        params = {"symbol": symbol}
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        # Build URL with parameters
+        url = f"{_OPEN_INTEREST_URL}?{urlencode({'symbol': symbol})}"
 
         # Fetch data
-        raw_data = self._fetch_with_retry(url)
+        raw_data = await self._fetch_with_retry(url)
 
         # Parse response
         return {
             "symbol": raw_data.get("symbol"),
-            "open_interest": raw_data.get("openInterest"),
+            "open_interest": to_number(raw_data.get("openInterest")),
             "timestamp": raw_data.get("time")
         }
 
-    def fetch_open_interest_history(
+    async def fetch_open_interest_history(
         self,
         symbol: str,
         period: str,
@@ -399,20 +602,16 @@ class BinanceExchange(BaseExchange):
             - Default limit is 30, maximum is 500
         """
         # Validate period
-        valid_periods = ['5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d']
-        if period not in valid_periods:
+        if period not in self.OI_PERIOD_SET:
             raise ValueError(
                 f"Invalid period '{period}'. "
-                f"Supported periods: {', '.join(valid_periods)}"
+                f"Supported periods: {', '.join(self.OI_PERIODS)}"
             )
 
         # Validate limit
         if limit > 500 or limit < 1:
             raise ValueError("Limit must be between 1 and 500")
 
-        # Build URL
-        base_url = "https://fapi.binance.com/futures/data/openInterestHist"
-
         # Build query parameters
         params = {
             "symbol": symbol,
@@ -420,32 +619,30 @@ class BinanceExchange(BaseExchange):
             "limit": limit
         }
 
-        if start_time:
+        if start_time is not None:
             params["startTime"] = start_time
 
-        if end_time:
+        if end_time is not None:
             params["endTime"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        url = f"{_OPEN_INTEREST_HIST_URL}?{urlencode(params)}"
 
         # Fetch data
-        raw_data = self._fetch_with_retry(url)
+        raw_data = await self._fetch_with_retry(url)
 
         # Parse response into structured format
-        oi_history = []
-        for item in raw_data:
-            oi_history.append({
+        return [
+            {
                 "symbol": item.get("symbol"),
-                "sum_open_interest": item.get("sumOpenInterest"),
-                "sum_open_interest_value": item.get("sumOpenInterestValue"),
+                "sum_open_interest": to_number(item.get("sumOpenInterest")),
+                "sum_open_interest_value": to_number(item.get("sumOpenInterestValue")),
                 "timestamp": item.get("timestamp")
-            })
-
-        return oi_history
+            }
+            for item in raw_data
+        ]
 
-    def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Binance spot exchange data
 
@@ -463,12 +660,12 @@ class BinanceExchange(BaseExchange):
             ])
         """
         exchange = 'binance-spot'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.spot_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
 
-    def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Binance futures exchange data
 
@@ -486,7 +683,7 @@ class BinanceExchange(BaseExchange):
             ])
         """
         exchange = 'binance-futures'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.futures_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
@@ -4,35 +4,39 @@ Handles both Spot and Futures markets for Bybit
 """
 
 from typing import Dict, List, Tuple, Optional
-from ..core.base_exchange import BaseExchange
+from urllib.parse import urlencode
+from ..core.base_exchange import BaseExchange, to_number
 
 
 class BybitExchange(BaseExchange):
     """Bybit exchange implementation for Spot and Futures markets"""
 
-    def __init__(self, db_handler=None):
+    CAPABILITIES = frozenset({"pairs", "klines", "funding_history"})
+    SUPPORTED_MARKETS = ("spot", "futures")
+    SUPPORTED_MARKET_SET = frozenset(SUPPORTED_MARKETS)
+
+    # Accepted request values (tuples keep display order for error messages)
+    KLINE_INTERVALS = ("1", "3", "5", "15", "30", "60", "120", "240", "360", "720", "D", "W", "M")
+    KLINE_INTERVAL_SET = frozenset(KLINE_INTERVALS)
+    OI_INTERVALS = ("5min", "15min", "30min", "1h", "4h", "1d")
+    OI_INTERVAL_SET = frozenset(OI_INTERVALS)
+
+    __slots__ = ("spot_url", "futures_url", "default_quote_asset")
+
+    def __init__(self, db_handler=None, http_client=None):
         """
         Initialize Bybit exchange handler
 
         Args:
             db_handler: Optional database handler instance for querying pair metadata
+            http_client: Optional shared httpx.AsyncClient
         """
-        super().__init__(db_handler)
+        super().__init__(db_handler, http_client=http_client)
         self.spot_url = "https://api.bybit.com/v5/market/instruments-info?category=spot&status=Trading&limit=1000"
         self.futures_url = "https://api.bybit.com/v5/market/instruments-info?category=linear&status=Trading&limit=1000"
         self.default_quote_asset = "USDT"
 
-    @classmethod
-    def get_supported_markets(cls) -> List[str]:
-        """
-        Get list of supported market types
-
-        Returns:
-            List of market identifiers
-        """
-        return ["spot", "futures"]
-
-    def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
+    async def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Fetches trading and non-trading symbols from Bybit API
 
@@ -45,7 +49,7 @@ class BybitExchange(BaseExchange):
             Each symbol dict contains 'symbol' (base asset) and 'pair' (trading pair)
         """
         quote_asset = self.default_quote_asset
-        data = self._fetch_with_retry(url)
+        data = await self._fetch_with_retry(url)
 
         # Get the result list from Bybit API response
         result_list = data.get("result", {}).get("list", [])
@@ -101,7 +105,7 @@ class BybitExchange(BaseExchange):
             exchange, trading_pairs, non_trading_pairs
         )
 
-    def fetch_klines(
+    async def fetch_klines(
         self,
         symbol: str,
         interval: str,
@@ -147,11 +151,10 @@ class BybitExchange(BaseExchange):
             - For futures: volume is base coin, turnover is quote coin (USDT/USDC)
         """
         # Validate interval
-        valid_intervals = ['1', '3', '5', '15', '30', '60', '120', '240', '360', '720', 'D', 'W', 'M']
-        if interval not in valid_intervals:
+        if interval not in self.KLINE_INTERVAL_SET:
             raise ValueError(
                 f"Invalid interval '{interval}'. "
-                f"Supported intervals: {', '.join(valid_intervals)}"
+                f"Supported intervals: {', '.join(self.KLINE_INTERVALS)}"
             )
 
         # Validate limit
@@ -184,11 +187,10 @@ class BybitExchange(BaseExchange):
             params["end"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        url = f"{base_url}?{urlencode(params)}"
 
         # Fetch data
-        response = self._fetch_with_retry(url)
+        response = await self._fetch_with_retry(url)
 
         # Parse response
         if response.get("retCode") != 0:
@@ -202,12 +204,12 @@ class BybitExchange(BaseExchange):
         for item in raw_data:
             klines.append({
                 "open_time": int(item[0]),
-                "open": item[1],
-                "high": item[2],
-                "low": item[3],
-                "close": item[4],
-                "volume": item[5],
-                "turnover": item[6]
+                "open": float(item[1]),
+                "high": float(item[2]),
+                "low": float(item[3]),
+                "close": float(item[4]),
+                "volume": float(item[5]),
+                "turnover": float(item[6])
             })
 
         # Reverse the list since Bybit returns newest first, but we want oldest first
@@ -215,7 +217,7 @@ class BybitExchange(BaseExchange):
 
         return klines
 
-    def fetch_funding_rate_history(
+    async def fetch_funding_rate_history(
         self,
         symbol: str,
         start_time: Optional[int] = None,
@@ -286,11 +288,10 @@ class BybitExchange(BaseExchange):
             params["endTime"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        url = f"{base_url}?{urlencode(params)}"
 
         # Fetch data
-        response = self._fetch_with_retry(url)
+        response = await self._fetch_with_retry(url)
 
         # Parse response
         if response.get("retCode") != 0:
@@ -303,13 +304,13 @@ class BybitExchange(BaseExchange):
         for item in raw_data:
             funding_rates.append({
                 "symbol": item.get("symbol"),
-                "funding_rate": item.get("fundingRate"),
-                "funding_rate_timestamp": item.get("fundingRateTimestamp")
+                "funding_rate": to_number(item.get("fundingRate")),
+                "funding_rate_timestamp": int(item.get("fundingRateTimestamp"))
             })
 
         return funding_rates
 
-    def fetch_open_interest(
+    async def fetch_open_interest(
         self,
         symbol: str,
         interval: str,
@@ -352,11 +353,10 @@ class BybitExchange(BaseExchange):
             - Default limit is 50, maximum is 200
         """
         # Validate interval
-        valid_intervals = ['5min', '15min', '30min', '1h', '4h', '1d']
-        if interval not in valid_intervals:
+        if interval not in self.OI_INTERVAL_SET:
             raise ValueError(
                 f"Invalid interval '{interval}'. "
-                f"Supported intervals: {', '.join(valid_intervals)}"
+                f"Supported intervals: {', '.join(self.OI_INTERVALS)}"
             )
 
         # Validate limit
@@ -387,11 +387,10 @@ class BybitExchange(BaseExchange):
             params["endTime"] = end_time
 
         # Build URL with parameters
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        url = f"{base_url}?{query_string}"
+        url = f"{base_url}?{urlencode(params)}"
 
         # Fetch data
-        response = self._fetch_with_retry(url)
+        response = await self._fetch_with_retry(url)
 
         # Parse response
         if response.get("retCode") != 0:
@@ -406,13 +405,13 @@ class BybitExchange(BaseExchange):
         for item in raw_data:
             oi_data.append({
                 "symbol": symbol_from_response,
-                "open_interest": item.get("openInterest"),
-                "timestamp": item.get("timestamp")
+                "open_interest": to_number(item.get("openInterest")),
+                "timestamp": int(item.get("timestamp"))
             })
 
         return oi_data
 
-    def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Bybit spot exchange data
 
@@ -428,12 +427,12 @@ class BybitExchange(BaseExchange):
             [])
         """
         exchange = 'bybit-spot'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.spot_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
 
-    def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Bybit futures exchange data
 
@@ -449,7 +448,7 @@ class BybitExchange(BaseExchange):
             [])
         """
         exchange = 'bybit-futures'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.futures_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
@@ -4,7 +4,9 @@ Handles both Spot and Futures markets for Hyperliquid
 """
 
 from typing import Dict, List, Tuple, Optional
-from ..core.base_exchange import BaseExchange
+from ..core.base_exchange import BaseExchange, to_number
+from ..core.http_client import http_retry
+from ..utils.serialization import loads
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,14 +15,21 @@ logger = logging.getLogger(__name__)
 class HyperliquidExchange(BaseExchange):
     """Hyperliquid exchange implementation for Spot and Futures markets"""
 
-    def __init__(self, db_handler=None):
+    CAPABILITIES = frozenset({"pairs", "market_data"})
+    SUPPORTED_MARKETS = ("spot", "futures")
+    SUPPORTED_MARKET_SET = frozenset(SUPPORTED_MARKETS)
+
+    __slots__ = ("spot_url", "futures_url", "symbol_mapping")
+
+    def __init__(self, db_handler=None, http_client=None):
         """
         Initialize Hyperliquid exchange handler
 
         Args:
             db_handler: Optional database handler instance
+            http_client: Optional shared httpx.AsyncClient
         """
-        super().__init__(db_handler)
+        super().__init__(db_handler, http_client=http_client)
         self.spot_url = "https://api.hyperliquid.xyz/info"
         self.futures_url = "https://api.hyperliquid.xyz/info"
 
@@ -30,16 +39,6 @@ class HyperliquidExchange(BaseExchange):
             'USDC': 'USDC',
         }
 
-    @classmethod
-    def get_supported_markets(cls) -> List[str]:
-        """
-        Get list of supported market types
-
-        Returns:
-            List of market identifiers
-        """
-        return ["spot", "futures"]
-
     def _normalize_symbol(self, symbol: str) -> str:
         """
         Normalize symbol names (e.g., USDT0 -> USDT)
@@ -52,7 +51,8 @@ class HyperliquidExchange(BaseExchange):
         """
         return self.symbol_mapping.get(symbol, symbol)
 
-    def _fetch_with_retry_post(self, url: str, payload: dict) -> dict:
+    @http_retry
+    async def _fetch_with_retry_post(self, url: str, payload: dict) -> dict:
         """
         Make POST request to Hyperliquid API with retry logic
 
@@ -63,21 +63,12 @@ class HyperliquidExchange(BaseExchange):
         Returns:
             JSON response data
         """
-        from tenacity import retry, stop_after_attempt, wait_exponential
-
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=2, max=10)
-        )
-        def _make_request():
-            logger.info(f"Fetching data from: {url} with payload: {payload}")
-            response = self.client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
-
-        return _make_request()
+        logger.info(f"Fetching data from: {url} with payload: {payload}")
+        response = await self.client.post(url, json=payload)
+        response.raise_for_status()
+        return loads(response.content)
 
-    def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
+    async def fetch_symbols_from_exchange(self, url: str, exchange: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Fetches trading and non-trading symbols from Hyperliquid API
 
@@ -92,7 +83,7 @@ class HyperliquidExchange(BaseExchange):
         if exchange == "hyperliquid-spot":
             # Fetch spot market data
             payload = {'type': 'spotMeta'}
-            data = self._fetch_with_retry_post(url, payload)
+            data = await self._fetch_with_retry_post(url, payload)
 
             # Parse tokens
             tokens_map = {}
@@ -128,7 +119,7 @@ class HyperliquidExchange(BaseExchange):
         elif exchange == "hyperliquid-futures":
             # Fetch futures market data
             payload = {'type': 'meta'}
-            data = self._fetch_with_retry_post(url, payload)
+            data = await self._fetch_with_retry_post(url, payload)
 
             trading_symbols = []
             non_trading_symbols = []
@@ -176,7 +167,7 @@ class HyperliquidExchange(BaseExchange):
             exchange, trading_pairs, non_trading_pairs
         )
 
-    def fetch_klines(
+    async def fetch_klines(
         self,
         symbol: str,
         interval: str,
@@ -200,7 +191,7 @@ class HyperliquidExchange(BaseExchange):
             "current price, 24h volume, funding rate, and open interest."
         )
 
-    def fetch_market_data(self, symbol: Optional[str] = None) -> List[Dict]:
+    async def fetch_market_data(self, symbol: Optional[str] = None) -> List[Dict]:
         """
         Fetch live market data for Hyperliquid perpetuals
 
@@ -237,7 +228,7 @@ class HyperliquidExchange(BaseExchange):
 
         # Fetch data using POST request
         url = "https://api.hyperliquid.xyz/info"
-        data = self._fetch_with_retry_post(url, payload)
+        data = await self._fetch_with_retry_post(url, payload)
 
         # Parse response
         # data[0] = meta (universe info)
@@ -265,16 +256,16 @@ class HyperliquidExchange(BaseExchange):
 
                 market_data = {
                     "symbol": asset_name,
-                    "mark_price": ctx.get("markPx"),
-                    "oracle_price": ctx.get("oraclePx"),
-                    "mid_price": ctx.get("midPx"),
-                    "prev_day_price": ctx.get("prevDayPx"),
+                    "mark_price": mark_px,
+                    "oracle_price": to_number(ctx.get("oraclePx")),
+                    "mid_price": to_number(ctx.get("midPx")),
+                    "prev_day_price": prev_day_px,
                     "price_change_24h": round(price_change_24h, 2),
-                    "volume_24h_base": ctx.get("dayBaseVlm"),
-                    "volume_24h_usd": ctx.get("dayNtlVlm"),
-                    "funding_rate": ctx.get("funding"),
-                    "open_interest": ctx.get("openInterest"),
-                    "premium": ctx.get("premium"),
+                    "volume_24h_base": to_number(ctx.get("dayBaseVlm")),
+                    "volume_24h_usd": to_number(ctx.get("dayNtlVlm")),
+                    "funding_rate": to_number(ctx.get("funding")),
+                    "open_interest": to_number(ctx.get("openInterest")),
+                    "premium": to_number(ctx.get("premium")),
                     "max_leverage": asset_info.get("maxLeverage"),
                     "size_decimals": asset_info.get("szDecimals"),
                     "is_delisted": asset_info.get("isDelisted", False)
@@ -284,7 +275,7 @@ class HyperliquidExchange(BaseExchange):
 
         return markets
 
-    def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_spot(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Hyperliquid spot exchange data
 
@@ -300,12 +291,12 @@ class HyperliquidExchange(BaseExchange):
             [])
         """
         exchange = 'hyperliquid-spot'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.spot_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
 
-    def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
+    async def process_futures(self) -> Tuple[List[Dict], List[Dict]]:
         """
         Process Hyperliquid futures exchange data
 
@@ -321,7 +312,7 @@ class HyperliquidExchange(BaseExchange):
             [])
         """
         exchange = 'hyperliquid-futures'
-        trading_symbols, non_trading_symbols = self.fetch_symbols_retry(
+        trading_symbols, non_trading_symbols = await self.fetch_symbols_retry(
             self.futures_url, exchange
         )
         return self.generate_symbol_updates(exchange, trading_symbols, non_trading_symbols)
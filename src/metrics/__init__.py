@@ -3,7 +3,7 @@ Panda Metrics Module
 Provides access to various metrics: exchange data, orderbook, orderflow, and JLabs models
 """
 
-from .api_client import PandaMetricsClient
+from .api_client import PandaMetricsClient, get_metrics_client, close_metrics_clients
 from .divine_dip import DivineDipMetric
 from .orderbook import OrderbookMetric
 from .jlabs_analytics import JLabsAnalytics
@@ -12,6 +12,8 @@ from .jlabs_models import JLabsModels
 
 __all__ = [
     "PandaMetricsClient",
+    "get_metrics_client",
+    "close_metrics_clients",
     "DivineDipMetric",
     "OrderbookMetric",
     "JLabsAnalytics",
@@ -3,18 +3,36 @@ Panda Metrics API Client
 Handles communication with the panda-backend-api for metrics data
 """
 
+import asyncio
+import functools
 import httpx
 import os
-from typing import Dict, Optional, Literal
-from tenacity import retry, stop_after_attempt, wait_exponential
+import threading
+from typing import Dict, Optional, Literal, Tuple
 from dotenv import load_dotenv
 import logging
+from ..core.http_client import get_http_client, http_retry
+from ..utils.cache import CACHE_DIR, FileCache, make_cache_key
+from ..utils.serialization import loads
 
 logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Requests go through the process-wide async HTTP client (HTTP/2, pooled
+# connections) shared with the exchange adapters; metrics endpoints get a
+# longer per-request timeout
+DEFAULT_TIMEOUT = 30.0
+
+# Last ETag and body per request, kept on disk so that refetches after the
+# tool response cache expires can be answered with 304 Not Modified. Only
+# requests without a time window are revalidated: windowed requests rarely
+# repeat, so storing them would grow the cache without producing hits
+ETAG_TTL = 7 * 86400
+ETAG_CACHE = FileCache(CACHE_DIR / "metrics_etags")
+_TIME_WINDOW_PARAMS = frozenset({"start_epoch", "end_epoch", "epoch_low", "epoch_high"})
+
 
 class PandaMetricsClient:
     """
@@ -30,7 +48,8 @@ class PandaMetricsClient:
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
-        timeout: float = 30.0
+        timeout: float = DEFAULT_TIMEOUT,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Panda Metrics API client
@@ -39,6 +58,8 @@ class PandaMetricsClient:
             base_url: Base URL for the panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
             api_key: API key for authentication (defaults to PANDA_API_KEY env var)
             timeout: Request timeout in seconds (default: 30.0)
+            http_client: Async HTTP client to send requests with (default: the
+                shared client from core.http_client)
 
         Raises:
             ValueError: If base_url is not provided and PANDA_BACKEND_API_URL is not set
@@ -52,46 +73,25 @@ class PandaMetricsClient:
                 "base_url must be provided either as parameter or via PANDA_BACKEND_API_URL environment variable"
             )
 
-        self._client: Optional[httpx.Client] = None
+        self._client = http_client
         self.timeout = timeout
+        self.headers = {"X-API-KEY": self.api_key} if self.api_key else {}
 
     @property
-    def client(self) -> httpx.Client:
-        """Lazy-initialized HTTP client"""
-        if self._client is None:
-            headers = {}
-            if self.api_key:
-                headers["X-API-KEY"] = self.api_key
-
-            self._client = httpx.Client(
-                timeout=self.timeout,
-                headers=headers
-            )
-        return self._client
-
-    def close(self):
-        """Explicitly close the HTTP client"""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
-
-    def __enter__(self):
-        """Context manager entry"""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - ensures client cleanup"""
-        self.close()
-        return False
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
-    def _fetch_with_retry(self, url: str, params: Dict) -> Dict:
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client requests are sent with"""
+        return self._client or get_http_client()
+
+    @http_retry
+    async def _fetch_with_retry(self, url: str, params: Dict) -> Dict:
         """
         Fetch data from API with retry logic
 
+        For requests without a time window, responses that carried an ETag
+        are stored in ETAG_CACHE; later calls for the same URL, parameters
+        and API key send If-None-Match and reuse the stored body when the
+        server answers 304 Not Modified.
+
         Args:
             url: API endpoint URL
             params: Query parameters
@@ -105,11 +105,32 @@ class PandaMetricsClient:
         logger.info(f"Fetching metrics from: {url}")
         logger.debug(f"Parameters: {params}")
 
-        response = self.client.get(url, params=params)
+        # Revalidate a previously seen response instead of downloading it again.
+        # The API key is part of the key, so one credential's body is never
+        # returned to another
+        key = None
+        validated = None
+        if _TIME_WINDOW_PARAMS.isdisjoint(params):
+            key = make_cache_key(url, {"params": params, "api_key": self.api_key})
+            validated = await asyncio.to_thread(ETAG_CACHE.get, key)
+        headers = self.headers
+        if validated:
+            headers = {**headers, "If-None-Match": validated["etag"]}
+
+        response = await self.client.get(url, params=params, headers=headers, timeout=self.timeout)
+        if validated and response.status_code == 304:
+            logger.debug(f"Not modified: {url}")
+            await asyncio.to_thread(ETAG_CACHE.set, key, validated, ETAG_TTL)
+            return validated["body"]
+
         response.raise_for_status()
-        return response.json()
+        body = loads(response.content)
+        etag = response.headers.get("etag")
+        if key and etag:
+            await asyncio.to_thread(ETAG_CACHE.set, key, {"etag": etag, "body": body}, ETAG_TTL)
+        return body
 
-    def fetch_cex_metric(
+    async def fetch_cex_metric(
         self,
         metric: str,
         exchange: str,
@@ -135,7 +156,7 @@ class PandaMetricsClient:
             Dictionary with metric data
 
         Example:
-            client.fetch_cex_metric(
+            await client.fetch_cex_metric(
                 metric="divine_dip",
                 exchange="bybit-futures",
                 token="BTCUSDT",
@@ -158,9 +179,9 @@ class PandaMetricsClient:
             "end_epoch": end_epoch
         }
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_dex_metric(
+    async def fetch_dex_metric(
         self,
         metric: str,
         chain: str,
@@ -186,7 +207,7 @@ class PandaMetricsClient:
             Dictionary with metric data
 
         Example:
-            client.fetch_dex_metric(
+            await client.fetch_dex_metric(
                 metric="divine_dip",
                 chain="ethereum",
                 pool_address="0x1234...",
@@ -209,9 +230,9 @@ class PandaMetricsClient:
             "end_epoch": end_epoch
         }
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_metric(
+    async def fetch_metric(
         self,
         metric: str,
         exchange_type: Literal["CEX", "DEX"],
@@ -251,7 +272,7 @@ class PandaMetricsClient:
             if not exchange or not token:
                 raise ValueError("CEX metrics require 'exchange' and 'token' parameters")
 
-            return self.fetch_cex_metric(
+            return await self.fetch_cex_metric(
                 metric=metric,
                 exchange=exchange,
                 token=token,
@@ -265,7 +286,7 @@ class PandaMetricsClient:
             if not chain or not pool_address:
                 raise ValueError("DEX metrics require 'chain' and 'pool_address' parameters")
 
-            return self.fetch_dex_metric(
+            return await self.fetch_dex_metric(
                 metric=metric,
                 chain=chain,
                 pool_address=pool_address,
@@ -277,7 +298,7 @@ class PandaMetricsClient:
 
         raise ValueError(f"Invalid exchange_type: {exchange_type}. Must be 'CEX' or 'DEX'")
 
-    def fetch_orderbook_metric(
+    async def fetch_orderbook_metric(
         self,
         metric: str,
         symbol: str,
@@ -303,7 +324,7 @@ class PandaMetricsClient:
             Dictionary with orderbook metric data
 
         Example:
-            client.fetch_orderbook_metric(
+            await client.fetch_orderbook_metric(
                 metric="bid_ask_ratio",
                 symbol="BTCUSDT",
                 exchange="binance-futures",
@@ -325,9 +346,9 @@ class PandaMetricsClient:
             "epoch_high": epoch_high
         }
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_jlabs_v1_metric(
+    async def fetch_jlabs_v1_metric(
         self,
         metric: str,
         symbol: str,
@@ -349,7 +370,7 @@ class PandaMetricsClient:
             Dictionary with metric data
 
         Example:
-            client.fetch_jlabs_v1_metric(
+            await client.fetch_jlabs_v1_metric(
                 metric="slippage",
                 symbol="BTCUSDT",
                 time_delta=330,
@@ -367,9 +388,9 @@ class PandaMetricsClient:
             "end_epoch": end_epoch
         }
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_orderflow_metric(
+    async def fetch_orderflow_metric(
         self,
         metric: str,
         symbol: str,
@@ -395,7 +416,7 @@ class PandaMetricsClient:
             Dictionary with orderflow metric data
 
         Example:
-            client.fetch_orderflow_metric(
+            await client.fetch_orderflow_metric(
                 metric="trade_vol",
                 symbol="BTCUSDT",
                 exchange="binance-futures",
@@ -417,9 +438,9 @@ class PandaMetricsClient:
             "epoch_high": epoch_high
         }
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_jlabs_proprietary_v1(
+    async def fetch_jlabs_proprietary_v1(
         self,
         metric: str,
         symbol: Optional[str],
@@ -441,7 +462,7 @@ class PandaMetricsClient:
             Dictionary with metric data
 
         Example:
-            client.fetch_jlabs_proprietary_v1(
+            await client.fetch_jlabs_proprietary_v1(
                 metric="cari",
                 symbol="BTCUSDT",
                 timeframe="1D",
@@ -461,9 +482,9 @@ class PandaMetricsClient:
         if symbol:
             params["symbol"] = symbol
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
 
-    def fetch_jlabs_proprietary_v2(
+    async def fetch_jlabs_proprietary_v2(
         self,
         metric: str,
         token: Optional[str],
@@ -485,7 +506,7 @@ class PandaMetricsClient:
             Dictionary with metric data
 
         Example:
-            client.fetch_jlabs_proprietary_v2(
+            await client.fetch_jlabs_proprietary_v2(
                 metric="Token rating",
                 token="BTCUSDT",
                 timeframe="1D",
@@ -507,4 +528,78 @@ class PandaMetricsClient:
         if metric_param:
             params["metric_param"] = metric_param
 
-        return self._fetch_with_retry(url, params)
+        return await self._fetch_with_retry(url, params)
+
+
+# Shared clients keyed on (base_url, api_key), so configuration is resolved once
+_shared_clients: Dict[Tuple[str, Optional[str]], PandaMetricsClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_config(
+    base_url: Optional[str],
+    api_key: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    """
+    Resolve the backend URL and API key, falling back to environment variables
+
+    The environment is read once per distinct (base_url, api_key) pair; it is
+    loaded from .env at import time and not expected to change afterwards.
+
+    Args:
+        base_url: Base URL passed by the caller, or None
+        api_key: API key passed by the caller, or None
+
+    Returns:
+        Tuple of (base URL without trailing slash, API key)
+
+    Raises:
+        ValueError: If no base URL is configured
+    """
+    resolved_url = (base_url or os.getenv("PANDA_BACKEND_API_URL", "")).rstrip('/')
+    if not resolved_url:
+        raise ValueError(
+            "base_url must be provided either as parameter or via PANDA_BACKEND_API_URL environment variable"
+        )
+    return resolved_url, api_key or os.getenv("PANDA_API_KEY")
+
+
+def get_metrics_client(
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> PandaMetricsClient:
+    """
+    Get the shared metrics client for a backend URL and API key
+
+    Args:
+        base_url: Base URL for the panda-backend-api (defaults to PANDA_BACKEND_API_URL env var)
+        api_key: API key for authentication (defaults to PANDA_API_KEY env var)
+
+    Returns:
+        Cached PandaMetricsClient sending requests through the shared HTTP client
+
+    Raises:
+        ValueError: If no base URL is configured
+    """
+    key = _resolve_config(base_url, api_key)
+
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = PandaMetricsClient(base_url=key[0], api_key=key[1])
+                _shared_clients[key] = client
+    return client
+
+
+def close_metrics_clients() -> None:
+    """
+    Forget all shared metrics clients
+
+    Their connections belong to the shared HTTP client, which is closed
+    separately by core.http_client.close_http_client().
+    """
+    with _shared_clients_lock:
+        _shared_clients.clear()
@@ -5,6 +5,9 @@ Implementation of the divine_dip metric from panda_jlabs_metrics
 
 from typing import Dict, List, Optional, Literal
 import logging
+import numpy as np
+
+from ..utils.series import field_array
 
 logger = logging.getLogger(__name__)
 
@@ -17,17 +20,20 @@ class DivineDipMetric:
     in cryptocurrency markets by detecting significant price dips.
     """
 
-    SUPPORTED_CEX_TIMEFRAMES = ["15m", "30m", "1H", "4H", "1D"]
-    SUPPORTED_DEX_TIMEFRAMES = ["1H", "4H", "1D"]  # DEX doesn't support 15m, 30m
+    SUPPORTED_CEX_TIMEFRAMES = ("15m", "30m", "1H", "4H", "1D")
+    SUPPORTED_CEX_TIMEFRAMES_SET = frozenset(SUPPORTED_CEX_TIMEFRAMES)
+    SUPPORTED_DEX_TIMEFRAMES = ("1H", "4H", "1D")  # DEX doesn't support 15m, 30m
+    SUPPORTED_DEX_TIMEFRAMES_SET = frozenset(SUPPORTED_DEX_TIMEFRAMES)
 
-    SUPPORTED_CEX_EXCHANGES = [
+    SUPPORTED_CEX_EXCHANGES = (
         "binance-spot",
         "binance-futures",
         "bybit-spot",
         "bybit-futures",
         "hyperliquid-spot",
         "hyperliquid-futures"
-    ]
+    )
+    SUPPORTED_CEX_EXCHANGES_SET = frozenset(SUPPORTED_CEX_EXCHANGES)
 
     @staticmethod
     def validate_cex_params(
@@ -50,13 +56,13 @@ class DivineDipMetric:
         Raises:
             ValueError: If any parameter is invalid
         """
-        if exchange not in DivineDipMetric.SUPPORTED_CEX_EXCHANGES:
+        if exchange not in DivineDipMetric.SUPPORTED_CEX_EXCHANGES_SET:
             raise ValueError(
                 f"Invalid CEX exchange: {exchange}. "
                 f"Supported: {', '.join(DivineDipMetric.SUPPORTED_CEX_EXCHANGES)}"
             )
 
-        if timeframe not in DivineDipMetric.SUPPORTED_CEX_TIMEFRAMES:
+        if timeframe not in DivineDipMetric.SUPPORTED_CEX_TIMEFRAMES_SET:
             raise ValueError(
                 f"Invalid CEX timeframe: {timeframe}. "
                 f"Supported: {', '.join(DivineDipMetric.SUPPORTED_CEX_TIMEFRAMES)}"
@@ -92,7 +98,7 @@ class DivineDipMetric:
         Raises:
             ValueError: If any parameter is invalid
         """
-        if timeframe not in DivineDipMetric.SUPPORTED_DEX_TIMEFRAMES:
+        if timeframe not in DivineDipMetric.SUPPORTED_DEX_TIMEFRAMES_SET:
             raise ValueError(
                 f"Invalid DEX timeframe: {timeframe}. "
                 f"Supported: {', '.join(DivineDipMetric.SUPPORTED_DEX_TIMEFRAMES)}"
@@ -164,9 +170,8 @@ class DivineDipMetric:
                 "signal_percentage": 0.0
             }
 
-        dd_values = [item.get("divine_dip", 0) for item in data]
-        signals = sum(1 for val in dd_values if val == 1)
-        total = len(dd_values)
+        signals = int(np.count_nonzero(field_array(data, "divine_dip") == 1))
+        total = len(data)
 
         return {
             "total_periods": total,
@@ -5,6 +5,9 @@ Implementation of slippage and price equilibrium metrics
 
 from typing import Dict, List
 import logging
+import numpy as np
+
+from ..utils.series import field_array
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +21,11 @@ class JLabsAnalytics:
     - Price Equilibrium: Measures absorption capacity
     """
 
-    SUPPORTED_METRICS = [
+    SUPPORTED_METRICS = (
         "slippage",
         "price_equilibrium"
-    ]
+    )
+    SUPPORTED_METRICS_SET = frozenset(SUPPORTED_METRICS)
 
     # Common timezone offsets (in minutes)
     COMMON_TIMEZONES = {
@@ -58,10 +62,10 @@ class JLabsAnalytics:
         """
         # Validate metric
         metric_lower = metric.lower()
-        if metric_lower not in JLabsMetricV1.SUPPORTED_METRICS:
+        if metric_lower not in JLabsAnalytics.SUPPORTED_METRICS_SET:
             raise ValueError(
                 f"Invalid metric: {metric}. "
-                f"Supported: {', '.join(JLabsMetricV1.SUPPORTED_METRICS)}"
+                f"Supported: {', '.join(JLabsAnalytics.SUPPORTED_METRICS)}"
             )
 
         # Validate symbol
@@ -106,15 +110,15 @@ class JLabsAnalytics:
         Raises:
             ValueError: If timezone name not found
         """
-        if timezone_name not in JLabsMetricV1.COMMON_TIMEZONES:
-            available = ", ".join(JLabsMetricV1.COMMON_TIMEZONES.keys())
+        if timezone_name not in JLabsAnalytics.COMMON_TIMEZONES:
+            available = ", ".join(JLabsAnalytics.COMMON_TIMEZONES.keys())
             raise ValueError(
                 f"Unknown timezone: {timezone_name}. "
                 f"Available: {available}. "
                 "Or provide time_delta directly in minutes."
             )
 
-        return JLabsMetricV1.COMMON_TIMEZONES[timezone_name]
+        return JLabsAnalytics.COMMON_TIMEZONES[timezone_name]
 
     @staticmethod
     def format_response(raw_data: Dict, metric: str) -> Dict:
@@ -177,9 +181,9 @@ class JLabsAnalytics:
                 "std_dev": None
             }
 
-        values = [item.get("value") for item in data if item.get("value") is not None]
+        values = field_array(data, "value")
 
-        if not values:
+        if not values.size:
             return {
                 "total_periods": len(data),
                 "min": None,
@@ -188,13 +192,12 @@ class JLabsAnalytics:
                 "std_dev": None
             }
 
-        min_val = min(values)
-        max_val = max(values)
-        avg_val = sum(values) / len(values)
+        min_val = values.min().item()
+        max_val = values.max().item()
+        avg_val = float(values.mean())
 
-        # Calculate standard deviation
-        variance = sum((x - avg_val) ** 2 for x in values) / len(values)
-        std_dev = variance ** 0.5
+        # Population standard deviation
+        std_dev = float(values.std())
 
         result = {
             "total_periods": len(data),
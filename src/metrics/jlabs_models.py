@@ -5,6 +5,9 @@ Implementation of CARI, DXY Risk, ROSI, and Token Rating from JLabs Digital
 
 from typing import Dict, List, Optional, Literal
 import logging
+import numpy as np
+
+from ..utils.series import field_array
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +24,16 @@ class JLabsModels:
     """
 
     # Supported metrics
-    SUPPORTED_METRICS = [
+    SUPPORTED_METRICS = (
         "cari",
         "dxy_risk",
         "rosi",
         "token_rating"
-    ]
+    )
+    SUPPORTED_METRICS_SET = frozenset(SUPPORTED_METRICS)
 
     # Token Rating sub-metrics
-    TOKEN_RATING_SUB_METRICS = [
+    TOKEN_RATING_SUB_METRICS = (
         "User Score",
         "Demand Shock Score",
         "Price Level Score",
@@ -40,14 +44,32 @@ class JLabsModels:
         "Sentiment Score",
         "Leverage Score",
         "Overall Rating"
-    ]
+    )
+    TOKEN_RATING_SUB_METRICS_SET = frozenset(TOKEN_RATING_SUB_METRICS)
 
     # Timeframe support matrix
     TIMEFRAME_SUPPORT = {
-        "cari": ["1D", "1W", "1M"],
-        "dxy_risk": ["1D", "1W", "1M"],
-        "rosi": ["4H", "1D", "1W", "1M"],
-        "token_rating": ["1D", "1W", "1M"]
+        "cari": ("1D", "1W", "1M"),
+        "dxy_risk": ("1D", "1W", "1M"),
+        "rosi": ("4H", "1D", "1W", "1M"),
+        "token_rating": ("1D", "1W", "1M")
+    }
+    TIMEFRAME_SUPPORT_SETS = {
+        metric: frozenset(timeframes) for metric, timeframes in TIMEFRAME_SUPPORT.items()
+    }
+
+    # Metrics that need a symbol parameter
+    SYMBOL_REQUIRED_METRICS = frozenset({"rosi", "token_rating"})
+
+    # Quote currencies stripped from symbols, longest match first
+    QUOTE_SUFFIXES = ("USDT", "USDC", "USD")
+
+    # Field summarized by calculate_statistics for each metric
+    STATISTIC_FIELDS = {
+        "cari": "value",
+        "dxy_risk": "v",
+        "rosi": "rsi",
+        "token_rating": "value"
     }
 
     @staticmethod
@@ -61,8 +83,9 @@ class JLabsModels:
         Returns:
             Symbol without quote currency suffix
         """
-        for suffix in ["USDT", "USDC", "USD"]:
-            if symbol.upper().endswith(suffix):
+        symbol_upper = symbol.upper()
+        for suffix in JLabsModels.QUOTE_SUFFIXES:
+            if symbol_upper.endswith(suffix):
                 return symbol[:-len(suffix)]
         return symbol
 
@@ -94,18 +117,18 @@ class JLabsModels:
         metric_lower = metric.lower()
 
         # Validate metric
-        if metric_lower not in JLabsModels.SUPPORTED_METRICS:
+        if metric_lower not in JLabsModels.SUPPORTED_METRICS_SET:
             raise ValueError(
                 f"Invalid metric: {metric}. "
                 f"Supported: {', '.join(JLabsModels.SUPPORTED_METRICS)}"
             )
 
         # Validate symbol requirement
-        if metric_lower in ["rosi", "token_rating"] and not symbol:
+        if metric_lower in JLabsModels.SYMBOL_REQUIRED_METRICS and not symbol:
             raise ValueError(f"{metric} requires a symbol parameter")
 
         # Validate timeframe
-        if timeframe not in JLabsModels.TIMEFRAME_SUPPORT[metric_lower]:
+        if timeframe not in JLabsModels.TIMEFRAME_SUPPORT_SETS[metric_lower]:
             raise ValueError(
                 f"Invalid timeframe for {metric}: {timeframe}. "
                 f"Supported: {', '.join(JLabsModels.TIMEFRAME_SUPPORT[metric_lower])}"
@@ -113,10 +136,10 @@ class JLabsModels:
 
         # Validate Token Rating specific parameters
         if metric_lower == "token_rating":
-            if api_version in ["v2", "v3"] and not metric_param:
+            if api_version != "v1" and not metric_param:
                 raise ValueError("Token Rating requires metric_param (sub-metric)")
 
-            if metric_param and metric_param not in JLabsModels.TOKEN_RATING_SUB_METRICS:
+            if metric_param and metric_param not in JLabsModels.TOKEN_RATING_SUB_METRICS_SET:
                 raise ValueError(
                     f"Invalid metric_param: {metric_param}. "
                     f"Supported: {', '.join(JLabsModels.TOKEN_RATING_SUB_METRICS)}"
@@ -305,28 +328,21 @@ class JLabsModels:
             }
 
         # Extract values based on metric type
-        if metric == "cari":
-            values = [item.get("value", 0) for item in data if item.get("value") is not None]
-        elif metric == "dxy_risk":
-            values = [item.get("v", 0) for item in data if item.get("v") is not None]
-        elif metric == "rosi":
-            values = [item.get("rsi", 0) for item in data if item.get("rsi") is not None]
-        elif metric == "token_rating":
-            values = [item.get("value", 0) for item in data if item.get("value") is not None]
-        else:
-            values = []
+        value_field = JLabsModels.STATISTIC_FIELDS.get(metric)
+        values = field_array(data, value_field) if value_field else np.empty(0)
 
-        if not values:
+        if not values.size:
             return {"total_periods": len(data), "analysis": "Insufficient data"}
 
-        min_val = min(values)
-        max_val = max(values)
-        avg_val = sum(values) / len(values)
+        min_val = values.min().item()
+        max_val = values.max().item()
+        avg_val = float(values.mean())
+        last_val = values[-1].item()
 
         # Calculate trend
-        if len(values) >= 2:
-            start_val = values[0]
-            end_val = values[-1]
+        if values.size >= 2:
+            start_val = values[0].item()
+            end_val = last_val
             change = end_val - start_val
             trend = "Increasing" if change > 0 else "Decreasing" if change < 0 else "Stable"
         else:
@@ -342,8 +358,8 @@ class JLabsModels:
 
         # Add metric-specific interpretations
         if metric == "cari":
-            result["current_interpretation"] = JLabsModels.interpret_cari(values[-1]) if values else None
+            result["current_interpretation"] = JLabsModels.interpret_cari(last_val)
         elif metric == "rosi":
-            result["current_interpretation"] = JLabsModels.interpret_rosi(values[-1]) if values else None
+            result["current_interpretation"] = JLabsModels.interpret_rosi(last_val)
 
         return result
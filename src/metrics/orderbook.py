@@ -5,6 +5,9 @@ Implementation of orderbook metrics from the /workbench/orderbook/ endpoint
 
 from typing import Dict, List
 import logging
+import numpy as np
+
+from ..utils.series import field_array
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +21,7 @@ class OrderbookMetric:
     """
 
     # Supported metrics
-    SUPPORTED_METRICS = [
+    SUPPORTED_METRICS = (
         "bid_ask",
         "bid_ask_ratio",
         "bid_ask_delta",
@@ -27,27 +30,30 @@ class OrderbookMetric:
         "bid_increase_decrease",
         "ask_increase_decrease",
         "bid_ask_ratio_inc_dec"
-    ]
+    )
+    SUPPORTED_METRICS_SET = frozenset(SUPPORTED_METRICS)
 
     # Supported exchanges (will be normalized to lowercase)
-    SUPPORTED_EXCHANGES = [
+    SUPPORTED_EXCHANGES = (
         "binance-futures",
         "binance",
         "bybit-futures",
         "bybit",
         "hyperliquid-futures",
         "hyperliquid"
-    ]
+    )
+    SUPPORTED_EXCHANGES_SET = frozenset(SUPPORTED_EXCHANGES)
 
     # Supported timeframes
-    SUPPORTED_TIMEFRAMES = [
+    SUPPORTED_TIMEFRAMES = (
         "1m", "5m", "15m", "30m",
         "1H", "4H",
         "1D", "1W", "1M"
-    ]
+    )
+    SUPPORTED_TIMEFRAMES_SET = frozenset(SUPPORTED_TIMEFRAMES)
 
     # Supported volume ranges
-    SUPPORTED_VOLUME_RANGES = [
+    SUPPORTED_VOLUME_RANGES = (
         # Single depth levels
         "0-1", "0-2.5", "0-5", "0-10", "0-25", "0-100",
         # From 1%
@@ -60,7 +66,16 @@ class OrderbookMetric:
         "10-25", "10-100",
         # From 25%
         "25-100"
-    ]
+    )
+    SUPPORTED_VOLUME_RANGES_SET = frozenset(SUPPORTED_VOLUME_RANGES)
+
+    # Field summarized by calculate_statistics for each single-value metric
+    STATISTIC_FIELDS = {
+        "bid_ask_ratio": "bid_ask_ratio",
+        "bid_ask_delta": "bid_ask_delta",
+        "bid_ask_cvd": "cvd",
+        "total_volume": "total_volume"
+    }
 
     @staticmethod
     def normalize_exchange(exchange: str) -> str:
@@ -106,7 +121,7 @@ class OrderbookMetric:
         """
         # Validate metric
         metric_lower = metric.lower()
-        if metric_lower not in OrderbookMetric.SUPPORTED_METRICS:
+        if metric_lower not in OrderbookMetric.SUPPORTED_METRICS_SET:
             raise ValueError(
                 f"Invalid metric: {metric}. "
                 f"Supported: {', '.join(OrderbookMetric.SUPPORTED_METRICS)}"
@@ -118,14 +133,14 @@ class OrderbookMetric:
 
         # Validate exchange
         exchange_normalized = OrderbookMetric.normalize_exchange(exchange)
-        if exchange_normalized not in OrderbookMetric.SUPPORTED_EXCHANGES:
+        if exchange_normalized not in OrderbookMetric.SUPPORTED_EXCHANGES_SET:
             raise ValueError(
                 f"Invalid exchange: {exchange}. "
                 f"Supported: {', '.join(OrderbookMetric.SUPPORTED_EXCHANGES)}"
             )
 
         # Validate timeframe
-        if timeframe not in OrderbookMetric.SUPPORTED_TIMEFRAMES:
+        if timeframe not in OrderbookMetric.SUPPORTED_TIMEFRAMES_SET:
             raise ValueError(
                 f"Invalid timeframe: {timeframe}. "
                 f"Supported: {', '.join(OrderbookMetric.SUPPORTED_TIMEFRAMES)}"
@@ -133,7 +148,7 @@ class OrderbookMetric:
 
         # Validate volume range
         volume_lower = volume.lower()
-        if volume_lower not in OrderbookMetric.SUPPORTED_VOLUME_RANGES:
+        if volume_lower not in OrderbookMetric.SUPPORTED_VOLUME_RANGES_SET:
             raise ValueError(
                 f"Invalid volume range: {volume}. "
                 f"Supported: {', '.join(OrderbookMetric.SUPPORTED_VOLUME_RANGES)}"
@@ -215,33 +230,21 @@ class OrderbookMetric:
         metric_lower = metric.lower()
 
         # Determine which field to analyze
-        value_field = None
         if metric_lower == "bid_ask":
             # For bid_ask, calculate ratio statistics
-            values = []
-            for item in data:
-                bid = item.get("bid")
-                ask = item.get("ask")
-                if bid is not None and ask is not None and ask != 0:
-                    values.append(bid / ask)
+            bids = np.array([item.get("bid") for item in data], dtype=np.float64)
+            asks = np.array([item.get("ask") for item in data], dtype=np.float64)
+            valid = ~np.isnan(bids) & ~np.isnan(asks) & (asks != 0)
+            values = bids[valid] / asks[valid]
             value_field = "bid_ask_ratio (calculated)"
-        elif metric_lower == "bid_ask_ratio":
-            value_field = "bid_ask_ratio"
-            values = [item.get(value_field) for item in data if item.get(value_field) is not None]
-        elif metric_lower == "bid_ask_delta":
-            value_field = "bid_ask_delta"
-            values = [item.get(value_field) for item in data if item.get(value_field) is not None]
-        elif metric_lower == "bid_ask_cvd":
-            value_field = "cvd"
-            values = [item.get(value_field) for item in data if item.get(value_field) is not None]
-        elif metric_lower == "total_volume":
-            value_field = "total_volume"
-            values = [item.get(value_field) for item in data if item.get(value_field) is not None]
+        elif metric_lower in OrderbookMetric.STATISTIC_FIELDS:
+            value_field = OrderbookMetric.STATISTIC_FIELDS[metric_lower]
+            values = field_array(data, value_field)
         else:
             # For other metrics, return basic count
             return {"total_periods": len(data)}
 
-        if not values:
+        if not values.size:
             return {
                 "total_periods": len(data),
                 "field_analyzed": value_field,
@@ -253,7 +256,7 @@ class OrderbookMetric:
         return {
             "total_periods": len(data),
             "field_analyzed": value_field,
-            "min": round(min(values), 4),
-            "max": round(max(values), 4),
-            "avg": round(sum(values) / len(values), 4)
+            "min": round(values.min().item(), 4),
+            "max": round(values.max().item(), 4),
+            "avg": round(float(values.mean()), 4)
         }
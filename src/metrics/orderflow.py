@@ -5,6 +5,9 @@ Implementation of orderflow metrics from the /workbench/orderflow/ endpoint
 
 from typing import Dict, List
 import logging
+import numpy as np
+
+from ..utils.series import field_array
 
 logger = logging.getLogger(__name__)
 
@@ -18,32 +21,35 @@ class OrderflowMetric:
     """
 
     # Supported metrics
-    SUPPORTED_METRICS = [
+    SUPPORTED_METRICS = (
         "trade_vol",
         "trade_count",
         "tradebook_delta",
         "tradebook_cumulative_delta"
-    ]
+    )
+    SUPPORTED_METRICS_SET = frozenset(SUPPORTED_METRICS)
 
     # Supported exchanges (will be normalized to lowercase)
-    SUPPORTED_EXCHANGES = [
+    SUPPORTED_EXCHANGES = (
         "binance-futures",
         "binance",
         "bybit-futures",
         "bybit",
         "hyperliquid-futures",
         "hyperliquid"
-    ]
+    )
+    SUPPORTED_EXCHANGES_SET = frozenset(SUPPORTED_EXCHANGES)
 
     # Supported timeframes
-    SUPPORTED_TIMEFRAMES = [
+    SUPPORTED_TIMEFRAMES = (
         "1m", "5m", "15m", "30m",
         "1H", "4H",
         "1D", "1W", "1M"
-    ]
+    )
+    SUPPORTED_TIMEFRAMES_SET = frozenset(SUPPORTED_TIMEFRAMES)
 
     # Supported volume ranges (trade size tiers in USD)
-    SUPPORTED_VOLUME_RANGES = [
+    SUPPORTED_VOLUME_RANGES = (
         # From 0
         "0-1k", "0-10k", "0-100k", "0-1m", "0-10m",
         # From 1k
@@ -54,7 +60,8 @@ class OrderflowMetric:
         "100k-1m", "100k-10m",
         # From 1m
         "1m-10m"
-    ]
+    )
+    SUPPORTED_VOLUME_RANGES_SET = frozenset(SUPPORTED_VOLUME_RANGES)
 
     @staticmethod
     def normalize_exchange(exchange: str) -> str:
@@ -100,7 +107,7 @@ class OrderflowMetric:
         """
         # Validate metric
         metric_lower = metric.lower()
-        if metric_lower not in OrderflowMetric.SUPPORTED_METRICS:
+        if metric_lower not in OrderflowMetric.SUPPORTED_METRICS_SET:
             raise ValueError(
                 f"Invalid metric: {metric}. "
                 f"Supported: {', '.join(OrderflowMetric.SUPPORTED_METRICS)}"
@@ -115,14 +122,14 @@ class OrderflowMetric:
 
         # Validate exchange
         exchange_normalized = OrderflowMetric.normalize_exchange(exchange)
-        if exchange_normalized not in OrderflowMetric.SUPPORTED_EXCHANGES:
+        if exchange_normalized not in OrderflowMetric.SUPPORTED_EXCHANGES_SET:
             raise ValueError(
                 f"Invalid exchange: {exchange}. "
                 f"Supported: {', '.join(OrderflowMetric.SUPPORTED_EXCHANGES)}"
             )
 
         # Validate timeframe
-        if timeframe not in OrderflowMetric.SUPPORTED_TIMEFRAMES:
+        if timeframe not in OrderflowMetric.SUPPORTED_TIMEFRAMES_SET:
             raise ValueError(
                 f"Invalid timeframe: {timeframe}. "
                 f"Supported: {', '.join(OrderflowMetric.SUPPORTED_TIMEFRAMES)}"
@@ -130,7 +137,7 @@ class OrderflowMetric:
 
         # Validate volume range
         volume_lower = volume.lower()
-        if volume_lower not in OrderflowMetric.SUPPORTED_VOLUME_RANGES:
+        if volume_lower not in OrderflowMetric.SUPPORTED_VOLUME_RANGES_SET:
             raise ValueError(
                 f"Invalid volume range: {volume}. "
                 f"Supported: {', '.join(OrderflowMetric.SUPPORTED_VOLUME_RANGES)}"
@@ -233,17 +240,17 @@ class OrderflowMetric:
         metric_lower = metric.lower()
 
         # For buy/sell metrics
-        if metric_lower in ["trade_vol", "trade_count"]:
-            buy_values = [item.get("buy", 0) for item in data if item.get("buy") is not None]
-            sell_values = [item.get("sell", 0) for item in data if item.get("sell") is not None]
+        if metric_lower in ("trade_vol", "trade_count"):
+            buy_values = field_array(data, "buy")
+            sell_values = field_array(data, "sell")
 
-            if not buy_values or not sell_values:
+            if not buy_values.size or not sell_values.size:
                 return {"total_periods": len(data), "analysis": "Insufficient data"}
 
-            total_buy = sum(buy_values)
-            total_sell = sum(sell_values)
-            avg_buy = total_buy / len(buy_values)
-            avg_sell = total_sell / len(sell_values)
+            total_buy = buy_values.sum().item()
+            total_sell = sell_values.sum().item()
+            avg_buy = total_buy / buy_values.size
+            avg_sell = total_sell / sell_values.size
 
             buy_sell_ratio = total_buy / total_sell if total_sell > 0 else 0
 
@@ -262,18 +269,18 @@ class OrderflowMetric:
 
         # For delta metrics
         elif metric_lower == "tradebook_delta":
-            delta_values = [item.get("delta", 0) for item in data if item.get("delta") is not None]
+            delta_values = field_array(data, "delta")
 
-            if not delta_values:
+            if not delta_values.size:
                 return {"total_periods": len(data), "analysis": "Insufficient data"}
 
-            positive_periods = sum(1 for d in delta_values if d > 0)
-            negative_periods = sum(1 for d in delta_values if d < 0)
-            neutral_periods = len(delta_values) - positive_periods - negative_periods
+            positive_periods = int(np.count_nonzero(delta_values > 0))
+            negative_periods = int(np.count_nonzero(delta_values < 0))
+            neutral_periods = delta_values.size - positive_periods - negative_periods
 
-            avg_delta = sum(delta_values) / len(delta_values)
-            max_delta = max(delta_values)
-            min_delta = min(delta_values)
+            avg_delta = float(delta_values.mean())
+            max_delta = delta_values.max().item()
+            min_delta = delta_values.min().item()
 
             return {
                 "total_periods": len(data),
@@ -288,13 +295,13 @@ class OrderflowMetric:
 
         # For CVD
         elif metric_lower == "tradebook_cumulative_delta":
-            cvd_values = [item.get("cvd", 0) for item in data if item.get("cvd") is not None]
+            cvd_values = field_array(data, "cvd")
 
-            if len(cvd_values) < 2:
+            if cvd_values.size < 2:
                 return {"total_periods": len(data), "analysis": "Insufficient data for trend"}
 
-            start_cvd = cvd_values[0]
-            end_cvd = cvd_values[-1]
+            start_cvd = cvd_values[0].item()
+            end_cvd = cvd_values[-1].item()
             cvd_change = end_cvd - start_cvd
 
             # Check for trend direction
@@ -0,0 +1,59 @@
+"""
+Panda MCP HTTP Server
+Runs the Starlette app under uvicorn
+"""
+
+import os
+import sys
+import uvicorn
+
+HOST = "0.0.0.0"
+PORT = 8000
+
+
+def get_worker_count() -> int:
+    """
+    Get the number of uvicorn worker processes to run
+
+    Reads WEB_CONCURRENCY and falls back to a single worker. Exchange rate
+    limits are tracked per process (see BaseExchange._throttle), so extra
+    workers are opt-in.
+
+    Returns:
+        Number of worker processes (at least 1)
+    """
+    workers = os.getenv("WEB_CONCURRENCY")
+    if workers:
+        return max(int(workers), 1)
+    return 1
+
+
+def main():
+    """Run the MCP server over streamable HTTP"""
+    # uvloop and httptools are C-accelerated but uvloop has no Windows support
+    fast_io = sys.platform != "win32"
+    workers = get_worker_count()
+
+    if workers > 1:
+        # MCP sessions live in worker memory, so requests spread across
+        # workers can only be served without server-side session state
+        os.environ.setdefault("FASTMCP_STATELESS_HTTP", "true")
+    else:
+        # A single worker can prefetch trading pairs without multiplying the
+        # startup requests (and exchange weight) by the worker count
+        os.environ.setdefault("PANDA_WARMUP", "true")
+
+    uvicorn.run(
+        "src.app:app",
+        host=HOST,
+        port=PORT,
+        workers=workers,
+        loop="uvloop" if fast_io else "asyncio",
+        http="httptools" if fast_io else "h11",
+        log_level="warning",
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
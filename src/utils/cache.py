@@ -0,0 +1,493 @@
+"""
+Response Caching Utilities
+In-process and on-disk TTL caches for tool responses
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+import zstandard
+from .serialization import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+# Root directory of the on-disk response caches, shared by all workers on the host
+CACHE_DIR = Path(os.getenv("PANDA_CACHE_DIR", str(Path.home() / ".panda_mcp_cache")))
+
+# zstd level for on-disk entries; JSON payloads shrink several-fold at low CPU cost
+CACHE_COMPRESSION_LEVEL = 3
+
+# Stampede protection for on-disk entries: expiries are spread over an extra
+# CACHE_TTL_JITTER of the TTL, and reads refresh an entry early with
+# probability exp(-remaining / (ttl * CACHE_EARLY_REFRESH_BETA))
+CACHE_TTL_JITTER = 0.1
+CACHE_EARLY_REFRESH_BETA = 0.05
+
+# Runs early refreshes of sync file_cached functions off the calling thread
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+class TTLCache:
+    """Bounded in-memory cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        Initialize TTL cache
+
+        Args:
+            ttl: Entry time-to-live in seconds
+            maxsize: Maximum number of entries kept (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expiry, value = entry
+        if expiry <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Named caches, so related entries can be invalidated together
+_caches: Dict[str, TTLCache] = {}
+
+
+def get_cache(name: str, ttl: float, maxsize: int = 256) -> TTLCache:
+    """
+    Get or create a named TTL cache
+
+    Args:
+        name: Cache name (e.g., 'funding_history')
+        ttl: Entry time-to-live in seconds, used when the cache is created
+        maxsize: Maximum number of entries (default: 256)
+
+    Returns:
+        The registered TTLCache
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = TTLCache(ttl=ttl, maxsize=maxsize)
+    return cache
+
+
+def invalidate_cache(prefix: Optional[str] = None) -> int:
+    """
+    Clear named caches
+
+    Args:
+        prefix: Only clear caches whose name starts with this prefix
+            (default: clear every cache)
+
+    Returns:
+        Number of caches cleared
+    """
+    cleared = 0
+    for name, cache in _caches.items():
+        if prefix is None or name.startswith(prefix):
+            cache.clear()
+            cleared += 1
+    return cleared
+
+
+async def get_or_fetch(
+    cache: TTLCache,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+    refresh: bool = False
+) -> Any:
+    """
+    Return a cached value, calling fetch() on a miss
+
+    Args:
+        cache: Cache to read and populate
+        key: Cache key
+        fetch: Zero-argument coroutine function producing the value
+        refresh: Skip the cache lookup and store a fresh value (default: False)
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    if not refresh:
+        value = cache.get(key)
+        if value is not None:
+            return value
+    value = await fetch()
+    cache.set(key, value)
+    return value
+
+
+def make_cache_key(func_name: str, arguments: Dict[str, Any]) -> str:
+    """
+    Build a stable cache key from a function name and its arguments
+
+    Args:
+        func_name: Name of the cached function
+        arguments: Bound call arguments
+
+    Returns:
+        Hex digest identifying the call
+    """
+    payload = f"{func_name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _is_error_response(result: Any) -> bool:
+    """Check whether a tool result is one of the error dicts returned by tools"""
+    return isinstance(result, dict) and (
+        "error" in result or result.get("status") == "error"
+    )
+
+
+def cached(ttl: float, maxsize: int = 1024) -> Callable:
+    """
+    Cache a tool's successful responses for a fixed time
+
+    Works with both sync and async functions. Calls are keyed on the function
+    name and its bound arguments (defaults applied), so positional and keyword
+    calls share entries. Error responses are never cached. Every caller gets
+    its own deep copy of the response, so mutating it (nested data
+    included) leaves the cached entry intact. For async
+    functions, concurrent calls that miss the cache with the same key await a
+    single underlying call.
+
+    Args:
+        ttl: Time-to-live for cached responses in seconds
+        maxsize: Maximum number of cached responses (default: 1024)
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+
+    Example:
+        @mcp.tool
+        @cached(ttl=60)
+        async def get_trading_pairs(exchange: str, market: str) -> dict:
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = get_cache(func.__name__, ttl=ttl, maxsize=maxsize)
+        signature = inspect.signature(func)
+
+        def _key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return make_cache_key(func.__name__, bound.arguments)
+
+        if inspect.iscoroutinefunction(func):
+            inflight: Dict[str, asyncio.Task] = {}
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = _key(args, kwargs)
+                result = cache.get(key)
+                if result is not None:
+                    logger.debug(f"Cache hit for {func.__name__}")
+                    return copy.deepcopy(result)
+
+                # Identical concurrent misses share one upstream call. The
+                # call runs as its own task so a cancelled caller does not
+                # cancel it for the others.
+                task = inflight.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(func(*args, **kwargs))
+                    inflight[key] = task
+                    task.add_done_callback(lambda _: inflight.pop(key, None))
+                else:
+                    logger.debug(f"Joining in-flight call for {func.__name__}")
+
+                result = await asyncio.shield(task)
+                if not _is_error_response(result):
+                    cache.set(key, result)
+                return copy.deepcopy(result)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = _key(args, kwargs)
+                result = cache.get(key)
+                if result is not None:
+                    logger.debug(f"Cache hit for {func.__name__}")
+                    return copy.deepcopy(result)
+
+                result = func(*args, **kwargs)
+                if not _is_error_response(result):
+                    cache.set(key, result)
+                return copy.deepcopy(result)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+class FileCache:
+    """On-disk cache of zstd-compressed JSON values whose entries expire after a per-entry TTL"""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize file cache
+
+        Args:
+            directory: Directory holding one .json.zst file per entry (created on first write)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json.zst"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key (a hex digest from make_cache_key)
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        return self.lookup(key)[0]
+
+    def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Get a cached value and whether it should be refreshed ahead of expiry
+
+        Refreshes are requested with a probability that grows as the entry
+        nears expiry (XFetch), so callers sharing an entry rarely refresh it
+        at the same moment.
+
+        Args:
+            key: Cache key (a hex digest from make_cache_key)
+
+        Returns:
+            Tuple of (cached value or None, refresh early)
+        """
+        path = self._path(key)
+        try:
+            entry = loads(zstandard.decompress(path.read_bytes()))
+        except (OSError, ValueError, zstandard.ZstdError):
+            return None, False
+        remaining = entry["expires_at"] - time.time()
+        if remaining <= 0:
+            try:
+                path.unlink()
+            except OSError:
+                pass  # Already removed by another worker
+            return None, False
+        beta = entry.get("ttl", 0) * CACHE_EARLY_REFRESH_BETA
+        refresh = beta > 0 and random.random() < math.exp(-remaining / beta)
+        return entry["value"], refresh
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file. Its expiry is pushed back
+        by up to CACHE_TTL_JITTER of the TTL, so entries written together do
+        not all expire together.
+
+        Args:
+            key: Cache key
+            value: JSON-compatible value to cache
+            ttl: Entry time-to-live in seconds
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            expires_at = time.time() + ttl * (1 + random.uniform(0, CACHE_TTL_JITTER))
+            entry = dumps_bytes({"expires_at": expires_at, "ttl": ttl, "value": value})
+            tmp_path.write_bytes(zstandard.compress(entry, CACHE_COMPRESSION_LEVEL))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        for path in self.directory.glob("*.json.zst"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _log_refresh_error(future) -> None:
+    """Log the failure of a background cache refresh, which has no caller to raise to"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"Background cache refresh failed: {future.exception()}")
+
+
+def file_cached(
+    ttl: Union[float, Callable[[Dict[str, Any]], float]],
+    directory: Optional[Union[str, Path]] = None
+) -> Callable:
+    """
+    Cache a tool's successful responses on disk
+
+    Like cached(), but entries are stored as files so they survive restarts and
+    are shared between worker processes. Error responses are never cached.
+    Concurrent calls in one process that miss with the same key (threads for
+    sync functions, tasks for async ones) share a single underlying call.
+    Entries nearing expiry are occasionally refreshed in the background while
+    the cached value is still returned (see FileCache.lookup), so a popular
+    entry is renewed before callers start missing on it.
+
+    Args:
+        ttl: Time-to-live in seconds, or a function of the bound call arguments
+            returning it (e.g., to match a 'timeframe' argument)
+        directory: Cache directory (default: CACHE_DIR/<function name>)
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+
+    Example:
+        @mcp.tool
+        @file_cached(ttl=lambda args: 3600 if args["timeframe"] == "1H" else 300)
+        def get_orderbook_metric(metric: str, symbol: str, timeframe: str) -> dict:
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = FileCache(directory or CACHE_DIR / func.__name__)
+        signature = inspect.signature(func)
+
+        def _bind(args, kwargs) -> Tuple[str, float]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            entry_ttl = ttl(bound.arguments) if callable(ttl) else ttl
+            return make_cache_key(func.__name__, bound.arguments), entry_ttl
+
+        if inspect.iscoroutinefunction(func):
+            inflight: Dict[str, asyncio.Task] = {}
+
+            async def _fetch(key: str, entry_ttl: float, args, kwargs) -> Any:
+                result = await func(*args, **kwargs)
+                if not _is_error_response(result):
+                    await asyncio.to_thread(cache.set, key, result, entry_ttl)
+                return result
+
+            def _start(key: str, entry_ttl: float, args, kwargs) -> asyncio.Task:
+                # Identical concurrent calls share one upstream call, run as
+                # its own task so a cancelled caller does not cancel the others
+                task = inflight.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(_fetch(key, entry_ttl, args, kwargs))
+                    inflight[key] = task
+                    task.add_done_callback(lambda _: inflight.pop(key, None))
+                else:
+                    logger.debug(f"Joining in-flight call for {func.__name__}")
+                return task
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key, entry_ttl = _bind(args, kwargs)
+                result, refresh = await asyncio.to_thread(cache.lookup, key)
+                if result is not None:
+                    logger.debug(f"Disk cache hit for {func.__name__}")
+                    if refresh and key not in inflight:
+                        logger.debug(f"Refreshing disk cache entry early for {func.__name__}")
+                        _start(key, entry_ttl, args, kwargs).add_done_callback(_log_refresh_error)
+                    return result
+                return await asyncio.shield(_start(key, entry_ttl, args, kwargs))
+        else:
+            inflight_futures: Dict[str, Future] = {}
+            inflight_lock = threading.Lock()
+
+            def _call(key: str, entry_ttl: float, args, kwargs) -> Any:
+                # Threads calling with the same key wait for the first one's call
+                with inflight_lock:
+                    future = inflight_futures.get(key)
+                    owner = future is None
+                    if owner:
+                        future = Future()
+                        inflight_futures[key] = future
+                if not owner:
+                    logger.debug(f"Joining in-flight call for {func.__name__}")
+                    return future.result()
+
+                try:
+                    result = func(*args, **kwargs)
+                    if not _is_error_response(result):
+                        cache.set(key, result, entry_ttl)
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                else:
+                    future.set_result(result)
+                    return result
+                finally:
+                    with inflight_lock:
+                        inflight_futures.pop(key, None)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key, entry_ttl = _bind(args, kwargs)
+                result, refresh = cache.lookup(key)
+                if result is not None:
+                    logger.debug(f"Disk cache hit for {func.__name__}")
+                    if refresh and key not in inflight_futures:
+                        logger.debug(f"Refreshing disk cache entry early for {func.__name__}")
+                        _refresh_executor.submit(
+                            _call, key, entry_ttl, args, kwargs
+                        ).add_done_callback(_log_refresh_error)
+                    return result
+                return _call(key, entry_ttl, args, kwargs)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,117 @@
+"""
+Tool Error Handling
+Converts exceptions raised inside MCP tools into structured error responses
+"""
+
+import functools
+import inspect
+import logging
+from typing import Callable, Dict, Tuple
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# (error label, error_type) per exception family, matched along the MRO
+ERROR_LABELS: Dict[type, Tuple[str, str]] = {
+    ValueError: ("Invalid input", "ValueError"),
+    httpx.HTTPError: ("API request failed", "HTTPError"),
+    NotImplementedError: ("Feature not supported", "NotImplementedError"),
+    TimeoutError: ("API request failed", "TimeoutError"),
+}
+
+
+def describe_error(exc: BaseException) -> Tuple[str, str]:
+    """
+    Get the error label and type name reported for an exception
+
+    Args:
+        exc: Raised exception
+
+    Returns:
+        Tuple of (error label, error_type)
+    """
+    return _describe_type(type(exc))
+
+
+@functools.lru_cache(maxsize=None)
+def _describe_type(exc_type: type) -> Tuple[str, str]:
+    # Exception classes are few and long-lived, so each MRO walk is done once
+    for cls in exc_type.__mro__:
+        labels = ERROR_LABELS.get(cls)
+        if labels is not None:
+            return labels
+    return "Unexpected error", exc_type.__name__
+
+
+def tool_errors(*context: str, status: bool = False) -> Callable:
+    """
+    Return exceptions raised by a tool as an error dictionary
+
+    Works with both sync and async tools and preserves their signature.
+    Exception groups (e.g., from asyncio.TaskGroup) are reported as their
+    first underlying exception.
+
+    Args:
+        *context: Names of tool arguments echoed back in the error response
+        status: Use the export-style shape {"status": "error", ...} instead of
+            {"error": "<label>", ...} (default: False)
+
+    Returns:
+        Decorator for the tool function
+
+    Example:
+        @mcp.tool
+        @tool_errors("exchange", "market")
+        async def get_trading_pairs(exchange: str, market: str) -> dict:
+            ...
+        Error returns: {
+            "error": "Invalid input",
+            "error_type": "ValueError",
+            "message": "Unsupported market type 'options'...",
+            "exchange": "binance",
+            "market": "options"
+        }
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def _error_response(exc: Exception, args, kwargs) -> Dict:
+            while isinstance(exc, BaseExceptionGroup):
+                exc = exc.exceptions[0]
+            label, error_type = describe_error(exc)
+
+            if status:
+                response = {"status": "error"}
+            else:
+                response = {"error": label}
+            response["error_type"] = error_type
+            response["message"] = str(exc)
+            if context:
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                for name in context:
+                    response[name] = arguments.get(name)
+
+            if label == "Unexpected error":
+                logger.exception(f"Unexpected error in {func.__name__}")
+            return response
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    return _error_response(e, args, kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    return _error_response(e, args, kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,17 +1,37 @@
 """
 Data Export Utilities
-Handles exporting cryptocurrency data to CSV and JSON formats
+Handles exporting cryptocurrency data to CSV, JSON, Parquet and Feather formats
 """
 
 import csv
-import json
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, Optional, Union
 from datetime import datetime
+import pandas as pd
+from .serialization import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Output buffer size for text exports, so large files are flushed in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+# Default export directory used by the export tools
+EXPORTS_DIR = Path("exports")
+
+
+@lru_cache(maxsize=4)
+def _timestamp_label(epoch_seconds: int) -> str:
+    """Format a filename timestamp, reusing the string within the same second"""
+    return datetime.fromtimestamp(epoch_seconds).strftime("%Y%m%d_%H%M%S")
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory (and parents) if it does not exist"""
+    # Checked on every export: the directory may be removed while the server runs
+    directory.mkdir(parents=True, exist_ok=True)
+
 
 class DataExporter:
     """Utility class for exporting cryptocurrency data to various formats"""
@@ -52,7 +72,7 @@ class DataExporter:
 
             # Create parent directories if requested
             if create_dirs:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_dir(output_path.parent)
 
             # Determine record count
             if isinstance(data, list):
@@ -62,12 +82,8 @@ class DataExporter:
             else:
                 raise ValueError(f"Unsupported data type: {type(data)}")
 
-            # Write JSON file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+            # Encode in one pass with orjson and write the bytes in a single call
+            output_path.write_bytes(dumps_bytes(data, pretty=pretty))
 
             # Get file size
             file_size = output_path.stat().st_size
@@ -90,6 +106,55 @@ class DataExporter:
                 "error_type": type(e).__name__
             }
 
+    @staticmethod
+    def export_raw_json(
+        body: bytes,
+        file_path: str,
+        create_dirs: bool = True
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Write an already-encoded JSON document (e.g., an exchange response) as is
+
+        Args:
+            body: JSON bytes
+            file_path: Output file path (relative or absolute)
+            create_dirs: Create parent directories if they don't exist (default: True)
+
+        Returns:
+            Dictionary with export details (status, file_path, file_size_bytes,
+            format, or error details)
+
+        Example:
+            body = await exchange.fetch_klines_raw('BTCUSDT', '1h')
+            result = DataExporter.export_raw_json(body, 'exports/btc_klines.json')
+        """
+        try:
+            # Convert Path object for easier manipulation
+            output_path = Path(file_path)
+
+            # Create parent directories if requested
+            if create_dirs:
+                _ensure_dir(output_path.parent)
+
+            output_path.write_bytes(body)
+
+            logger.info(f"Exported raw response to {output_path} ({len(body)} bytes)")
+
+            return {
+                "status": "success",
+                "file_path": str(output_path.absolute()),
+                "file_size_bytes": len(body),
+                "format": "json"
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to export raw JSON: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+
     @staticmethod
     def export_to_csv(
         data: List[Dict],
@@ -134,7 +199,7 @@ class DataExporter:
 
             # Create parent directories if requested
             if create_dirs:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_dir(output_path.parent)
 
             # Auto-detect fieldnames from first record if not provided
             if fieldnames is None:
@@ -142,8 +207,9 @@ class DataExporter:
                     raise ValueError("First element must be a dictionary to auto-detect fieldnames")
                 fieldnames = list(data[0].keys())
 
-            # Write CSV file
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            # Write CSV file; values are written exactly as given, and rows with
+            # fields outside fieldnames raise ValueError
+            with open(output_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(data)
@@ -170,6 +236,157 @@ class DataExporter:
                 "error_type": type(e).__name__
             }
 
+    @staticmethod
+    def export_to_parquet(
+        data: List[Dict],
+        file_path: str,
+        compression: str = "snappy",
+        create_dirs: bool = True,
+        float32: bool = False
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Export data to a Parquet file (requires the optional pyarrow dependency)
+
+        Args:
+            data: List of dictionaries to export
+            file_path: Output file path (relative or absolute)
+            compression: Parquet compression codec (default: 'snappy')
+            create_dirs: Create parent directories if they don't exist (default: True)
+            float32: Store float columns as float32, halving their size at ~7
+                significant digits of precision (default: False)
+
+        Returns:
+            Dictionary with export details (same keys as export_to_csv)
+
+        Example:
+            result = DataExporter.export_to_parquet(
+                klines_data,
+                'exports/btc_klines.parquet'
+            )
+        """
+        return DataExporter._export_binary(
+            data, file_path, "parquet", create_dirs, float32,
+            lambda df, path: df.to_parquet(path, engine="pyarrow", compression=compression, index=False)
+        )
+
+    @staticmethod
+    def export_to_feather(
+        data: List[Dict],
+        file_path: str,
+        compression: str = "lz4",
+        create_dirs: bool = True,
+        float32: bool = False
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Export data to a Feather (Arrow IPC) file (requires the optional pyarrow dependency)
+
+        Args:
+            data: List of dictionaries to export
+            file_path: Output file path (relative or absolute)
+            compression: Feather compression codec (default: 'lz4')
+            create_dirs: Create parent directories if they don't exist (default: True)
+            float32: Store float columns as float32, halving their size at ~7
+                significant digits of precision (default: False)
+
+        Returns:
+            Dictionary with export details (same keys as export_to_csv)
+
+        Example:
+            result = DataExporter.export_to_feather(
+                klines_data,
+                'exports/btc_klines.feather'
+            )
+        """
+        return DataExporter._export_binary(
+            data, file_path, "feather", create_dirs, float32,
+            lambda df, path: df.to_feather(path, compression=compression)
+        )
+
+    @staticmethod
+    def _export_binary(data, file_path, format_name, create_dirs, float32, write) -> Dict[str, Union[str, int]]:
+        """Shared implementation for the Arrow-based binary formats"""
+        try:
+            # Validate input
+            if not isinstance(data, list):
+                raise ValueError(f"Data must be a list of dictionaries for {format_name} export")
+
+            if not data:
+                raise ValueError(f"Cannot export empty data to {format_name}")
+
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    f"{format_name} export requires pyarrow. "
+                    f"Install it with: pip install 'panda-mcp[arrow]'"
+                )
+
+            # Convert Path object for easier manipulation
+            output_path = Path(file_path)
+
+            # Create parent directories if requested
+            if create_dirs:
+                _ensure_dir(output_path.parent)
+
+            df = pd.DataFrame.from_records(data)
+            if float32:
+                float_cols = df.select_dtypes(include='float64').columns
+                df[float_cols] = df[float_cols].astype('float32')
+            write(df, output_path)
+
+            # Get file size
+            file_size = output_path.stat().st_size
+
+            logger.info(f"Exported {len(data)} records to {output_path} ({file_size} bytes)")
+
+            return {
+                "status": "success",
+                "file_path": str(output_path.absolute()),
+                "records_exported": len(data),
+                "file_size_bytes": file_size,
+                "columns": list(df.columns),
+                "format": format_name
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to export to {format_name}: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "error_type": type(e).__name__
+            }
+
+    @staticmethod
+    def export(
+        data: Union[List[Dict], Dict],
+        file_path: str,
+        format: str = "json",
+        **options
+    ) -> Dict[str, Union[str, int]]:
+        """
+        Export data in the given format
+
+        Args:
+            data: Data to export
+            file_path: Output file path
+            format: 'json', 'csv', 'parquet' or 'feather' (default: 'json')
+            **options: Extra keyword arguments for the format's exporter
+                (e.g., float32=True for parquet/feather)
+
+        Returns:
+            Dictionary with export details
+
+        Raises:
+            ValueError: If format is not supported
+        """
+        exporter = EXPORTERS.get(format)
+        if exporter is None:
+            raise ValueError(
+                f"Unsupported export format '{format}'. "
+                f"Supported formats: {', '.join(EXPORTERS)}"
+            )
+        return exporter(data, file_path, **options)
+
     @staticmethod
     def generate_filename(
         exchange: str,
@@ -203,8 +420,7 @@ class DataExporter:
             parts.append(symbol)
 
         if include_timestamp:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            parts.append(timestamp)
+            parts.append(_timestamp_label(int(time.time())))
 
         filename = "_".join(parts) + f".{extension}"
         return filename
@@ -241,8 +457,21 @@ class DataExporter:
             if not isinstance(data, list):
                 raise ValueError("CSV export requires data to be a list of dictionaries")
             return DataExporter.export_to_csv(data, file_path, create_dirs=create_dirs)
+        elif extension == '.parquet':
+            return DataExporter.export_to_parquet(data, file_path, create_dirs=create_dirs)
+        elif extension == '.feather':
+            return DataExporter.export_to_feather(data, file_path, create_dirs=create_dirs)
         else:
             raise ValueError(
                 f"Unsupported file extension '{extension}'. "
-                f"Supported formats: .json, .csv"
+                f"Supported formats: .json, .csv, .parquet, .feather"
             )
+
+
+# Export function per format, resolved once instead of per call
+EXPORTERS: Dict[str, Callable[..., Dict[str, Union[str, int]]]] = {
+    "json": DataExporter.export_to_json,
+    "csv": DataExporter.export_to_csv,
+    "parquet": DataExporter.export_to_parquet,
+    "feather": DataExporter.export_to_feather,
+}
@@ -10,6 +10,11 @@ from typing import List, Dict, Optional, Union, Literal
 
 logger = logging.getLogger(__name__)
 
+NUMERIC_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Indicator names accepted by calculate_multiple_indicators that map to the same calculation
+INDICATOR_ALIASES = {'RSI': 'RSI_14'}
+
 
 class TechnicalIndicators:
     """
@@ -34,8 +39,6 @@ class TechnicalIndicators:
         if not klines:
             raise ValueError("Klines data is empty")
 
-        df = pd.DataFrame(klines)
-
         # Standardize column names for pandas-ta
         # Map common exchange formats to standard OHLCV format
         column_mapping = {
@@ -47,15 +50,18 @@ class TechnicalIndicators:
             'volume': 'volume'
         }
 
-        # Select and rename relevant columns
-        available_cols = [col for col in column_mapping.keys() if col in df.columns]
-        df = df[available_cols].rename(columns=column_mapping)
+        # Build the frame from the relevant columns only, skipping fields the
+        # indicators never read (quote volume, trade counts, ...)
+        available_cols = [col for col in column_mapping.keys() if col in klines[0]]
+        df = pd.DataFrame.from_records(klines, columns=available_cols).rename(columns=column_mapping)
 
-        # Convert numeric columns
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Convert numeric columns; exchanges already emit floats, so this is a
+        # no-copy cast in the common case and a coercing parse otherwise
+        numeric_cols = [col for col in NUMERIC_COLUMNS if col in df.columns]
+        try:
+            df[numeric_cols] = df[numeric_cols].astype('float64')
+        except (TypeError, ValueError):
+            df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
 
         # Convert timestamp to datetime and set as index for pandas-ta
         if 'timestamp' in df.columns:
@@ -480,42 +486,61 @@ class TechnicalIndicators:
             )
         """
         df = TechnicalIndicators._klines_to_dataframe(klines)
+        close, high, low, volume = df['close'], df['high'], df['low'], df['volume']
 
+        # Each entry computes from the shared OHLCV columns built above; aliases
+        # that describe the same calculation share one key so it runs once
         indicator_map = {
-            'RSI': lambda: ta.rsi(df['close'], length=14),
-            'RSI_14': lambda: ta.rsi(df['close'], length=14),
-            'MACD': lambda: ta.macd(df['close']),
-            'SMA_20': lambda: ta.sma(df['close'], length=20),
-            'SMA_50': lambda: ta.sma(df['close'], length=50),
-            'SMA_200': lambda: ta.sma(df['close'], length=200),
-            'EMA_20': lambda: ta.ema(df['close'], length=20),
-            'EMA_50': lambda: ta.ema(df['close'], length=50),
-            'EMA_200': lambda: ta.ema(df['close'], length=200),
-            'BB': lambda: ta.bbands(df['close'], length=20, std=2),
-            'ATR': lambda: ta.atr(df['high'], df['low'], df['close'], length=14),
-            'STOCH': lambda: ta.stoch(df['high'], df['low'], df['close']),
-            'OBV': lambda: ta.obv(df['close'], df['volume']),
-            'VWAP': lambda: ta.vwap(df['high'], df['low'], df['close'], df['volume']),
-            'MFI': lambda: ta.mfi(df['high'], df['low'], df['close'], df['volume'], length=14),
-            'CCI': lambda: ta.cci(df['high'], df['low'], df['close'], length=20),
+            'RSI_14': lambda: ta.rsi(close, length=14),
+            'MACD': lambda: ta.macd(close),
+            'SMA_20': lambda: ta.sma(close, length=20),
+            'SMA_50': lambda: ta.sma(close, length=50),
+            'SMA_200': lambda: ta.sma(close, length=200),
+            'EMA_20': lambda: ta.ema(close, length=20),
+            'EMA_50': lambda: ta.ema(close, length=50),
+            'EMA_200': lambda: ta.ema(close, length=200),
+            'BB': lambda: ta.bbands(close, length=20, std=2),
+            'ATR': lambda: ta.atr(high, low, close, length=14),
+            'STOCH': lambda: ta.stoch(high, low, close),
+            'OBV': lambda: ta.obv(close, volume),
+            'VWAP': lambda: ta.vwap(high, low, close, volume),
+            'MFI': lambda: ta.mfi(high, low, close, volume, length=14),
+            'CCI': lambda: ta.cci(high, low, close, length=20),
         }
 
+        computed: Dict[str, Optional[Union[pd.Series, pd.DataFrame]]] = {}
+        columns = []
         calculated = []
         for indicator in indicators:
             indicator_upper = indicator.upper()
-            if indicator_upper in indicator_map:
+            key = INDICATOR_ALIASES.get(indicator_upper, indicator_upper)
+            if key not in indicator_map:
+                logger.warning(f"Unknown indicator: {indicator}")
+                continue
+            if indicator_upper in calculated:
+                continue
+
+            if key not in computed:
                 try:
-                    result = indicator_map[indicator_upper]()
-                    if result is not None:
-                        if isinstance(result, pd.DataFrame):
-                            df = pd.concat([df, result], axis=1)
-                        else:
-                            df[indicator_upper] = result
-                        calculated.append(indicator_upper)
+                    computed[key] = indicator_map[key]()
                 except Exception as e:
                     logger.warning(f"Failed to calculate {indicator}: {str(e)}")
-            else:
-                logger.warning(f"Unknown indicator: {indicator}")
+                    computed[key] = None
+                    continue
+                if isinstance(computed[key], pd.DataFrame):
+                    columns.append(computed[key])
+
+            result = computed[key]
+            if result is None:
+                continue
+            if isinstance(result, pd.Series):
+                # Aliases reuse the computed series under their own column name
+                columns.append(result.rename(indicator_upper))
+            calculated.append(indicator_upper)
+
+        # Join all indicator columns in one concat instead of one per indicator
+        if columns:
+            df = pd.concat([df, *columns], axis=1)
 
         return {
             "indicators_calculated": calculated,
@@ -0,0 +1,116 @@
+"""
+Out-of-band Payload Storage
+Moves oversized tool result fields out of MCP responses and serves them over HTTP
+"""
+
+import logging
+import os
+import re
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+from .serialization import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+# Public base URL of this server (e.g., 'https://mcp.example.com'). Offloading
+# is opt-in: without it every field stays inline, since a client cannot fetch
+# a relative URL and nothing serves payloads over stdio
+PUBLIC_URL = os.getenv("PANDA_PUBLIC_URL", "").rstrip("/")
+# Fields larger than this (serialized bytes) are replaced by a download URL; <= 0 disables
+INLINE_LIMIT_BYTES = int(os.getenv("PANDA_INLINE_LIMIT_BYTES", str(32 * 1024)))
+OFFLOAD_ENABLED = bool(PUBLIC_URL) and INLINE_LIMIT_BYTES > 0
+# How long stored payloads remain downloadable, in seconds
+PAYLOAD_TTL = int(os.getenv("PANDA_PAYLOAD_TTL", "3600"))
+# Directory shared by all workers on the host
+PAYLOAD_DIR = Path(
+    os.getenv("PANDA_PAYLOAD_DIR", str(Path(tempfile.gettempdir()) / "panda-mcp-payloads"))
+)
+PAYLOAD_ROUTE = "/payloads"
+
+if "PANDA_INLINE_LIMIT_BYTES" in os.environ and not PUBLIC_URL:
+    logger.warning("PANDA_INLINE_LIMIT_BYTES is set but PANDA_PUBLIC_URL is not; large fields stay inline")
+
+_PAYLOAD_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _purge_expired() -> None:
+    """Delete stored payloads older than PAYLOAD_TTL"""
+    cutoff = time.time() - PAYLOAD_TTL
+    for path in PAYLOAD_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Already removed by another worker
+
+
+def offload_large_field(result: Dict, field: str) -> Dict:
+    """
+    Replace a large field of a tool result with a download URL
+
+    If offloading is disabled (PANDA_PUBLIC_URL unset) or the serialized
+    field is at most INLINE_LIMIT_BYTES, the result is returned unchanged.
+    Otherwise the field is written to PAYLOAD_DIR and replaced by absolute
+    '<field>_url' and '<field>_bytes' entries.
+
+    Args:
+        result: Tool result dictionary
+        field: Name of the field holding the bulk data (e.g., 'klines')
+
+    Returns:
+        Result dictionary with the field inlined or referenced
+
+    Example:
+        offload_large_field({"count": 1500, "klines": [...]}, "klines")
+        Returns: {
+            "count": 1500,
+            "klines_url": "https://mcp.example.com/payloads/3f2a...",
+            "klines_bytes": 412345
+        }
+    """
+    if not OFFLOAD_ENABLED:
+        return result
+
+    body = dumps_bytes(result[field])
+    if len(body) <= INLINE_LIMIT_BYTES:
+        return result
+
+    try:
+        PAYLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        _purge_expired()
+        payload_id = uuid.uuid4().hex
+        (PAYLOAD_DIR / f"{payload_id}.json").write_bytes(body)
+    except OSError as e:
+        logger.warning(f"Could not store payload for '{field}', returning inline: {e}")
+        return result
+
+    offloaded = {key: value for key, value in result.items() if key != field}
+    offloaded[f"{field}_url"] = f"{PUBLIC_URL}{PAYLOAD_ROUTE}/{payload_id}"
+    offloaded[f"{field}_bytes"] = len(body)
+    offloaded["expires_in_seconds"] = PAYLOAD_TTL
+    return offloaded
+
+
+def get_payload_path(payload_id: str) -> Optional[Path]:
+    """
+    Locate a stored payload
+
+    Args:
+        payload_id: Identifier from a '<field>_url' reference
+
+    Returns:
+        Path of the JSON file, or None if the payload is unknown or expired
+    """
+    if not _PAYLOAD_ID.match(payload_id):
+        return None
+
+    path = PAYLOAD_DIR / f"{payload_id}.json"
+    try:
+        if path.stat().st_mtime < time.time() - PAYLOAD_TTL:
+            return None
+    except OSError:
+        return None
+    return path
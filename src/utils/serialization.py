@@ -0,0 +1,56 @@
+"""
+JSON Serialization Utilities
+Fast orjson-based encoding for tool responses and payloads
+"""
+
+from typing import Any
+import orjson
+
+# numpy values (from indicator calculations) and non-string dict keys are
+# encoded natively instead of failing
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes
+
+    Args:
+        data: JSON-compatible data (dicts, lists, numbers, numpy values, ...)
+        pretty: Indent with two spaces and end with a newline (default: False)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    option = ORJSON_OPTIONS
+    if pretty:
+        option |= orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+    return orjson.dumps(data, default=str, option=option)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    return orjson.loads(data)
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize data to a compact JSON string
+
+    Used as the FastMCP tool serializer for the text content of tool results.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        JSON string
+    """
+    return dumps_bytes(data).decode()
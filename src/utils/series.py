@@ -0,0 +1,54 @@
+"""
+Time Series Helpers
+Converts metric data points into NumPy arrays and columnar layouts
+"""
+
+from typing import Dict, List
+import numpy as np
+
+
+def field_array(data: List[Dict], field: str) -> np.ndarray:
+    """
+    Collect one numeric field of a list of data points into an array
+
+    Points where the field is missing or None are skipped. Integer fields
+    keep an integer dtype so sums and extremes stay ints; anything else
+    is stored as float64.
+
+    Args:
+        data: List of data point dictionaries
+        field: Field name (e.g., 'value', 'buy')
+
+    Returns:
+        1-D int64 or float64 array of the field's values, in data order
+
+    Example:
+        field_array([{"value": 1.5}, {"value": None}, {"value": 2.0}], "value")
+        Returns: array([1.5, 2. ])
+    """
+    values = [value for value in (item.get(field) for item in data) if value is not None]
+    array = np.array(values) if values else np.empty(0)
+    if array.dtype.kind not in "if":
+        array = array.astype(np.float64)
+    return array
+
+
+def to_columns(data: List[Dict]) -> Dict[str, List]:
+    """
+    Transpose a list of data points into one list per field
+
+    Fields are taken from the first point; points missing a field get None.
+
+    Args:
+        data: List of data point dictionaries sharing the same fields
+
+    Returns:
+        Dictionary mapping each field name to its values, in data order
+
+    Example:
+        to_columns([{"t": "2024-01-01", "cvd": 1.5}, {"t": "2024-01-02", "cvd": 2.0}])
+        Returns: {"t": ["2024-01-01", "2024-01-02"], "cvd": [1.5, 2.0]}
+    """
+    if not data:
+        return {}
+    return {field: [item.get(field) for item in data] for field in data[0]}
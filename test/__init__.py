@@ -1,17 +1,3 @@
 """
-Panda MCP - Model Context Protocol Server for Cryptocurrency Exchange Data
-
-A modular MCP server for fetching trading pairs from cryptocurrency exchanges.
+Tests for Panda MCP
 """
-
-__version__ = "0.1.0"
-__author__ = "Zahoor"
-__license__ = "MIT"
-
-from .core.base_exchange import BaseExchange
-from .core.exchange_factory import ExchangeFactory
-
-__all__ = [
-    "BaseExchange",
-    "ExchangeFactory",
-]
@@ -0,0 +1,130 @@
+"""
+Tests for BinanceExchange.fetch_klines_paged page splitting
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("numpy")
+
+from src.exchanges.binance import BinanceExchange, MAX_KLINE_PAGES
+
+MINUTE_MS = 60_000
+SPOT_PAGE_SPAN = 1000 * MINUTE_MS
+# 2023-11-14 22:13 UTC; ranges start away from 0 so dropped bounds are caught
+START = 1_700_000_000_000
+
+
+class RecordingBinance(BinanceExchange):
+    """Binance adapter whose fetch_klines records its pages instead of calling the API"""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    async def fetch_klines(self, symbol, interval, market="spot", start_time=None,
+                           end_time=None, limit=500, timezone="0"):
+        self.pages.append((start_time, end_time, limit))
+        return [{"open_time": start_time, "close_time": end_time}]
+
+
+class RecordingUrlBinance(BinanceExchange):
+    """Binance adapter that records request URLs and returns an empty response"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    async def _fetch_with_retry(self, url, *args, **kwargs):
+        self.urls.append(url)
+        return []
+
+
+def fetch(exchange, start_time, end_time, market="spot"):
+    return asyncio.run(
+        exchange.fetch_klines_paged("BTCUSDT", "1m", start_time, end_time, market=market)
+    )
+
+
+def test_exact_multiple_range_uses_whole_pages():
+    exchange = RecordingBinance()
+    klines = fetch(exchange, START, START + 3 * SPOT_PAGE_SPAN - 1)
+
+    assert exchange.pages == [
+        (START, START + SPOT_PAGE_SPAN - 1, 1000),
+        (START + SPOT_PAGE_SPAN, START + 2 * SPOT_PAGE_SPAN - 1, 1000),
+        (START + 2 * SPOT_PAGE_SPAN, START + 3 * SPOT_PAGE_SPAN - 1, 1000),
+    ]
+    # Pages are joined in time order
+    assert [kline["open_time"] for kline in klines] == [
+        START, START + SPOT_PAGE_SPAN, START + 2 * SPOT_PAGE_SPAN
+    ]
+
+
+def test_range_starting_at_epoch_zero():
+    exchange = RecordingBinance()
+    fetch(exchange, 0, 2 * SPOT_PAGE_SPAN - 1)
+
+    assert exchange.pages == [
+        (0, SPOT_PAGE_SPAN - 1, 1000),
+        (SPOT_PAGE_SPAN, 2 * SPOT_PAGE_SPAN - 1, 1000),
+    ]
+
+
+def test_inclusive_end_on_page_boundary_adds_a_page():
+    exchange = RecordingBinance()
+    fetch(exchange, START, START + 3 * SPOT_PAGE_SPAN)
+
+    assert len(exchange.pages) == 4
+    assert exchange.pages[-1] == (START + 3 * SPOT_PAGE_SPAN, START + 3 * SPOT_PAGE_SPAN, 1000)
+
+
+def test_partial_last_page_is_clipped_to_end_time():
+    exchange = RecordingBinance()
+    fetch(exchange, START, START + SPOT_PAGE_SPAN + 10 * MINUTE_MS)
+
+    assert exchange.pages == [
+        (START, START + SPOT_PAGE_SPAN - 1, 1000),
+        (START + SPOT_PAGE_SPAN, START + SPOT_PAGE_SPAN + 10 * MINUTE_MS, 1000),
+    ]
+
+
+def test_futures_pages_use_futures_limit():
+    exchange = RecordingBinance()
+    futures_span = 1500 * MINUTE_MS
+    fetch(exchange, START, START + 2 * futures_span - 1, market="futures")
+
+    assert exchange.pages == [
+        (START, START + futures_span - 1, 1500),
+        (START + futures_span, START + 2 * futures_span - 1, 1500),
+    ]
+
+
+def test_too_many_pages_is_rejected_before_fetching():
+    exchange = RecordingBinance()
+    with pytest.raises(ValueError):
+        fetch(exchange, START, START + MAX_KLINE_PAGES * SPOT_PAGE_SPAN)
+    assert exchange.pages == []
+
+
+@pytest.mark.parametrize("start_time, end_time", [(-1, SPOT_PAGE_SPAN), (10, 10), (10, 5)])
+def test_invalid_range_is_rejected(start_time, end_time):
+    exchange = RecordingBinance()
+    with pytest.raises(ValueError):
+        fetch(exchange, start_time, end_time)
+    assert exchange.pages == []
+
+
+def test_zero_time_bounds_are_sent():
+    exchange = RecordingUrlBinance()
+
+    async def run():
+        await exchange.fetch_klines("BTCUSDT", "1m", start_time=0, end_time=SPOT_PAGE_SPAN - 1)
+        await exchange.fetch_funding_rate_history("BTCUSDT", start_time=0, end_time=1)
+        await exchange.fetch_open_interest_history("BTCUSDT", "1h", start_time=0, end_time=1)
+
+    asyncio.run(run())
+    assert all("startTime=0" in url for url in exchange.urls)
+    assert all("endTime=" in url for url in exchange.urls)
@@ -0,0 +1,191 @@
+"""
+Tests for the in-memory and on-disk response caches
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("zstandard")
+pytest.importorskip("orjson")
+
+from src.utils import cache as cache_module
+from src.utils.cache import FileCache, TTLCache, cached, file_cached
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = TTLCache(ttl=10)
+    cache.set("key", {"value": 1})
+
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 9.9)
+    assert cache.get("key") == {"value": 1}
+
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 10)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_cached_returns_copies():
+    @cached(ttl=60)
+    def get_pairs(market: str) -> dict:
+        return {"market": market, "count": 1, "pairs": [{"pair": "BTCUSDT"}]}
+
+    first = get_pairs("spot")
+    first["count"] = 0
+    first["pairs"][0]["pair"] = "ETHUSDT"
+    first["pairs"].append({"pair": "SOLUSDT"})
+    assert get_pairs("spot") == {"market": "spot", "count": 1, "pairs": [{"pair": "BTCUSDT"}]}
+
+
+def test_file_cache_round_trip(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.set("key", {"pairs": ["BTCUSDT"]}, ttl=60)
+    assert cache.get("key") == {"pairs": ["BTCUSDT"]}
+    assert cache.get("missing") is None
+
+
+def test_file_cache_expires_after_jittered_ttl(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    cache = FileCache(tmp_path)
+    cache.set("key", "value", ttl=100)
+
+    # Jitter only ever extends the TTL
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 99)
+    assert cache.get("key") == "value"
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 100 * (1 + cache_module.CACHE_TTL_JITTER) + 1)
+    assert cache.get("key") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_file_cache_early_refresh(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    monkeypatch.setattr(cache_module.random, "uniform", lambda a, b: 0)
+    cache = FileCache(tmp_path)
+    cache.set("key", "value", ttl=100)
+
+    # A fresh entry is practically never refreshed early
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.01)
+    assert cache.lookup("key") == ("value", False)
+
+    # Close to expiry the refresh probability approaches 1
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 99.9)
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.9)
+    assert cache.lookup("key") == ("value", True)
+
+
+def test_file_cache_set_replaces_atomically(tmp_path, monkeypatch):
+    cache = FileCache(tmp_path)
+    cache.set("key", "old", ttl=60)
+    cache.set("key", "new", ttl=60)
+    assert cache.get("key") == "new"
+    assert [path.name for path in tmp_path.iterdir()] == ["key.json.zst"]
+
+    # A failed rename leaves the previous entry intact and no temporary file
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache_module.os, "replace", failing_replace)
+    cache.set("key", "newer", ttl=60)
+    monkeypatch.undo()
+    assert cache.get("key") == "new"
+    assert [path.name for path in tmp_path.iterdir()] == ["key.json.zst"]
+
+
+def test_file_cached_async_singleflight(tmp_path):
+    calls = 0
+
+    @file_cached(ttl=60, directory=tmp_path)
+    async def get_metric(symbol: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"symbol": symbol, "value": 1}
+
+    async def run():
+        return await asyncio.gather(*(get_metric("BTCUSDT") for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(result == {"symbol": "BTCUSDT", "value": 1} for result in results)
+
+    # Later calls are served from disk
+    assert asyncio.run(get_metric("BTCUSDT")) == {"symbol": "BTCUSDT", "value": 1}
+    assert calls == 1
+
+
+def test_file_cached_sync_singleflight(tmp_path):
+    calls = 0
+    lock = threading.Lock()
+    barrier = threading.Barrier(8)
+
+    @file_cached(ttl=60, directory=tmp_path)
+    def get_metric(symbol: str) -> dict:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.2)
+        return {"symbol": symbol, "value": 1}
+
+    def call():
+        barrier.wait()
+        return get_metric("BTCUSDT")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: call(), range(8)))
+
+    assert calls == 1
+    assert all(result == {"symbol": "BTCUSDT", "value": 1} for result in results)
+
+
+def test_file_cached_skips_error_responses(tmp_path):
+    calls = 0
+
+    @file_cached(ttl=60, directory=tmp_path)
+    def get_metric(symbol: str) -> dict:
+        nonlocal calls
+        calls += 1
+        return {"error": "upstream unavailable"}
+
+    get_metric("BTCUSDT")
+    get_metric("BTCUSDT")
+    assert calls == 2
+    assert not os.listdir(tmp_path)
+
+
+def test_file_cached_refreshes_early_in_background(tmp_path, monkeypatch):
+    calls = 0
+
+    @file_cached(ttl=60, directory=tmp_path)
+    async def get_metric(symbol: str) -> dict:
+        nonlocal calls
+        calls += 1
+        return {"symbol": symbol, "version": calls}
+
+    async def run():
+        first = await get_metric("BTCUSDT")
+        # Force the next hit to request an early refresh
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0)
+        second = await get_metric("BTCUSDT")
+        monkeypatch.undo()
+        # Wait for the background refresh to replace the entry
+        for _ in range(100):
+            latest = await get_metric("BTCUSDT")
+            if latest["version"] == 2:
+                break
+            await asyncio.sleep(0.01)
+        return first, second, latest
+
+    first, second, latest = asyncio.run(run())
+    # The cached value is still served while the refresh runs
+    assert first == second == {"symbol": "BTCUSDT", "version": 1}
+    assert latest == {"symbol": "BTCUSDT", "version": 2}
+    assert calls == 2
@@ -0,0 +1,44 @@
+"""
+Tests for the merge used by compare_exchange_pairs
+"""
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from src.app import _split_sorted
+
+
+def test_split_sorted_partitions_both_lists():
+    spot = ["ADAUSDT", "BTCUSDT", "DOGEUSDT", "ETHUSDT"]
+    futures = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    assert _split_sorted(spot, futures) == (
+        ["ADAUSDT", "DOGEUSDT"],
+        ["SOLUSDT"],
+        ["BTCUSDT", "ETHUSDT"],
+    )
+
+
+@pytest.mark.parametrize("first, second", [
+    ([], []),
+    (["BTCUSDT"], []),
+    ([], ["BTCUSDT"]),
+    (["BTCUSDT", "ETHUSDT"], ["BTCUSDT", "ETHUSDT"]),
+    (["AAAUSDT", "BBBUSDT"], ["CCCUSDT", "DDDUSDT"]),
+    (["CCCUSDT", "DDDUSDT"], ["AAAUSDT", "BBBUSDT"]),
+])
+def test_split_sorted_matches_set_operations(first, second):
+    only_in_first, only_in_second, in_both = _split_sorted(first, second)
+
+    assert only_in_first == sorted(set(first) - set(second))
+    assert only_in_second == sorted(set(second) - set(first))
+    assert in_both == sorted(set(first) & set(second))
+
+
+def test_market_timeout_covers_the_retry_policy():
+    from src import app
+    from src.core.http_client import DEFAULT_TIMEOUT, RETRY_ATTEMPTS, RETRY_MAX_WAIT
+
+    # wait_for must not cancel a fetch that is still inside its retry budget
+    assert app.MARKET_FETCH_TIMEOUT >= RETRY_ATTEMPTS * DEFAULT_TIMEOUT + (RETRY_ATTEMPTS - 1) * RETRY_MAX_WAIT
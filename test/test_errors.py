@@ -0,0 +1,69 @@
+"""
+Tests for the tool error responses
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.utils.errors import tool_errors
+
+
+@tool_errors("exchange", "market")
+async def get_pairs(exchange: str, market: str = "spot") -> dict:
+    async with asyncio.TaskGroup() as group:
+        group.create_task(fail(ValueError(f"Unsupported market type '{market}'")))
+    return {}
+
+
+async def fail(exc):
+    raise exc
+
+
+def test_exception_group_reports_first_exception():
+    result = asyncio.run(get_pairs("binance", "options"))
+
+    assert result == {
+        "error": "Invalid input",
+        "error_type": "ValueError",
+        "message": "Unsupported market type 'options'",
+        "exchange": "binance",
+        "market": "options",
+    }
+
+
+def test_context_uses_argument_defaults():
+    result = asyncio.run(get_pairs("binance"))
+
+    assert result["market"] == "spot"
+
+
+@pytest.mark.parametrize("exc, label, error_type", [
+    (httpx.ConnectError("refused"), "API request failed", "HTTPError"),
+    (TimeoutError("slow"), "API request failed", "TimeoutError"),
+    (NotImplementedError("no"), "Feature not supported", "NotImplementedError"),
+    (KeyError("x"), "Unexpected error", "KeyError"),
+])
+def test_exceptions_map_to_labels(exc, label, error_type):
+    @tool_errors()
+    def tool():
+        raise exc
+
+    result = tool()
+    assert result["error"] == label
+    assert result["error_type"] == error_type
+
+
+def test_status_shape():
+    @tool_errors("symbol", status=True)
+    async def export(symbol: str) -> dict:
+        raise ExceptionGroup("fetch", [TimeoutError("slow")])
+
+    assert asyncio.run(export("BTCUSDT")) == {
+        "status": "error",
+        "error_type": "TimeoutError",
+        "message": "slow",
+        "symbol": "BTCUSDT",
+    }
@@ -0,0 +1,57 @@
+"""
+Tests for DataExporter's binary formats and the export tools
+"""
+
+import asyncio
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from src.utils.export import DataExporter
+
+KLINES = [
+    {"open_time": 1, "open": 29000.5, "close": 29100.25, "volume": 12.5},
+    {"open_time": 2, "open": 29100.25, "close": 29050.0, "volume": 8.0},
+]
+
+
+@pytest.mark.parametrize("format, read", [
+    ("parquet", pd.read_parquet),
+    ("feather", pd.read_feather),
+])
+def test_binary_export_round_trip(tmp_path, format, read):
+    path = tmp_path / "nested" / f"klines.{format}"
+    result = DataExporter.export(KLINES, str(path), format)
+
+    assert result["status"] == "success"
+    assert result["format"] == format
+    assert result["records_exported"] == 2
+    assert result["file_size_bytes"] == path.stat().st_size
+    assert read(path).to_dict("records") == KLINES
+
+
+@pytest.mark.parametrize("format, read", [
+    ("parquet", pd.read_parquet),
+    ("feather", pd.read_feather),
+])
+def test_binary_export_float32(tmp_path, format, read):
+    path = tmp_path / f"klines.{format}"
+    DataExporter.export(KLINES, str(path), format, float32=True)
+
+    df = read(path)
+    assert str(df["open"].dtype) == "float32"
+    assert str(df["open_time"].dtype) == "int64"
+
+
+def test_binary_export_rejects_empty_data(tmp_path):
+    result = DataExporter.export([], str(tmp_path / "klines.parquet"), "parquet")
+
+    assert result["status"] == "error"
+    assert result["error_type"] == "ValueError"
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        DataExporter.export(KLINES, str(tmp_path / "klines.xlsx"), "xlsx")
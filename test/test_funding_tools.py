@@ -0,0 +1,59 @@
+"""
+Tests for the funding rate MCP tools
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from src import app
+from src.core.exchange_factory import ExchangeFactory
+from src.exchanges.binance import BinanceExchange
+
+FUNDING_RATES = [
+    {"symbol": "BTCUSDT", "fundingRate": "0.00010000", "fundingTime": 1, "markPrice": "29000"},
+    {"symbol": "ETHUSDT", "fundingRate": "0.00020000", "fundingTime": 1, "markPrice": "730"},
+    {"symbol": "BTCUSDT", "fundingRate": "-0.00005000", "fundingTime": 2, "markPrice": "29100"},
+]
+
+
+class FundingBinance(BinanceExchange):
+    """Binance adapter that answers every request with FUNDING_RATES"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    async def _fetch_with_retry(self, url, *args, **kwargs):
+        self.urls.append(url)
+        return FUNDING_RATES
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    exchange = FundingBinance()
+    monkeypatch.setattr(ExchangeFactory, "get", lambda name: exchange)
+    return exchange
+
+
+def test_funding_history_by_symbol_uses_one_request(exchange):
+    result = asyncio.run(app.get_funding_rate_history.fn("binance", limit=1000, by_symbol=True))
+
+    assert len(exchange.urls) == 1
+    assert "symbol=" not in exchange.urls[0]
+    assert result["count"] == 3
+    assert "funding_rates" not in result
+    by_symbol = result["funding_rates_by_symbol"]
+    assert list(by_symbol) == ["BTCUSDT", "ETHUSDT"]
+    assert [record["funding_time"] for record in by_symbol["BTCUSDT"]] == [1, 2]
+    assert by_symbol["ETHUSDT"][0]["funding_rate"] == 0.0002
+
+
+def test_funding_history_default_shape(exchange):
+    result = asyncio.run(app.get_funding_rate_history.fn("binance", "BTCUSDT"))
+
+    assert "symbol=BTCUSDT" in exchange.urls[0]
+    assert result["count"] == 3
+    assert len(result["funding_rates"]) == 3
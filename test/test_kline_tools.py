@@ -0,0 +1,115 @@
+"""
+Tests for the kline MCP tools
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from src import app
+from src.core.exchange_factory import ExchangeFactory
+from test.test_binance_paging import RecordingBinance, SPOT_PAGE_SPAN, START
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    exchange = RecordingBinance()
+    monkeypatch.setattr(ExchangeFactory, "get", lambda name: exchange)
+    return exchange
+
+
+def test_get_klines_paginate_fetches_whole_range(exchange):
+    result = asyncio.run(app.get_klines.fn(
+        "binance", "BTCUSDT", "1m",
+        start_time=START, end_time=START + 2 * SPOT_PAGE_SPAN - 1, paginate=True
+    ))
+
+    assert result["count"] == 2
+    assert exchange.pages == [
+        (START, START + SPOT_PAGE_SPAN - 1, 1000),
+        (START + SPOT_PAGE_SPAN, START + 2 * SPOT_PAGE_SPAN - 1, 1000),
+    ]
+
+
+def test_get_klines_paginate_requires_both_times(exchange):
+    result = asyncio.run(app.get_klines.fn("binance", "BTCUSDT", "1m", start_time=START, paginate=True))
+
+    assert result["error"] == "Invalid input"
+    assert exchange.pages == []
+
+
+def test_get_klines_without_paginate_makes_one_request(exchange):
+    asyncio.run(app.get_klines.fn("binance", "BTCUSDT", "1m", start_time=0, limit=10))
+
+    assert exchange.pages == [(0, None, 10)]
+
+
+def test_export_klines_paginate_returns_every_page(exchange):
+    result = asyncio.run(app.export_klines.fn(
+        "binance", "BTCUSDT", "1m",
+        start_time=START, end_time=START + SPOT_PAGE_SPAN, paginate=True, return_data=True
+    ))
+
+    assert result["status"] == "success"
+    assert result["records_exported"] == 2
+    assert len(exchange.pages) == 2
+
+
+class BatchBinance(RecordingBinance):
+    """RecordingBinance whose fetches fail for symbols starting with 'BAD'"""
+
+    async def fetch_klines(self, symbol, interval, **kwargs):
+        if symbol.startswith("BAD"):
+            raise ValueError(f"Invalid symbol: {symbol}")
+        return [{"open_time": 1, "close": 1.5}]
+
+
+@pytest.fixture
+def batch_exchange(monkeypatch):
+    exchange = BatchBinance()
+    monkeypatch.setattr(ExchangeFactory, "get", lambda name: exchange)
+    return exchange
+
+
+def test_export_return_data_carries_rows(exchange):
+    result = asyncio.run(app.export_klines.fn("binance", "BTCUSDT", "1m", limit=1, return_data=True))
+
+    assert result["status"] == "success"
+    assert result["data"] == [{"open_time": None, "close_time": None}]
+    assert "file_path" not in result
+
+
+def test_export_klines_batch_tags_rows_and_reports_failures(batch_exchange):
+    result = asyncio.run(app.export_klines_batch.fn(
+        "binance", ["BTCUSDT", "BADUSDT", "ETHUSDT"], "1h", return_data=True
+    ))
+
+    assert result["status"] == "success"
+    assert result["symbols"] == ["BTCUSDT", "ETHUSDT"]
+    assert [row["symbol"] for row in result["data"]] == ["BTCUSDT", "ETHUSDT"]
+    assert result["failed_symbols"] == {"BADUSDT": "Invalid symbol: BADUSDT"}
+
+
+def test_export_klines_batch_fails_when_every_symbol_fails(batch_exchange):
+    result = asyncio.run(app.export_klines_batch.fn("binance", ["BADUSDT"], "1h", return_data=True))
+
+    assert result["status"] == "error"
+    assert result["error_type"] == "ValueError"
+    assert result["symbols"] == ["BADUSDT"]
+
+
+def test_export_klines_batch_writes_parquet(batch_exchange, tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "batch.parquet"
+
+    result = asyncio.run(app.export_klines_batch.fn(
+        "binance", ["BTCUSDT", "ETHUSDT"], "1h", file_path=str(path), format="parquet", float32=True
+    ))
+
+    assert result["status"] == "success"
+    df = pd.read_parquet(path)
+    assert list(df["symbol"]) == ["BTCUSDT", "ETHUSDT"]
+    assert str(df["close"].dtype) == "float32"
@@ -0,0 +1,101 @@
+"""
+Tests for the panda-backend-api metric tools
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastmcp")
+
+from src import app
+
+DIVINE_DIP_DATA = {"data": [{"t": "2024-01-01T00:00:00", "dd": 1}, {"t": "2024-01-02T00:00:00", "dd": 0}]}
+
+CEX_ARGUMENTS = {
+    "exchange_type": "CEX",
+    "exchange": "binance-futures",
+    "token": "BTCUSDT",
+    "timeframe": "1D",
+    "start_epoch": 1704067200,
+    "end_epoch": 1704153600,
+}
+
+
+class FakeMetricsClient:
+    """Metrics client that answers every divine_dip request with DIVINE_DIP_DATA"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_metric(self, **params):
+        self.calls.append(params)
+        return DIVINE_DIP_DATA
+
+
+@pytest.fixture
+def metrics_client(tmp_path, monkeypatch):
+    client = FakeMetricsClient()
+    monkeypatch.setattr(app, "get_metrics_client", lambda base_url=None, api_key=None: client)
+    # Keep the tools' on-disk response caches out of the user's cache directory
+    for tool in (app.get_divine_dip_metric, app.get_orderbook_metric, app.get_jlabs_metric,
+                 app.get_orderflow_metric, app.get_jlabs_model):
+        monkeypatch.setattr(tool.fn.cache, "directory", tmp_path / tool.name)
+    return client
+
+
+def test_columnar_layout_has_one_list_per_field(metrics_client):
+    rows = asyncio.run(app.get_divine_dip_metric.fn(**CEX_ARGUMENTS))
+    columns = asyncio.run(app.get_divine_dip_metric.fn(**CEX_ARGUMENTS, columnar=True))
+
+    assert "layout" not in rows
+    assert columns["layout"] == "columnar"
+    assert columns["data"] == {
+        "timestamp": ["2024-01-01T00:00:00", "2024-01-02T00:00:00"],
+        "divine_dip": [1, 0],
+    }
+    # Statistics and metadata do not depend on the layout
+    assert columns["statistics"] == rows["statistics"]
+    assert columns["count"] == rows["count"] == 2
+
+
+def test_columnar_is_ignored_for_raw_responses(metrics_client):
+    result = asyncio.run(app.get_divine_dip_metric.fn(**CEX_ARGUMENTS, raw=True, columnar=True))
+
+    assert result == {"metric": "divine_dip", "layout": "api_native", "data": DIVINE_DIP_DATA}
+
+
+def test_metrics_batch_runs_each_request(metrics_client):
+    result = asyncio.run(app.get_metrics_batch.fn([
+        {"tool": "get_divine_dip_metric", "arguments": CEX_ARGUMENTS},
+        {"tool": "get_divine_dip_metric", "arguments": {**CEX_ARGUMENTS, "columnar": True}},
+    ]))
+
+    assert result["count"] == 2
+    rows, columns = result["results"]
+    assert rows["count"] == 2
+    assert columns["layout"] == "columnar"
+
+
+def test_metrics_batch_reports_bad_requests_in_place(metrics_client):
+    result = asyncio.run(app.get_metrics_batch.fn([
+        {"tool": "get_price"},
+        {"tool": "get_divine_dip_metric", "arguments": ["BTCUSDT"]},
+        {"tool": "get_divine_dip_metric", "arguments": CEX_ARGUMENTS},
+    ]))
+
+    unknown, bad_arguments, valid = result["results"]
+    assert unknown["error"] == "Invalid input"
+    assert unknown["tool"] == "get_price"
+    assert bad_arguments["error"] == "Invalid input"
+    assert bad_arguments["tool"] == "get_divine_dip_metric"
+    assert valid["count"] == 2
+    assert len(metrics_client.calls) == 1
+
+
+def test_metrics_batch_limits_its_size(metrics_client):
+    requests = [{"tool": "get_divine_dip_metric", "arguments": CEX_ARGUMENTS}] * (app.MAX_METRIC_BATCH + 1)
+    result = asyncio.run(app.get_metrics_batch.fn(requests))
+
+    assert result["error"] == "Invalid input"
+    assert metrics_client.calls == []
@@ -0,0 +1,77 @@
+"""
+Tests for ETag revalidation in the metrics API client
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("dotenv")
+pytest.importorskip("zstandard")
+
+from src.metrics import api_client
+from src.metrics.api_client import PandaMetricsClient
+from src.utils.cache import FileCache
+
+BASE_URL = "https://metrics.example.com"
+
+
+@pytest.fixture
+def etag_cache(tmp_path, monkeypatch):
+    cache = FileCache(tmp_path)
+    monkeypatch.setattr(api_client, "ETAG_CACHE", cache)
+    return tmp_path
+
+
+def make_client(api_key, seen):
+    """Client whose backend answers 304 when If-None-Match matches, and echoes the API key"""
+    def handler(request):
+        seen.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"owner": request.headers.get("x-api-key")}, headers={"ETag": '"v1"'})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return PandaMetricsClient(base_url=BASE_URL, api_key=api_key, http_client=http_client)
+
+
+def test_not_modified_reuses_stored_body(etag_cache):
+    seen = []
+    client = make_client("key-a", seen)
+
+    async def run():
+        first = await client.fetch_jlabs_proprietary_v2("CARI", "BTCUSDT", "1D")
+        second = await client.fetch_jlabs_proprietary_v2("CARI", "BTCUSDT", "1D")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"owner": "key-a"}
+    assert "if-none-match" not in seen[0].headers
+    assert seen[1].headers["if-none-match"] == '"v1"'
+
+
+def test_stored_bodies_are_not_shared_between_api_keys(etag_cache):
+    seen = []
+    client_a = make_client("key-a", seen)
+    client_b = make_client("key-b", seen)
+
+    async def run():
+        await client_a.fetch_jlabs_proprietary_v2("CARI", "BTCUSDT", "1D")
+        return await client_b.fetch_jlabs_proprietary_v2("CARI", "BTCUSDT", "1D")
+
+    assert asyncio.run(run()) == {"owner": "key-b"}
+    assert "if-none-match" not in seen[1].headers
+
+
+def test_time_window_requests_are_not_stored(etag_cache):
+    seen = []
+    client = make_client("key-a", seen)
+
+    async def run():
+        for _ in range(2):
+            await client.fetch_cex_metric("divine_dip", "binance-futures", "BTCUSDT", "1D", 1, 2)
+
+    asyncio.run(run())
+    assert all("if-none-match" not in request.headers for request in seen)
+    assert not list(etag_cache.iterdir())
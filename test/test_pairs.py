@@ -0,0 +1,54 @@
+"""
+Tests for the exchange pair cache
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("tenacity")
+
+from src.exchanges.binance import BinanceExchange
+
+
+class StaticPairsBinance(BinanceExchange):
+    """Binance adapter that serves a fixed symbol list and counts fetches"""
+
+    def __init__(self):
+        super().__init__()
+        self.fetches = 0
+
+    async def fetch_symbols_retry(self, url, exchange):
+        self.fetches += 1
+        return [{"symbol": "BTC", "pair": "BTCUSDT"}], [{"symbol": "HIFI", "pair": "HIFIUSDT"}]
+
+
+@pytest.fixture
+def exchange():
+    exchange = StaticPairsBinance()
+    exchange._pairs_cache.clear()
+    return exchange
+
+
+def test_pairs_are_tagged_with_exchange_and_status(exchange):
+    result = asyncio.run(exchange.fetch_all_pairs("spot"))
+
+    assert result == {
+        "active": [{"symbol": "BTC", "pair": "BTCUSDT", "exchange": "binance-spot", "is_active": True}],
+        "inactive": [{"symbol": "HIFI", "pair": "HIFIUSDT", "exchange": "binance-spot", "is_active": False}],
+    }
+
+
+def test_callers_cannot_modify_cached_pairs(exchange):
+    async def run():
+        first = await exchange.fetch_all_pairs("spot")
+        first["active"][0]["pair"] = "CHANGED"
+        first["active"].clear()
+        first["inactive"].append({"pair": "EXTRA"})
+        return await exchange.fetch_all_pairs("spot")
+
+    second = asyncio.run(run())
+    assert exchange.fetches == 1
+    assert [pair["pair"] for pair in second["active"]] == ["BTCUSDT"]
+    assert [pair["pair"] for pair in second["inactive"]] == ["HIFIUSDT"]
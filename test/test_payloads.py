@@ -0,0 +1,91 @@
+"""
+Tests for out-of-band payload storage
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+pytest.importorskip("orjson")
+
+from src.utils import payloads
+from src.utils.payloads import get_payload_path, offload_large_field
+from src.utils.serialization import loads
+
+PUBLIC_URL = "https://mcp.example.com"
+
+
+@pytest.fixture
+def offload(tmp_path, monkeypatch):
+    monkeypatch.setattr(payloads, "PUBLIC_URL", PUBLIC_URL)
+    monkeypatch.setattr(payloads, "INLINE_LIMIT_BYTES", 64)
+    monkeypatch.setattr(payloads, "OFFLOAD_ENABLED", True)
+    monkeypatch.setattr(payloads, "PAYLOAD_DIR", tmp_path)
+    return tmp_path
+
+
+def test_disabled_offload_keeps_result(monkeypatch):
+    monkeypatch.setattr(payloads, "OFFLOAD_ENABLED", False)
+    result = {"count": 100, "klines": list(range(100))}
+
+    assert offload_large_field(result, "klines") is result
+
+
+def test_small_field_stays_inline(offload):
+    result = {"count": 1, "klines": [1]}
+
+    assert offload_large_field(result, "klines") is result
+    assert not list(offload.iterdir())
+
+
+def test_large_field_is_stored_and_served(offload):
+    klines = list(range(100))
+    result = offload_large_field({"count": 100, "klines": klines}, "klines")
+
+    assert "klines" not in result
+    assert result["count"] == 100
+    assert result["klines_url"].startswith(f"{PUBLIC_URL}{payloads.PAYLOAD_ROUTE}/")
+    assert result["expires_in_seconds"] == payloads.PAYLOAD_TTL
+
+    payload_id = result["klines_url"].rsplit("/", 1)[1]
+    path = get_payload_path(payload_id)
+    assert path is not None
+    assert path.stat().st_size == result["klines_bytes"]
+    assert loads(path.read_bytes()) == klines
+
+
+def test_unknown_or_invalid_ids_are_not_served(offload):
+    assert get_payload_path("0" * 32) is None
+    # Ids are never turned into paths outside PAYLOAD_DIR
+    assert get_payload_path("../../etc/passwd") is None
+
+
+def test_expired_payloads_are_not_served(offload):
+    result = offload_large_field({"klines": list(range(100))}, "klines")
+    payload_id = result["klines_url"].rsplit("/", 1)[1]
+    path = offload / f"{payload_id}.json"
+    expired = time.time() - payloads.PAYLOAD_TTL - 1
+    os.utime(path, (expired, expired))
+
+    assert get_payload_path(payload_id) is None
+
+
+def test_payload_route(offload):
+    pytest.importorskip("fastmcp")
+    from src import app
+
+    class Request:
+        def __init__(self, payload_id):
+            self.path_params = {"payload_id": payload_id}
+
+    result = offload_large_field({"klines": list(range(100))}, "klines")
+    payload_id = result["klines_url"].rsplit("/", 1)[1]
+
+    found = asyncio.run(app.get_payload(Request(payload_id)))
+    assert found.status_code == 200
+    assert found.path == offload / f"{payload_id}.json"
+
+    missing = asyncio.run(app.get_payload(Request("0" * 32)))
+    assert missing.status_code == 404
@@ -0,0 +1,114 @@
+"""
+Tests for client-side exchange rate limiting
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("tenacity")
+
+from src.core import base_exchange, rate_limiter
+from src.core.rate_limiter import RateLimiter
+from src.exchanges.binance import BinanceExchange
+
+FUTURES_URL = "https://fapi.binance.com/fapi/v1/ticker/price"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that asyncio.sleep in the limiter advances"""
+    now = [1000.0]
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", sleep)
+    return now, sleeps
+
+
+def test_full_bucket_does_not_wait(clock):
+    now, sleeps = clock
+    limiter = RateLimiter(capacity=10, refill_per_sec=1)
+
+    asyncio.run(limiter.acquire(10))
+    assert sleeps == []
+
+
+def test_empty_bucket_waits_for_refill(clock):
+    now, sleeps = clock
+    limiter = RateLimiter(capacity=10, refill_per_sec=2)
+
+    async def run():
+        await limiter.acquire(10)
+        await limiter.acquire(4)
+
+    asyncio.run(run())
+    assert sleeps == [2.0]
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    now, sleeps = clock
+    limiter = RateLimiter(capacity=10, refill_per_sec=1)
+
+    async def run():
+        await limiter.acquire(10)
+        now[0] += 60
+        await limiter.acquire(10)
+
+    asyncio.run(run())
+    assert sleeps == []
+    # Sixty idle seconds restore the capacity, not sixty tokens
+    asyncio.run(limiter.acquire(1))
+    assert sleeps == [1.0]
+
+
+def test_weight_is_capped_at_capacity(clock):
+    now, sleeps = clock
+    limiter = RateLimiter(capacity=5, refill_per_sec=1)
+
+    asyncio.run(limiter.acquire(50))
+    assert sleeps == []
+
+
+def test_sync_used_only_lowers_tokens(clock):
+    now, sleeps = clock
+    limiter = RateLimiter(capacity=10, refill_per_sec=1)
+
+    limiter.sync_used(8)
+    assert limiter._tokens == 2
+    # A lower count from the server never hands tokens back
+    limiter.sync_used(0)
+    assert limiter._tokens == 2
+    limiter.sync_used(50)
+    assert limiter._tokens == 0
+
+
+@pytest.fixture
+def limiters(monkeypatch):
+    limiters = {}
+    monkeypatch.setattr(base_exchange, "_rate_limiters", limiters)
+    return limiters
+
+
+def test_each_worker_budgets_for_its_share(limiters, monkeypatch):
+    monkeypatch.setattr(base_exchange, "RATE_LIMIT_WORKERS", 4)
+    exchange = BinanceExchange()
+    asyncio.run(exchange._throttle(FUTURES_URL))
+
+    limiter = limiters["fapi.binance.com"]
+    assert limiter.capacity == 600
+    assert limiter.refill_per_sec == 10
+
+    # The used-weight header covers the whole IP; this worker is charged a quarter
+    response = httpx.Response(
+        200,
+        headers={"x-mbx-used-weight-1m": "2000"},
+        request=httpx.Request("GET", FUTURES_URL),
+    )
+    exchange._sync_rate_limit(response)
+    assert limiter._tokens <= 100